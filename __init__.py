@@ -6,31 +6,54 @@ import os
 import site
 import sys
 import typing
+from pathlib import Path
 
 from .basic_game import BasicGame
 from .basic_game_ini import BasicIniGame
+from .basic_game_proxy import BasicGameProxy
+from .plugin_registry import load_registry, registry_entry
 
 site.addsitedir(os.path.join(os.path.dirname(__file__), "lib"))
 
 
-BasicGame.setup()
-
-
 def createPlugins():
+    # Launchers are only scanned when a game plugin needs them, but nearly all the
+    # plugins look for their game in Steam first, so start that one right away:
+    BasicGame.prefetch(["steam"])
+
     # List of game class from python:
     game_plugins: typing.List[BasicGame] = []
 
     # We are going to list all game plugins:
     curpath = os.path.abspath(os.path.dirname(__file__))
 
-    # List all the .ini files:
-    for file in glob.glob(os.path.join(curpath, "games", "*.ini")):
-        game_plugins.append(BasicIniGame(file))
+    # List all the .ini files (parsed definitions are cached):
+    game_plugins.extend(BasicIniGame.load_all(Path(curpath, "games")))
+
+    # Python plugins listed in the (up-to-date) registry are proxied, the others
+    # are imported right away:
+    registry = load_registry(__package__ or __name__)
 
     # List all the python plugins:
     for file in glob.glob(os.path.join(curpath, "games", "*.py")):
         module_p = os.path.relpath(file, os.path.join(curpath, "games"))
-        if module_p == "__init__.py":
+        if module_p.startswith("_"):
+            continue
+
+        entry = registry_entry(registry, Path(file))
+        if entry is not None:
+            for plugin in entry["plugins"]:
+                try:
+                    game_plugins.append(
+                        BasicGameProxy.create(
+                            module_p[:-3], plugin["class"], plugin["attributes"]
+                        )
+                    )
+                except Exception as e:
+                    print(
+                        "Failed to instantiate {}: {}".format(plugin["class"], e),
+                        file=sys.stderr,
+                    )
             continue
 
         # Import the module:
@@ -0,0 +1,198 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+import sys
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+if TYPE_CHECKING:
+    import sqlite3
+
+_T = TypeVar("_T")
+
+# Errors of the parsers meaning that a save is invalid, rather than unreadable for
+# now (e.g. an OSError while the game is writing the save):
+FORMAT_ERRORS: tuple[type[Exception], ...] = (ValueError, KeyError, struct.error)
+
+
+class SaveGameCache:
+    """
+    Persistent cache of the fields extracted from save files, stored in a SQLite
+    database.
+
+    Entries are keyed by the path of the parsed file and the parser, and are only
+    valid while the size and modification time of the file do not change. Saves
+    that fail to parse with a format error (see `FORMAT_ERRORS`) are stored as
+    negative entries, so they are not parsed again on every refresh; other errors
+    are not cached.
+
+    Entries are written as soon as they are parsed, since saves can be parsed
+    lazily (see `LazyBasicGameSaveGame`), the database using write-ahead logging to
+    keep the writes cheap.
+
+    Parsed values go through JSON, so parsers must return JSON-compatible values
+    (e.g. lists instead of tuples), and cached values are returned as decoded from
+    JSON.
+    If sqlite3 is not available or the database cannot be opened, files are
+    simply parsed every time.
+    """
+
+    # Bump this when the format of the cache or of any parsed value changes:
+    VERSION = 1
+
+    def __init__(self, path: Path, namespace: str):
+        """
+        Args:
+            path: Path to the database, created if needed.
+            namespace: Namespace of the entries, e.g. the short name of the game.
+        """
+        self.path = path
+        self.namespace = namespace
+
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._opened = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        # Open the database on first use:
+        if self._opened:
+            return self._connection
+        self._opened = True
+        try:
+            import sqlite3
+        except ImportError:  # the embedded Python may be built without sqlite3
+            return None
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+            (version,) = connection.execute("PRAGMA user_version").fetchone()
+            if version != SaveGameCache.VERSION:
+                connection.execute("DROP TABLE IF EXISTS saves")
+                connection.execute(f"PRAGMA user_version = {SaveGameCache.VERSION}")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS saves ("
+                " namespace TEXT NOT NULL,"
+                " path TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " mtime INTEGER NOT NULL,"
+                " fields TEXT,"
+                " PRIMARY KEY (namespace, path))"
+            )
+            connection.commit()
+            self._connection = connection
+        except (sqlite3.Error, OSError) as e:
+            print(f'Failed to open save cache "{self.path}": {e!r}', file=sys.stderr)
+        return self._connection
+
+    def get(
+        self,
+        filepath: Path,
+        parse: Callable[[Path], _T],
+        stat: os.stat_result | None = None,
+    ) -> _T | None:
+        """
+        Parse the given save file, or retrieve the cached fields if the file did
+        not change since it was last parsed.
+
+        Args:
+            filepath: Path of the file to parse.
+            parse: Function extracting the fields from the file. The function is
+                part of the key, so different parsers can be used on the same file.
+            stat (optional): Stat result of the file, if already known.
+
+        Returns:
+            The fields returned by the parser, or None if the file could not be
+            parsed (now or, for format errors, when it was cached).
+        """
+        namespace = f"{self.namespace}/{parse.__module__}.{parse.__qualname__}"
+        key = filepath.as_posix()
+        try:
+            if stat is None:
+                stat = filepath.stat()
+        except OSError as e:
+            print(f"Failed to parse save {filepath}: {e!r}", file=sys.stderr)
+            return None
+
+        with self._lock:
+            connection = self._connect()
+            if connection is not None:
+                row = connection.execute(
+                    "SELECT fields FROM saves"
+                    " WHERE namespace = ? AND path = ? AND size = ? AND mtime = ?",
+                    (namespace, key, stat.st_size, stat.st_mtime_ns),
+                ).fetchone()
+                if row is not None:
+                    if row[0] is None:
+                        return None
+                    cached: _T = json.loads(row[0])
+                    return cached
+
+        fields: _T | None
+        content: str | None
+        try:
+            fields = parse(filepath)
+            content = json.dumps(fields)
+        except FORMAT_ERRORS as e:
+            print(f"Failed to parse save {filepath}: {e!r}", file=sys.stderr)
+            fields = content = None
+        except Exception as e:
+            # Not cached, the save may be readable next time:
+            print(f"Failed to parse save {filepath}: {e!r}", file=sys.stderr)
+            return None
+
+        if connection is not None:
+            self._write(
+                "INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?)",
+                [(namespace, key, stat.st_size, stat.st_mtime_ns, content)],
+            )
+        return fields
+
+    def prune(self, paths: Iterable[Path]):
+        """
+        Drop the entries of the namespace whose file is not in the given paths,
+        e.g. after listing all the saves.
+
+        Args:
+            paths: Paths of the files whose entries should be kept.
+        """
+        keys = {path.as_posix() for path in paths}
+        prefix = f"{self.namespace}/"
+        with self._lock:
+            connection = self._connect()
+            if connection is None:
+                return
+            stale = [
+                (namespace, path)
+                for namespace, path in connection.execute(
+                    "SELECT namespace, path FROM saves"
+                    " WHERE substr(namespace, 1, ?) = ?",
+                    (len(prefix), prefix),
+                )
+                if path not in keys
+            ]
+        if stale:
+            self._write("DELETE FROM saves WHERE namespace = ? AND path = ?", stale)
+
+    def _write(self, statement: str, rows: list[tuple[Any, ...]]):
+        import sqlite3
+
+        with self._lock:
+            if self._connection is None:
+                return
+            try:
+                self._connection.executemany(statement, rows)
+                self._connection.commit()
+            except sqlite3.Error as e:
+                print(
+                    f'Failed to write save cache "{self.path}": {e!r}',
+                    file=sys.stderr,
+                )
@@ -1,16 +1,23 @@
 # -*- encoding: utf-8 -*-
 
+import fnmatch
+import os
 import sys
-from collections.abc import Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Self, Sequence
+from typing import Any, Callable, Generic, Self, Sequence, TypeVar, overload
 
 import mobase
-from PyQt6.QtCore import QDateTime, QLocale, Qt
+from PyQt6.QtCore import QDateTime, QLocale, QObject, Qt, pyqtSignal
 from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import QFormLayout, QLabel, QSizePolicy, QVBoxLayout, QWidget
 
+from .basic_thumbnail_cache import ThumbnailCache, default_thumbnail_cache
+
 
 def format_date(date_time: QDateTime | datetime | str, format_str: str | None = None):
     """Default format for date and time in the `BasicGameSaveGameInfoWidget`.
@@ -28,10 +35,78 @@ def format_date(date_time: QDateTime | datetime | str, format_str: str | None =
     return QLocale.system().toString(date_time, QLocale.FormatType.ShortFormat)
 
 
+def find_saves(
+    folder: Path | str,
+    extensions: Iterable[str],
+    max_depth: int | None = None,
+    prune: Iterable[str] = (),
+) -> list[tuple[Path, os.stat_result]]:
+    """
+    Find the save files in a folder and its subfolders.
+
+    Args:
+        folder: Folder containing the saves.
+        extensions: Extensions of the save files, without the leading dot.
+        max_depth (optional): Maximum depth of the saves, 0 to only look in the
+            folder itself, or None for no limit.
+        prune (optional): Names or patterns (see `fnmatch`) of the subfolders to
+            skip, e.g. screenshot or backup folders.
+
+    Returns:
+        The path and stat result of each save file. The stat results come from the
+        directory listing, so they do not cost any additional system call on
+        Windows.
+    """
+    suffixes = tuple("." + extension.casefold() for extension in extensions)
+    patterns = [pattern.casefold() for pattern in prune]
+
+    saves: list[tuple[Path, os.stat_result]] = []
+    folders = [(os.fspath(folder), 0)]
+    while folders:
+        directory, depth = folders.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        for entry in entries:
+            name = entry.name.casefold()
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if (max_depth is None or depth < max_depth) and not any(
+                        fnmatch.fnmatchcase(name, pattern) for pattern in patterns
+                    ):
+                        folders.append((entry.path, depth + 1))
+                elif name.endswith(suffixes) and entry.is_file():
+                    saves.append((Path(entry.path), entry.stat()))
+            except OSError:
+                continue
+
+    return saves
+
+
 class BasicGameSaveGame(mobase.ISaveGame):
-    def __init__(self, filepath: Path):
+    """
+    Save game of a file or folder, named after it.
+
+    The saves are not only used from the UI thread: the info widget passes them to
+    the metadata callback in a worker thread, and `load_saves` parses them in
+    parallel. Subclasses must therefore keep their getters thread-safe, i.e. not
+    use widgets or `QPixmap`, and lock any state shared between saves (the fields
+    of `LazyBasicGameSaveGame` are already parsed under a lock).
+    """
+
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        """
+        Args:
+            filepath: Path to the save.
+            stat (optional): Stat result of the save, e.g. from `find_saves`, to
+                avoid another system call for the creation time.
+        """
         super().__init__()
         self._filepath = filepath
+        self._mtime = None if stat is None else stat.st_mtime
 
     def getFilepath(self) -> str:
         return self._filepath.as_posix()
@@ -39,8 +114,10 @@ class BasicGameSaveGame(mobase.ISaveGame):
     def getName(self) -> str:
         return self._filepath.name
 
-    def getCreationTime(self):
-        return QDateTime.fromSecsSinceEpoch(int(self._filepath.stat().st_mtime))
+    def getCreationTime(self) -> QDateTime:
+        if self._mtime is None:
+            self._mtime = self._filepath.stat().st_mtime
+        return QDateTime.fromSecsSinceEpoch(int(self._mtime))
 
     def getSaveGroupIdentifier(self) -> str:
         return ""
@@ -49,13 +126,218 @@ class BasicGameSaveGame(mobase.ISaveGame):
         return [self.getFilepath()]
 
 
+_T = TypeVar("_T")
+
+
+class LazyField(Generic[_T]):
+    """
+    Field of a `LazyBasicGameSaveGame`, whose save is parsed on first access.
+
+    Example:
+        class MySaveGame(LazyBasicGameSaveGame):
+            level = LazyField(0)
+
+            def parse(self):
+                self.level = read_level(self._filepath)
+    """
+
+    def __init__(self, default: _T):
+        """
+        Args:
+            default: Value of the field until set by `parse()`, e.g. when the save
+                cannot be parsed.
+        """
+        self._default = default
+        self._attribute = ""
+
+    def __set_name__(self, owner: type, name: str):
+        self._attribute = f"_lazy_{name}"
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> Self: ...
+
+    @overload
+    def __get__(self, instance: "LazyBasicGameSaveGame", owner: type) -> _T: ...
+
+    def __get__(
+        self, instance: "LazyBasicGameSaveGame | None", owner: type
+    ) -> _T | Self:
+        if instance is None:
+            return self
+        instance.load()
+        value: _T = instance.__dict__.get(self._attribute, self._default)
+        return value
+
+    def __set__(self, instance: "LazyBasicGameSaveGame", value: _T):
+        instance.__dict__[self._attribute] = value
+
+
+class LazyBasicGameSaveGame(BasicGameSaveGame):
+    """
+    Save game whose file is parsed on first access of one of its `LazyField`,
+    e.g. when MO2 shows the name of the save or the info widget shows its metadata,
+    instead of when the saves are listed.
+
+    Subclasses implement `parse()`, which is called at most once per save. If the
+    parsing fails, the error is printed and the fields that were not set keep their
+    default value.
+    """
+
+    def __init__(self, filepath: Path, stat: os.stat_result | None = None):
+        super().__init__(filepath, stat)
+        self._parsed = False
+        self._parsing = False
+        self._parse_lock = threading.RLock()
+
+    def parse(self) -> None:
+        """Parse the save file and set the fields of the save."""
+        raise NotImplementedError
+
+    def load(self) -> None:
+        """Parse the save file, unless already done."""
+        if self._parsed:
+            return
+        with self._parse_lock:
+            # The fields are readable from parse() itself, with their current value:
+            if self._parsed or self._parsing:
+                return
+            self._parsing = True
+            try:
+                self.parse()
+            except Exception as e:
+                print(f"Failed to parse save {self._filepath}: {e!r}", file=sys.stderr)
+            finally:
+                self._parsing = False
+                self._parsed = True
+
+
+# Default maximum number of threads used by `load_saves`:
+MAX_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+_S = TypeVar("_S", bound=mobase.ISaveGame)
+
+
+def load_saves(saves: Sequence[_S], max_workers: int | None = None) -> list[_S]:
+    """
+    Parse the lazy saves in parallel, for games whose saves are expensive to parse
+    and whose names depend on the parsed content (so all the saves are parsed when
+    MO2 shows the list anyway).
+
+    Threads are used rather than processes since the saves are MO2 objects, and the
+    interpreter embedded in MO2 cannot spawn worker processes.
+
+    Args:
+        saves: The saves, as listed by the game. Saves that are not lazy are ignored.
+        max_workers (optional): Maximum number of threads, defaults to
+            `MAX_LOAD_WORKERS`.
+
+    Returns:
+        The saves, in the same order, parsed. Saves that failed to parse keep
+        their default fields (the errors are printed).
+    """
+    lazy = [save for save in saves if isinstance(save, LazyBasicGameSaveGame)]
+    workers = min(max_workers or MAX_LOAD_WORKERS, len(lazy))
+    if workers <= 1:
+        for save in lazy:
+            save.load()
+    else:
+        with ThreadPoolExecutor(workers, thread_name_prefix="save-loader") as pool:
+            # load() does not raise, so this only waits for all the saves:
+            for _ in pool.map(LazyBasicGameSaveGame.load, lazy):
+                pass
+    return list(saves)
+
+
+# Number of threads loading the previews and metadata of the info widgets:
+INFO_LOAD_WORKERS = 2
+
+# Number of saves on each side of the hovered save whose preview is prefetched:
+PREFETCH_NEIGHBOURS = 2
+
+# Number of saves whose preview and metadata are kept by each info widget:
+INFO_CACHE_SIZE = 64
+
+
+def neighbour_saves(save_path: Path, count: int) -> list[tuple[Path, int]]:
+    """
+    Find the saves next to a save, in the order of the MO2 list (newest first).
+
+    The saves are the entries of the folder of the save of the same kind, i.e.
+    folders for a folder, or files with the same extension for a file.
+
+    Args:
+        save_path: Path to the save.
+        count: Number of saves on each side of the save.
+
+    Returns:
+        The path and modification time (in nanoseconds) of the neighbours, closest
+        first, or an empty list if the save is not found.
+
+    Raises:
+        OSError: If the folder of the save cannot be listed.
+    """
+    is_dir = save_path.is_dir()
+    suffix = save_path.suffix.casefold()
+    saves: list[tuple[int, str]] = []
+    with os.scandir(save_path.parent) as it:
+        for entry in it:
+            try:
+                if entry.is_dir() if is_dir else entry.is_file():
+                    if is_dir or entry.name.casefold().endswith(suffix):
+                        saves.append((entry.stat().st_mtime_ns, entry.path))
+            except OSError:
+                continue
+    saves.sort(reverse=True)
+
+    paths = [Path(path) for _, path in saves]
+    try:
+        index = paths.index(save_path)
+    except ValueError:
+        return []
+    neighbours: list[tuple[Path, int]] = []
+    for offset in range(1, count + 1):
+        for i in (index - offset, index + offset):
+            if 0 <= i < len(saves):
+                neighbours.append((paths[i], saves[i][0]))
+    return neighbours
+
+
+_info_pool: ThreadPoolExecutor | None = None
+_info_pool_lock = threading.Lock()
+
+
+def _shared_info_pool() -> ThreadPoolExecutor:
+    # Workers shared by all the info widgets, so a widget (which MO2 does not close
+    # explicitly) does not own threads:
+    global _info_pool
+    with _info_pool_lock:
+        if _info_pool is None:
+            _info_pool = ThreadPoolExecutor(
+                INFO_LOAD_WORKERS, thread_name_prefix="save-info-loader"
+            )
+        return _info_pool
+
+
 def get_filedate_metadata(p: Path, save: mobase.ISaveGame) -> Mapping[str, str]:
     """Returns saves file date as the metadata for `BasicGameSaveGameInfoWidget`."""
     return {"File Date:": format_date(save.getCreationTime())}
 
 
+class _SaveInfoLoader(QObject):
+    # Loaded preview ("preview") or metadata ("metadata") of a save, sent from the
+    # workers to the widget, in the UI thread:
+    loaded = pyqtSignal(object, str, object)
+
+
 class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
-    """Save game info widget to display metadata and a preview."""
+    """
+    Save game info widget to display metadata and a preview.
+
+    The preview and metadata are loaded by worker threads, the widget showing a
+    placeholder until they are loaded, so slow callbacks do not block the UI. The
+    previews of the saves next to the hovered one are prefetched, and requests for
+    saves that are no longer hovered are dropped.
+    """
 
     def __init__(
         self,
@@ -67,22 +349,47 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
             Callable[[Path, mobase.ISaveGame], Mapping[str, Any] | None] | None
         ) = get_filedate_metadata,
         max_width: int = 320,
+        thumbnail_cache: ThumbnailCache | None = None,
     ):
         """
         Args:
             parent: parent widget
             get_preview (optional): `callback(savegame_path)` returning the
-                saves preview image or the path to it.
+                saves preview image or the path to it. Called from a worker
+                thread, concurrently with the UI and the other callbacks, so it
+                must be thread-safe and should not return a `QPixmap`.
             get_metadata (optional): `callback(savegame_path, ISaveGame)` returning
-                the saves metadata. By default the saves file date is shown.
+                the saves metadata, called from a worker thread like `get_preview`
+                (see `BasicGameSaveGame` for the saves). By default the saves
+                file date is shown.
             max_width (optional): The maximum widget and (scaled) preview width.
                 Defaults to 320.
+            thumbnail_cache (optional): Cache of the scaled previews given as paths.
+                Defaults to the cache shared by all the widgets.
         """
         super().__init__(parent)
 
         self._get_preview = get_preview or (lambda p: None)
         self._get_metadata = get_metadata or get_filedate_metadata
         self._max_width = max_width or 320
+        self._thumbnails = thumbnail_cache or default_thumbnail_cache()
+
+        # Previews and metadata are loaded by the shared workers, and kept by save
+        # (path and modification time) until evicted:
+        self._pool = _shared_info_pool()
+        self._futures: list[Future[None]] = []
+        self._generation = 0
+        self._key: tuple[str, int] | None = None
+        self._previews: OrderedDict[tuple[str, int], QImage | None] = OrderedDict()
+        self._metadata: OrderedDict[tuple[str, int], Mapping[str, Any] | None] = (
+            OrderedDict()
+        )
+        self._loader = _SaveInfoLoader(self)
+        # The PyQt6 stubs leave the slot type partially unknown (PYQT_SLOT uses an
+        # unimported Any), the slot itself is typed:
+        self._loader.loaded.connect(  # pyright: ignore[reportUnknownMemberType]
+            self._on_loaded
+        )
 
         layout = QVBoxLayout()
 
@@ -106,56 +413,181 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
 
     def setSave(self, save: mobase.ISaveGame):
         save_path = Path(save.getFilepath())
+        try:
+            mtime = save_path.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = (save_path.as_posix(), mtime)
+        if key == self._key and self.isVisible():
+            # Same save hovered again, already shown or being loaded:
+            return
+        self._key = key
+
+        # Drop the requests of the previous save that did not start yet:
+        self._generation += 1
+        for future in self._futures:
+            future.cancel()
+        self._futures = []
+
+        if key not in self._previews or key not in self._metadata:
+            self._futures.append(
+                self._pool.submit(
+                    self._load,
+                    self._generation,
+                    key,
+                    save_path,
+                    save,
+                    self._max_width,
+                    key not in self._previews,
+                    key not in self._metadata,
+                )
+            )
+        if PREFETCH_NEIGHBOURS:
+            self._futures.append(
+                self._pool.submit(
+                    self._prefetch, self._generation, save_path, self._max_width
+                )
+            )
+
+        # Show what is already loaded, the rest is shown when loaded:
+        self._show(force=True)
+
+    def _load(
+        self,
+        generation: int,
+        key: tuple[str, int],
+        save_path: Path,
+        save: mobase.ISaveGame,
+        width: int,
+        preview: bool,
+        metadata: bool,
+    ):
+        # Worker thread: load the preview and metadata of the hovered save.
+        if generation != self._generation:
+            return
+        if preview:
+            self._emit(key, "preview", self._load_preview(save_path, width))
+        if metadata and generation == self._generation:
+            try:
+                value = self._get_metadata(save_path, save)
+            except Exception as e:
+                print(
+                    f"Failed to retrieve the metadata of {save_path}: {e!r}",
+                    file=sys.stderr,
+                )
+                value = None
+            self._emit(key, "metadata", value)
+
+    def _prefetch(self, generation: int, save_path: Path, width: int):
+        # Worker thread: load the previews of the saves next to the hovered one,
+        # until another save is hovered. The metadata requires the save objects,
+        # which the widget only gets for the hovered save:
+        try:
+            neighbours = neighbour_saves(save_path, PREFETCH_NEIGHBOURS)
+        except OSError:
+            return
+        for path, mtime in neighbours:
+            if generation != self._generation:
+                return
+            key = (path.as_posix(), mtime)
+            if key not in self._previews:
+                self._emit(key, "preview", self._load_preview(path, width))
+
+    def _load_preview(self, save_path: Path, width: int) -> QImage | None:
+        try:
+            preview = self._get_preview(save_path)
+        except Exception as e:
+            print(
+                f"Failed to retrieve the preview of {save_path}: {e!r}",
+                file=sys.stderr,
+            )
+            return None
+        if preview is None:
+            return None
+
+        if isinstance(preview, str):
+            preview = Path(preview)
+        if isinstance(preview, Path):
+            # Previews from files are only decoded and scaled once:
+            try:
+                return self._thumbnails.get(preview, width)
+            except OSError:
+                print(
+                    f"Failed to retrieve the preview, file not found: {preview}",
+                    file=sys.stderr,
+                )
+                return None
+        if isinstance(preview, QPixmap):
+            preview = preview.toImage()
+        if preview.isNull():
+            return None
+        return preview if preview.width() == width else preview.scaledToWidth(width)
+
+    def _emit(self, key: tuple[str, int], kind: str, value: Any):
+        try:
+            self._loader.loaded.emit(key, kind, value)
+        except RuntimeError:  # the widget was deleted
+            pass
+
+    def _on_loaded(self, key: tuple[str, int], kind: str, value: Any):
+        # UI thread: store the loaded preview or metadata, and show it if its save
+        # is still the hovered one (unless MO2 hid the widget meanwhile):
+        if kind == "preview":
+            self._store(self._previews, key, value)
+        else:
+            self._store(self._metadata, key, value)
+        if key == self._key:
+            self._show(force=False)
+
+    @staticmethod
+    def _store(
+        cache: OrderedDict[tuple[str, int], Any], key: tuple[str, int], value: Any
+    ):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > INFO_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _show(self, force: bool):
+        key = self._key
+        if key is None or (not force and not self.isVisible()):
+            return
 
         # Clear previous
         self.hide()
         self._label.clear()
-        while self._metadata_layout.count():
-            layoutItem = self._metadata_layout.takeAt(0)
-            if layoutItem is not None and (w := layoutItem.widget()):
-                w.deleteLater()
+        while self._metadata_layout.rowCount():
+            self._metadata_layout.removeRow(0)
 
-        # Retrieve the pixmap and metadata:
-        preview = self._get_preview(save_path)
+        # Set the preview pixmap if the preview is loaded, or a placeholder:
+        loading = key not in self._previews or key not in self._metadata
+        image = self._previews.get(key)
         pixmap = None
-
-        # Set the preview pixmap if the preview file exits
-        if preview is not None:
-            if isinstance(preview, str):
-                preview = Path(preview)
-            if isinstance(preview, Path):
-                if preview.exists():
-                    pixmap = QPixmap(str(preview))
-                else:
-                    print(
-                        f"Failed to retrieve the preview, file not found: {preview}",
-                        file=sys.stderr,
-                    )
-            elif isinstance(preview, QImage):
-                pixmap = QPixmap.fromImage(preview)
-            else:
-                pixmap = preview
-        if pixmap and not pixmap.isNull():
-            # Scale the pixmap and show it:
-            pixmap = pixmap.scaledToWidth(self._max_width)
+        if image is not None:
+            pixmap = QPixmap.fromImage(image)
+            # Scale the pixmap (unless already a thumbnail) and show it:
+            if pixmap.width() != self._max_width:
+                pixmap = pixmap.scaledToWidth(self._max_width)
             self._label.setPixmap(pixmap)
             self._label.show()
+        elif loading:
+            self._label.setText("Loading...")
+            self._label.show()
         else:
             self._label.hide()
-            pixmap = None
 
         # Add metadata, file date by default.
-        metadata = self._get_metadata(save_path, save)
+        metadata = self._metadata.get(key)
         if metadata:
-            for key, value in metadata.items():
-                self._metadata_layout.addRow(*self._new_form_row(key, str(value)))
+            for name, value in metadata.items():
+                self._metadata_layout.addRow(*self._new_form_row(name, str(value)))
             self._metadata_widget.show()
             self._metadata_widget.setLayout(self._metadata_layout)
             self._metadata_widget.adjustSize()
         else:
             self._metadata_widget.hide()
 
-        if metadata or pixmap:
+        if metadata or pixmap or loading:
             self.adjustSize()
             self.show()
 
@@ -173,6 +605,9 @@ class BasicGameSaveGameInfoWidget(mobase.ISaveGameInfoWidget):
 
     def set_maximum_width(self, width: int):
         self._max_width = width
+        self._previews.clear()
+        # Load the preview again, even if the same save is hovered:
+        self._key = None
         self._metadata_widget.setMaximumWidth(width)
 
 
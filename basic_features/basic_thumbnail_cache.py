@@ -0,0 +1,206 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from PyQt6.QtGui import QImage
+
+# Default size of the thumbnails kept in memory:
+MEMORY_BUDGET = 32 * 1024 * 1024
+
+# Default size of the thumbnails kept on disk:
+DISK_BUDGET = 128 * 1024 * 1024
+
+# Text key of the thumbnails storing the modification time of their source:
+_SOURCE_MTIME_KEY = "source-mtime"
+
+
+def default_thumbnail_directory() -> Path:
+    """
+    Returns:
+        The folder containing the thumbnails of the save previews.
+    """
+    return Path(
+        os.environ.get("LOCALAPPDATA") or tempfile.gettempdir(),
+        "ModOrganizer",
+        "basic_games",
+        "thumbnails",
+    )
+
+
+class ThumbnailCache:
+    """
+    Cache of the scaled save previews, in memory and on disk.
+
+    Thumbnails are keyed by the path, modification time and target width of their
+    source image. Recently used thumbnails are kept in memory (up to a budget in
+    bytes), and thumbnails are stored on disk as small PNG files (up to another
+    budget, the least recently used files being removed), so a preview is decoded
+    and scaled at most once, until its file changes.
+
+    Thumbnails are `QImage`, so the cache can be used from any thread.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None,
+        memory_budget: int = MEMORY_BUDGET,
+        disk_budget: int = DISK_BUDGET,
+    ):
+        """
+        Args:
+            directory: Folder of the thumbnails, created if needed, or None to only
+                keep thumbnails in memory.
+            memory_budget (optional): Maximum size of the thumbnails kept in memory,
+                in bytes.
+            disk_budget (optional): Maximum size of the thumbnails kept on disk, in
+                bytes.
+        """
+        self.directory = directory
+        self.memory_budget = memory_budget
+        self.disk_budget = disk_budget
+
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[tuple[str, int, int], QImage | None] = OrderedDict()
+        self._memory_size = 0
+
+    def get(
+        self, source: Path, width: int, stat: os.stat_result | None = None
+    ) -> QImage | None:
+        """
+        Retrieve the thumbnail of an image, creating it if needed.
+
+        Args:
+            source: Path to the source image.
+            width: Width of the thumbnail.
+            stat (optional): Stat result of the source image, if already known.
+
+        Returns:
+            The thumbnail, or None if the source image cannot be read.
+
+        Raises:
+            OSError: If the source image cannot be accessed.
+        """
+        if stat is None:
+            stat = source.stat()
+        key = (source.as_posix(), stat.st_mtime_ns, width)
+
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+        thumbnail = self._load(key)
+        if thumbnail is None:
+            image = QImage(str(source))
+            if not image.isNull():
+                thumbnail = image.scaledToWidth(width)
+                self._store(key, thumbnail)
+
+        with self._lock:
+            # Unreadable images are remembered as well, without cost:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_size -= previous.sizeInBytes()
+            if thumbnail is not None:
+                self._memory_size += thumbnail.sizeInBytes()
+            self._memory[key] = thumbnail
+            while self._memory_size > self.memory_budget and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                if evicted is not None:
+                    self._memory_size -= evicted.sizeInBytes()
+        return thumbnail
+
+    def _file(self, key: tuple[str, int, int]) -> Path | None:
+        # One file per source and width, replaced when the source changes:
+        if self.directory is None:
+            return None
+        name = hashlib.sha1(f"{key[0]}|{key[2]}".encode("utf-8")).hexdigest()
+        return self.directory.joinpath(f"{name}.png")
+
+    def _load(self, key: tuple[str, int, int]) -> QImage | None:
+        path = self._file(key)
+        if path is None or not path.exists():
+            return None
+        thumbnail = QImage(str(path))
+        if thumbnail.isNull() or thumbnail.text(_SOURCE_MTIME_KEY) != str(key[1]):
+            return None
+        # The modification time of the files orders them for the eviction (access
+        # times are often not updated on Windows):
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return thumbnail
+
+    def _store(self, key: tuple[str, int, int], thumbnail: QImage):
+        path = self._file(key)
+        if path is None:
+            return
+        thumbnail.setText(_SOURCE_MTIME_KEY, str(key[1]))
+        # Write then rename, so a thumbnail is never read partially written:
+        temporary = path.with_name(f"{path.stem}.{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if not thumbnail.save(str(temporary), "PNG"):
+                raise OSError("cannot write the thumbnail")
+            os.replace(temporary, path)
+        except OSError as e:
+            print(f'Failed to store thumbnail "{path}": {e!r}', file=sys.stderr)
+            try:
+                temporary.unlink(missing_ok=True)
+            except OSError:
+                pass
+            return
+        self._prune(path.parent)
+
+    def _prune(self, directory: Path):
+        # Remove the least recently used files (including temporary files left by
+        # a crash) until the thumbnails fit in the disk budget:
+        files: list[tuple[int, int, str]] = []
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.name.endswith((".png", ".tmp")) and entry.is_file():
+                            stat = entry.stat()
+                            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+        size = sum(file_size for _, file_size, _ in files)
+        files.sort()
+        for _, file_size, file in files:
+            if size <= self.disk_budget:
+                break
+            try:
+                os.unlink(file)
+            except OSError:
+                continue
+            size -= file_size
+
+
+_default_cache: ThumbnailCache | None = None
+_default_cache_lock = threading.Lock()
+
+
+def default_thumbnail_cache() -> ThumbnailCache:
+    """
+    Returns:
+        The thumbnail cache shared by the save game info widgets, stored in
+        `default_thumbnail_directory()`.
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ThumbnailCache(default_thumbnail_directory())
+        return _default_cache
@@ -0,0 +1,177 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO, Generic, NamedTuple, TypeVar
+
+
+class LayoutField(NamedTuple):
+    """Field of a binary layout."""
+
+    # Name of the field in the records:
+    name: str
+
+    # Offset of the field from the start of the layout:
+    offset: int
+
+    # Struct code of the field, e.g. "I", "q" or "40s" (little-endian, without
+    # alignment), a code with a repeat count (e.g. "3f") giving a tuple:
+    code: str
+
+    # Function building the value of the field from the unpacked value:
+    convert: Callable[[Any], Any] | None = None
+
+
+def fixed_string(encoding: str) -> Callable[[bytes], str]:
+    """
+    Create a converter for strings stored in fixed-size, null-padded buffers.
+
+    Args:
+        encoding: Encoding of the strings, e.g. "utf-16".
+
+    Returns:
+        A function decoding a buffer, up to the first null character.
+    """
+
+    def convert(value: bytes) -> str:
+        return value.decode(encoding).split("\0", 1)[0]
+
+    return convert
+
+
+_R = TypeVar("_R", bound=tuple[Any, ...])
+
+
+class BinaryLayout(Generic[_R]):
+    """
+    Fixed layout of a binary header, e.g. the header of a save file.
+
+    The fields are compiled into a single struct, so reading a header is a single
+    bounded read and a single unpack, and gives a record of the given named tuple
+    type.
+
+    Example:
+        class Header(NamedTuple):
+            version: int
+            name: str
+
+        HEADER = BinaryLayout(
+            Header,
+            LayoutField("version", 0, "I"),
+            LayoutField("name", 4, "32s", fixed_string("utf-8")),
+        )
+    """
+
+    def __init__(self, record: type[_R], *fields: LayoutField):
+        """
+        Args:
+            record: Named tuple type of the records, with one field per layout
+                field (by name).
+            fields: Fields of the layout, in any order. Gaps between fields are
+                skipped.
+
+        Raises:
+            ValueError: If fields overlap, or do not match the fields of the record.
+        """
+        names: tuple[str, ...] = getattr(record, "_fields", ())
+        if sorted(names) != sorted(field.name for field in fields):
+            raise ValueError(
+                f"Fields of {record.__name__} {names} do not match the layout"
+                f" fields {tuple(field.name for field in fields)}."
+            )
+        self._fields = sorted(fields, key=lambda field: field.offset)
+        self._name = record.__name__
+        self._record: Callable[..., _R] = record
+
+        fmt = "<"
+        end = 0
+        self._slices: list[tuple[int, int, Callable[[Any], Any] | None]] = []
+        index = 0
+        for field in self._fields:
+            if field.offset < end:
+                raise ValueError(f"Field {field.name} overlaps the previous field.")
+            if field.offset > end:
+                fmt += f"{field.offset - end}x"
+            fmt += field.code
+            size = struct.calcsize(f"<{field.code}")
+            count = len(struct.unpack(f"<{field.code}", bytes(size)))
+            end = field.offset + size
+            self._slices.append((index, count, field.convert))
+            index += count
+
+        # Values are in offset order, record fields in declaration order:
+        offsets = [field.name for field in self._fields]
+        self._order = [offsets.index(name) for name in names]
+        self._struct = struct.Struct(fmt)
+
+    @property
+    def size(self) -> int:
+        """Size of the layout, up to the end of the last field."""
+        return self._struct.size
+
+    def unpack(self, data: bytes, offset: int = 0) -> _R:
+        """
+        Unpack a record from the given data.
+
+        Args:
+            data: The data.
+            offset (optional): Offset of the layout in the data.
+
+        Returns:
+            The record.
+
+        Raises:
+            ValueError: If the data is too short.
+        """
+        if len(data) - offset < self._struct.size:
+            raise ValueError(
+                f"{self._name} needs {self._struct.size} bytes,"
+                f" got {max(len(data) - offset, 0)}."
+            )
+        raw = self._struct.unpack_from(data, offset)
+        values: list[Any] = []
+        for start, count, convert in self._slices:
+            value = raw[start] if count == 1 else raw[start : start + count]
+            values.append(value if convert is None else convert(value))
+        return self._record(*(values[index] for index in self._order))
+
+    def read(self, file: BinaryIO) -> _R:
+        """
+        Read a record from the current position of the given file.
+
+        Args:
+            file: The file, opened in binary mode.
+
+        Returns:
+            The record.
+
+        Raises:
+            ValueError: If the file is too short.
+        """
+        data = file.read(self._struct.size)
+        # Unbuffered reads can return less data than requested:
+        while 0 < len(data) < self._struct.size:
+            chunk = file.read(self._struct.size - len(data))
+            if not chunk:
+                break
+            data += chunk
+        return self.unpack(data)
+
+    def read_file(self, path: Path) -> _R:
+        """
+        Read a record from the start of the given file, with a single read.
+
+        Args:
+            path: Path to the file.
+
+        Returns:
+            The record.
+
+        Raises:
+            ValueError: If the file is too short.
+        """
+        with open(path, "rb", buffering=0) as file:
+            return self.read(file)
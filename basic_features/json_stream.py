@@ -0,0 +1,216 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, NoReturn, TextIO, Union
+
+# Size of the reads from the JSON file:
+CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_STRING = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+_SCALAR = re.compile(r"[^\s,:\[\]{}\"]+")
+
+# Tokens that matter when skipping a container (strings may contain brackets), a
+# lone quote being the start of a string not read yet:
+_STRUCTURE = re.compile(r'"(?:[^"\\]|\\.)*"|["\[\]{}]', re.DOTALL)
+
+# Wanted keys of an object, with either the wanted keys of the value (an object) or
+# the full path of the key, if the value itself is wanted:
+_Wanted = dict[str, Union["_Wanted", tuple[str, ...]]]
+
+
+class _JSONStream:
+    """
+    Scanner of a JSON document read by chunks, only building the wanted values and
+    only keeping in memory the part of the document being scanned.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._text = ""
+        self._pos = 0
+        self._keep: int | None = None
+
+    def _error(self, message: str) -> NoReturn:
+        raise json.JSONDecodeError(message, self._text, self._pos)
+
+    def _fill(self) -> bool:
+        # Read the next chunk, dropping the text already scanned (unless kept):
+        chunk = self._file.read(self._chunk_size)
+        if not chunk:
+            return False
+        start = self._pos if self._keep is None else min(self._keep, self._pos)
+        self._text = self._text[start:] + chunk
+        self._pos -= start
+        if self._keep is not None:
+            self._keep -= start
+        return True
+
+    def _peek(self) -> str:
+        # Skip whitespaces and return the next character, or "" at the end:
+        while True:
+            match = _WHITESPACE.match(self._text, self._pos)
+            assert match is not None
+            self._pos = match.end()
+            if self._pos < len(self._text):
+                return self._text[self._pos]
+            if not self._fill():
+                return ""
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            self._error(f"Expecting {char!r}")
+        self._pos += 1
+
+    def _string(self) -> str:
+        while True:
+            match = _STRING.match(self._text, self._pos)
+            if match is not None:
+                self._pos = match.end()
+                return match.group()
+            if not self._fill():
+                self._error("Unterminated string")
+
+    def _skip_scalar(self):
+        while True:
+            match = _SCALAR.match(self._text, self._pos)
+            if match is None:
+                self._error("Expecting value")
+            elif match.end() < len(self._text) or not self._fill():
+                self._pos = match.end()
+                return
+
+    def _skip_container(self):
+        depth = 0
+        while True:
+            for match in _STRUCTURE.finditer(self._text, self._pos):
+                token = match.group()
+                if token == '"':
+                    # Unterminated string, scanned again once more text is read:
+                    self._pos = match.start()
+                    break
+                if token in ("[", "{"):
+                    depth += 1
+                elif token in ("]", "}"):
+                    depth -= 1
+                    if depth == 0:
+                        self._pos = match.end()
+                        return
+            else:
+                self._pos = len(self._text)
+            if not self._fill():
+                self._error("Unterminated container")
+
+    def _skip_value(self):
+        char = self._peek()
+        if char in ("[", "{"):
+            self._skip_container()
+        elif char == '"':
+            self._string()
+        elif char:
+            self._skip_scalar()
+        else:
+            self._error("Expecting value")
+
+    def _value(self) -> Any:
+        self._peek()
+        self._keep = self._pos
+        self._skip_value()
+        text = self._text[self._keep : self._pos]
+        self._keep = None
+        return json.loads(text)
+
+    def read(
+        self, wanted: _Wanted, values: dict[tuple[str, ...], Any], count: int
+    ) -> bool:
+        """
+        Read an object, storing the wanted values.
+
+        Args:
+            wanted: The wanted keys of the object.
+            values: The values found so far, by path.
+            count: Total number of wanted values.
+
+        Returns:
+            True if all the wanted values have been found, in which case the rest
+            of the object is not read.
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return False
+        while True:
+            if self._peek() != '"':
+                self._error("Expecting property name enclosed in double quotes")
+            key: str = json.loads(self._string())
+            self._expect(":")
+            target = wanted.get(key)
+            if isinstance(target, tuple):
+                if target not in values:
+                    values[target] = self._value()
+                    if len(values) == count:
+                        return True
+                else:
+                    self._skip_value()
+            elif target is not None and self._peek() == "{":
+                if self.read(target, values, count):
+                    return True
+            else:
+                self._skip_value()
+
+            if self._peek() == "}":
+                self._pos += 1
+                return False
+            self._expect(",")
+
+
+def read_json_keys(
+    path: Path, keys: Iterable[Sequence[str]], chunk_size: int = CHUNK_SIZE
+) -> dict[tuple[str, ...], Any]:
+    """
+    Read some values of a JSON document (whose root is an object), without reading
+    or decoding the rest of the document.
+
+    The document is read by chunks and scanned until all the wanted values are
+    found, so the cost of reading a few keys from a large document depends on where
+    the keys are, not on the size of the document.
+
+    Args:
+        path: Path to the JSON file.
+        keys: Paths of the wanted values, e.g. ("Data", "metadata", "name"). Paths
+            can only go through objects.
+        chunk_size (optional): Size of the reads.
+
+    Returns:
+        The values found, by path (as tuple). If a key appears several times in an
+        object, the first value is used.
+
+    Raises:
+        ValueError: If a wanted key is inside another wanted key.
+        json.JSONDecodeError: If the document is invalid (in the part read).
+    """
+    wanted: _Wanted = {}
+    count = 0
+    for key in {tuple(key) for key in keys}:
+        node = wanted
+        for name in key[:-1]:
+            child = node.setdefault(name, {})
+            if isinstance(child, tuple):
+                raise ValueError(f"Wanted keys {child} and {key} overlap.")
+            node = child
+        if key[-1] in node:
+            raise ValueError(f"Wanted key {key} overlaps with its sub-keys.")
+        node[key[-1]] = key
+        count += 1
+
+    values: dict[tuple[str, ...], Any] = {}
+    with open(path, encoding="utf-8-sig") as file:
+        if count:
+            _JSONStream(file, chunk_size).read(wanted, values, count)
+    return values
@@ -1,122 +1,349 @@
 from __future__ import annotations
 
+import os
 import shutil
 import sys
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Generic, TypeVar
+from types import MappingProxyType
+from typing import Any, Callable, Generic, TypeVar, cast, overload
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
 from PyQt6.QtGui import QIcon
 
+from .basic_features.basic_save_game_cache import SaveGameCache
 from .basic_features.basic_save_game_info import (
     BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    find_saves,
+)
+from .discovery_utils import LAUNCHERS, GameDiscovery, LazyGames, launcher_finder
+from .variables_utils import ENVIRONMENT, VariableExpander
+
+# Name of the save cache database, in the profile folder:
+SAVE_CACHE_NAME = "basic_games_saves.sqlite"
+
+# Maximum time to wait for a launcher backend during discovery, in seconds:
+DISCOVERY_TIMEOUT = 10.0
+
+
+# Variables shared by all the games, on top of the environment variables:
+GLOBAL_VARIABLES = VariableExpander(parent=ENVIRONMENT)
+GLOBAL_VARIABLES.register(
+    "DOCUMENTS",
+    lambda: QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.DocumentsLocation
+    ),
+)
+GLOBAL_VARIABLES.register(
+    "USERPROFILE",
+    lambda: QStandardPaths.writableLocation(
+        QStandardPaths.StandardLocation.HomeLocation
+    ),
 )
 
 
 def replace_variables(value: str, game: BasicGame) -> str:
     """Replace special paths in the given value."""
+    return game.variables.expand(value)
 
-    if value.find("%DOCUMENTS%") != -1:
-        value = value.replace(
-            "%DOCUMENTS%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.DocumentsLocation
-            ),
-        )
-    if value.find("%USERPROFILE%") != -1:
-        value = value.replace(
-            "%USERPROFILE%",
-            QStandardPaths.writableLocation(
-                QStandardPaths.StandardLocation.HomeLocation
-            ),
-        )
-    if value.find("%GAME_DOCUMENTS%") != -1:
-        value = value.replace(
-            "%GAME_DOCUMENTS%", game.documentsDirectory().absolutePath()
-        )
-    if value.find("%GAME_PATH%") != -1:
-        value = value.replace("%GAME_PATH%", game.gameDirectory().absolutePath())
 
-    return value
+_T = TypeVar("_T")
 
 
-_T = TypeVar("_T")
+class BasicGameMappingCache:
+    """
+    Cache of the resolved values of the mappings of a game. The values are kept
+    until the cache is invalidated, i.e., when the game path, a launcher option or
+    a setting of the plugin changes, unless their resolution was marked as not
+    cacheable (see `uncacheable()`).
+    """
 
+    # Number of values served from / missing from the cache:
+    hits: int
+    misses: int
 
-class BasicGameMapping(Generic[_T]):
-    # The game:
-    _game: "BasicGame"
+    def __init__(self):
+        self._values: dict[str, object] = {}
+        self.hits = 0
+        self.misses = 0
+
+        # Whether each value being resolved (innermost last) can be cached:
+        self._resolving: list[bool] = []
+
+    def get(self, key: str, resolve: Callable[[], _T]) -> _T:
+        """
+        Retrieve a cached value, resolving it on a miss.
+
+        Args:
+            key: Key of the value.
+            resolve: Function resolving the value.
+
+        Returns:
+            The cached value. QDir values are copied so that callers cannot modify
+            the cached ones.
+        """
+        try:
+            value = cast(_T, self._values[key])
+            self.hits += 1
+        except KeyError:
+            self._resolving.append(True)
+            try:
+                value = resolve()
+            finally:
+                cacheable = self._resolving.pop()
+            if cacheable:
+                self._values[key] = value
+            else:
+                self.uncacheable()
+            self.misses += 1
+        if isinstance(value, QDir):
+            return cast(_T, QDir(value))
+        return value
+
+    def uncacheable(self):
+        """
+        Prevent caching the value being resolved, and the values resolved from it,
+        e.g. when a folder is not found yet.
+        """
+        if self._resolving:
+            self._resolving[-1] = False
+
+    def invalidate(self):
+        """Drop all the cached values."""
+        self._values.clear()
+
+
+@dataclass(frozen=True)
+class BasicGameMappingDefinition(Generic[_T]):
+    """
+    Definition of a game mapping: the plugin attribute providing its value, how to
+    validate that value and the default when the attribute is missing.
+
+    Definitions are class attributes of BasicGameMappings, accessing them through
+    the mappings of a game gives the corresponding BasicGameMapping.
+    """
 
     # Name of the attribute for exposure:
-    _exposed_name: str
+    exposed_name: str
 
     # Name of the internal method:
-    _internal_method_name: str
-
-    # Required:
-    _required: bool
+    internal_method: str
 
     # Callable returning a default value (if not required):
-    _default: Callable[["BasicGame"], _T]
+    default: Callable[[BasicGame], Any] | None = None
 
     # Function to apply to the value:
-    _apply_fn: Callable[[_T | str], _T] | None
+    apply_fn: Callable[[Any], Any] | None = None
+
+    @overload
+    def __get__(
+        self, mappings: None, owner: type[BasicGameMappings]
+    ) -> BasicGameMappingDefinition[_T]: ...
+
+    @overload
+    def __get__(
+        self, mappings: BasicGameMappings, owner: type[BasicGameMappings]
+    ) -> BasicGameMapping[_T]: ...
+
+    def __get__(
+        self, mappings: BasicGameMappings | None, owner: type[BasicGameMappings]
+    ) -> BasicGameMappingDefinition[_T] | BasicGameMapping[_T]:
+        if mappings is None:
+            return self
+        return BasicGameMapping(mappings, self)
+
+    def compile(
+        self, source: object, from_name: str
+    ) -> Callable[[BasicGame], Any] | str:
+        """
+        Validate the plugin attribute of this mapping.
 
-    def __init__(
-        self,
-        game: BasicGame,
-        exposed_name: str,
-        internal_method: str,
-        default: Callable[[BasicGame], _T] | None = None,
-        apply_fn: Callable[[_T | str], _T] | None = None,
-    ):
-        self._game = game
-        self._exposed_name = exposed_name
-        self._internal_method_name = internal_method
-        self._apply_fn = apply_fn
+        Args:
+            source: The game class, or the game itself if it has instance attributes.
+            from_name: Name of the plugin, for error messages.
 
-        if hasattr(game, self._exposed_name):
-            value = getattr(game, self._exposed_name)
+        Returns:
+            A function returning the (unresolved) value of the mapping for a game,
+            or an error message if the attribute is invalid or missing.
+        """
+        if hasattr(source, self.exposed_name):
+            value = getattr(source, self.exposed_name)
 
-            if self._apply_fn is not None:
+            if self.apply_fn is not None:
                 try:
-                    value = self._apply_fn(value)
+                    value = self.apply_fn(value)
                 except:  # noqa
-                    raise ValueError(
+                    return (
                         "Basic game plugin from {} has an invalid {} property.".format(
-                            game._fromName,  # pyright: ignore[reportPrivateUsage]
-                            self._exposed_name,
+                            from_name, self.exposed_name
                         )
                     )
-            self._default = lambda game: value  # type: ignore
-        elif default is not None:
-            self._default = default  # type: ignore
-        elif getattr(game.__class__, self._internal_method_name) is getattr(
-            BasicGame, self._internal_method_name
+            return lambda game: value
+
+        if self.default is not None:
+            return self.default
+
+        game_class = source if isinstance(source, type) else type(source)
+        if getattr(game_class, self.internal_method) is getattr(
+            BasicGame, self.internal_method
         ):
-            raise ValueError(
-                "Basic game plugin from {} is missing {} property.".format(
-                    game._fromName,  # pyright: ignore[reportPrivateUsage]
-                    self._exposed_name,
+            return "Basic game plugin from {} is missing {} property.".format(
+                from_name, self.exposed_name
+            )
+
+        # The plugin overrides the method, so the mapping should not be used:
+        def missing(game: BasicGame) -> Any:
+            raise AttributeError(
+                "Basic game plugin from {} has no {} property.".format(
+                    from_name, self.exposed_name
                 )
             )
 
+        return missing
+
+
+@dataclass(frozen=True)
+class BasicGameOptionsDefinition(BasicGameMappingDefinition[list[_T]]):
+    """
+    Definition of a game mapping for which multiple options are possible.
+    """
+
+    # Callable returning the current value when there is no option:
+    current_default: Callable[[BasicGame], _T] | None = None
+
+    @overload
+    def __get__(
+        self, mappings: None, owner: type[BasicGameMappings]
+    ) -> BasicGameOptionsDefinition[_T]: ...
+
+    @overload
+    def __get__(
+        self, mappings: BasicGameMappings, owner: type[BasicGameMappings]
+    ) -> BasicGameOptionsMapping[_T]: ...
+
+    def __get__(
+        self, mappings: BasicGameMappings | None, owner: type[BasicGameMappings]
+    ) -> BasicGameOptionsDefinition[_T] | BasicGameOptionsMapping[_T]:
+        if mappings is None:
+            return self
+        return BasicGameOptionsMapping(mappings, self)
+
+
+@dataclass(frozen=True, slots=True)
+class BasicGameMappingTable:
+    """
+    Validated mapping values of a game class, built once per class when the class
+    is created.
+    """
+
+    # Functions returning the (unresolved) value of each mapping, by exposed name:
+    values: Mapping[str, Callable[[BasicGame], Any]]
+
+    # Validation errors, raised when a game of the class is created:
+    errors: tuple[str, ...]
+
+    @staticmethod
+    def build(source: object, from_name: str) -> BasicGameMappingTable:
+        """
+        Build the mapping table of a game class.
+
+        Args:
+            source: The game class, or the game itself if it has instance attributes.
+            from_name: Name of the plugin, for error messages.
+
+        Returns:
+            The mapping table.
+        """
+        values: dict[str, Callable[[BasicGame], Any]] = {}
+        errors: list[str] = []
+        for definition in MAPPING_DEFINITIONS:
+            value = definition.compile(source, from_name)
+            if isinstance(value, str):
+                errors.append(value)
+            else:
+                values[definition.exposed_name] = value
+        return BasicGameMappingTable(MappingProxyType(values), tuple(errors))
+
+    @staticmethod
+    def of(game: BasicGame) -> BasicGameMappingTable:
+        """
+        Retrieve the mapping table of a game.
+
+        Args:
+            game: The game.
+
+        Returns:
+            The mapping table of the class of the game, or a table of its own if the
+            game has instance attributes (e.g., games created from INI files). The
+            tables of the latter are built once per class and attribute values, so
+            an INI game is validated once even if it is created again.
+
+        Raises:
+            ValueError: If an attribute of the game is invalid or missing.
+        """
+        table: BasicGameMappingTable = (
+            game._mapping_table  # pyright: ignore[reportPrivateUsage]
+        )
+        attributes = MAPPING_ATTRIBUTES.intersection(vars(game))
+        if attributes:
+            from_name: str = game._fromName  # pyright: ignore[reportPrivateUsage]
+            key = (
+                type(game),
+                from_name,
+                tuple((name, vars(game)[name]) for name in sorted(attributes)),
+            )
+            try:
+                table = _INSTANCE_TABLES[key]
+            except KeyError:
+                table = _INSTANCE_TABLES[key] = BasicGameMappingTable.build(
+                    game, from_name
+                )
+            except TypeError:  # unhashable attribute values
+                table = BasicGameMappingTable.build(game, from_name)
+        if table.errors:
+            raise ValueError(table.errors[0])
+        return table
+
+
+class BasicGameMapping(Generic[_T]):
+    """
+    A mapping of a game, with its value resolved through the cache of the game
+    mappings.
+    """
+
+    __slots__ = ("_mappings", "_definition")
+
+    def __init__(
+        self, mappings: BasicGameMappings, definition: BasicGameMappingDefinition[_T]
+    ):
+        self._mappings = mappings
+        self._definition = definition
+
     def get(self) -> _T:
         """Return the value of this mapping."""
-        value = self._default(self._game)  # type: ignore
+        return self._mappings.cache.get(self._definition.exposed_name, self._resolve)
+
+    def _raw(self) -> Any:
+        game = self._mappings.game
+        return self._mappings.table.values[self._definition.exposed_name](game)
+
+    def _resolve(self) -> _T:
+        value = self._raw()
+        game = self._mappings.game
 
         if isinstance(value, str):
-            return replace_variables(value, self._game)  # type: ignore
+            return replace_variables(value, game)  # type: ignore
         elif isinstance(value, QDir):
-            return QDir(replace_variables(value.path(), self._game))  # type: ignore
+            return QDir(replace_variables(value.path(), game))  # type: ignore
 
         # MO2 does not support Path anywhere so we always convert to str:
         elif isinstance(value, Path):
-            return replace_variables(str(value), self._game)  # type: ignore
+            return replace_variables(str(value), game)  # type: ignore
 
-        return value
+        return cast(_T, value)
 
 
 class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
@@ -125,19 +352,7 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
     plugin is responsible to choose the right option depending on the context.
     """
 
-    _index: int
-
-    def __init__(
-        self,
-        game: BasicGame,
-        exposed_name: str,
-        internal_method: str,
-        default: Callable[[BasicGame], _T] | None = None,
-        apply_fn: Callable[[list[_T] | str], list[_T]] | None = None,
-    ):
-        super().__init__(game, exposed_name, internal_method, lambda g: [], apply_fn)
-        self._index = -1
-        self._current_default = default
+    __slots__ = ()
 
     def set_index(self, index: int):
         """
@@ -146,7 +361,8 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Args:
             index: Index of the option to use.
         """
-        self._index = index
+        self._mappings.indices[self._definition.exposed_name] = index
+        self._mappings.cache.invalidate()
 
     def set_value(self, value: _T):
         """
@@ -157,9 +373,9 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
             value: The value to set the index to.
         """
         try:
-            self._index = self.get().index(value)
+            self.set_index(self.get().index(value))
         except ValueError:
-            self._index = -1
+            self.set_index(-1)
 
     def has_value(self) -> bool:
         """
@@ -168,196 +384,273 @@ class BasicGameOptionsMapping(BasicGameMapping[list[_T]]):
         Returns:
             True if a value was set, False otherwise.
         """
-        return self._index != -1
+        return self._mappings.indices.get(self._definition.exposed_name, -1) != -1
 
     def current(self) -> _T:
-        values = self._default(self._game)  # type: ignore
+        return self._mappings.cache.get(
+            f"{self._definition.exposed_name}[current]", self._resolve_current
+        )
+
+    def _resolve_current(self) -> _T:
+        values = self._raw()
+        game = self._mappings.game
 
         if not values:
-            return self._current_default(self._game)  # type: ignore
+            definition = cast(BasicGameOptionsDefinition[_T], self._definition)
+            return definition.current_default(game)  # type: ignore
 
-        if self._index == -1:
+        index = self._mappings.indices.get(self._definition.exposed_name, -1)
+        if index == -1:
             value = values[0]
         else:
-            value = values[self._index]
+            value = values[index]
 
         if isinstance(value, str):
-            return replace_variables(value, self._game)  # type: ignore
+            return replace_variables(value, game)  # type: ignore
         elif isinstance(value, QDir):
-            return QDir(replace_variables(value.path(), self._game))  # type: ignore
+            return QDir(replace_variables(value.path(), game))  # type: ignore
+
+        return cast(_T, value)
+
+
+# Convert Union[int, str, List[Union[int, str]]] to List[str].
+def _ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
+    """
+    Convert various types to a list of string. If the given value is already a
+    list, returns a new list with all values converted to string, otherwise
+    returns a list with the value convert to a string as its only element.
+    """
+    if isinstance(v, (int, str)):
+        v = [str(v)]
+    return [str(x) for x in v]
+
+
+def _default_documents_directory(game: BasicGame) -> QDir:
+    mappings = game._mappings  # pyright: ignore[reportPrivateUsage]
+    return mappings.default_documents_directory()
+
+
+def _default_save_extensions(game: BasicGame) -> list[str]:
+    mappings = game._mappings  # pyright: ignore[reportPrivateUsage]
+    return [mappings.savegameExtension.get()]
 
-        return value
+
+def _split_apply(value: list[str] | str) -> list[str]:
+    return [c.strip() for c in value.split(",")] if isinstance(value, str) else value
 
 
 class BasicGameMappings:
-    name: BasicGameMapping[str]
-    author: BasicGameMapping[str]
-    version: BasicGameMapping[mobase.VersionInfo]
-    description: BasicGameMapping[str]
-    gameName: BasicGameMapping[str]
-    gameShortName: BasicGameMapping[str]
-    gameNexusName: BasicGameMapping[str]
-    validShortNames: BasicGameMapping[list[str]]
-    nexusGameId: BasicGameMapping[int]
-    binaryName: BasicGameMapping[str]
-    launcherName: BasicGameMapping[str]
-    dataDirectory: BasicGameMapping[str]
-    documentsDirectory: BasicGameMapping[QDir]
-    iniFiles: BasicGameMapping[list[str]]
-    savesDirectory: BasicGameMapping[QDir]
-    savegameExtension: BasicGameMapping[str]
-    steamAPPId: BasicGameOptionsMapping[str]
-    gogAPPId: BasicGameOptionsMapping[str]
-    originManifestIds: BasicGameOptionsMapping[str]
-    originWatcherExecutables: BasicGameMapping[list[str]]
-    epicAPPId: BasicGameOptionsMapping[str]
-    eaDesktopContentId: BasicGameOptionsMapping[str]
-    supportURL: BasicGameMapping[str]
+    """
+    The mappings of a game. The mapping definitions and the validated values are
+    shared by all the games of a class, the game mappings only hold the state of a
+    game: the option indices and the cache of the resolved values.
+    """
 
-    @staticmethod
-    def _default_documents_directory(game: mobase.IPluginGame):
-        folders = [
-            "{}/My Games/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-            "{}/{}".format(
-                QStandardPaths.writableLocation(
-                    QStandardPaths.StandardLocation.DocumentsLocation
-                ),
-                game.gameName(),
-            ),
-        ]
-        for folder in folders:
-            qdir = QDir(folder)
-            if qdir.exists():
-                return qdir
+    __slots__ = (
+        "game",
+        "table",
+        "cache",
+        "indices",
+        "documents_probes",
+        "_documents_directory",
+    )
+
+    name = BasicGameMappingDefinition[str]("Name", "name")
+    author = BasicGameMappingDefinition[str]("Author", "author")
+    version = BasicGameMappingDefinition[mobase.VersionInfo](
+        "Version",
+        "version",
+        apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
+    )
+    description = BasicGameMappingDefinition[str](
+        "Description",
+        "description",
+        lambda g: "Adds basic support for game {}.".format(g.gameName()),
+    )
+    gameName = BasicGameMappingDefinition[str]("GameName", "gameName")
+    gameShortName = BasicGameMappingDefinition[str]("GameShortName", "gameShortName")
+    gameNexusName = BasicGameMappingDefinition[str](
+        "GameNexusName",
+        "gameNexusName",
+        default=lambda g: g.gameShortName(),
+    )
+    validShortNames = BasicGameMappingDefinition[list[str]](
+        "GameValidShortNames",
+        "validShortNames",
+        default=lambda g: [],
+        apply_fn=_split_apply,
+    )
+    nexusGameId = BasicGameMappingDefinition[int](
+        "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
+    )
+    binaryName = BasicGameMappingDefinition[str]("GameBinary", "binaryName")
+    launcherName = BasicGameMappingDefinition[str](
+        "GameLauncher",
+        "getLauncherName",
+        default=lambda g: "",
+    )
+    dataDirectory = BasicGameMappingDefinition[str]("GameDataPath", "dataDirectory")
+    documentsDirectory = BasicGameMappingDefinition[QDir](
+        "GameDocumentsDirectory",
+        "documentsDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=_default_documents_directory,
+    )
+    iniFiles = BasicGameMappingDefinition[list[str]](
+        "GameIniFiles",
+        "iniFiles",
+        lambda g: [],
+        apply_fn=_split_apply,
+    )
+    savesDirectory = BasicGameMappingDefinition[QDir](
+        "GameSavesDirectory",
+        "savesDirectory",
+        apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
+        default=lambda g: g.documentsDirectory(),
+    )
+    savegameExtension = BasicGameMappingDefinition[str](
+        "GameSaveExtension", "savegameExtension", default=lambda g: "save"
+    )
+    saveExtensions = BasicGameMappingDefinition[list[str]](
+        "GameSaveExtensions",
+        "listSaves",
+        default=_default_save_extensions,
+        apply_fn=_split_apply,
+    )
+    savesMaxDepth = BasicGameMappingDefinition[int | None](
+        "GameSavesMaxDepth",
+        "listSaves",
+        default=lambda g: None,
+        apply_fn=lambda d: None if d is None else int(d),
+    )
+    savesPruneDirectories = BasicGameMappingDefinition[list[str]](
+        "GameSavesPruneDirectories",
+        "listSaves",
+        default=lambda g: [],
+        apply_fn=_split_apply,
+    )
+    steamAPPId = BasicGameOptionsDefinition[str](
+        "GameSteamId",
+        "steamAPPId",
+        default=lambda g: [],
+        apply_fn=_ids_apply,
+        current_default=lambda g: "",
+    )
+    gogAPPId = BasicGameOptionsDefinition[str](
+        "GameGogId",
+        "gogAPPId",
+        default=lambda g: [],
+        apply_fn=_ids_apply,
+        current_default=lambda g: "",
+    )
+    originManifestIds = BasicGameOptionsDefinition[str](
+        "GameOriginManifestIds",
+        "originManifestIds",
+        default=lambda g: [],
+        apply_fn=_ids_apply,
+        current_default=lambda g: "",
+    )
+    originWatcherExecutables = BasicGameMappingDefinition[list[str]](
+        "GameOriginWatcherExecutables",
+        "originWatcherExecutables",
+        apply_fn=lambda s: [s] if isinstance(s, str) else s,
+        default=lambda g: [],
+    )
+    epicAPPId = BasicGameOptionsDefinition[str](
+        "GameEpicId",
+        "epicAPPId",
+        default=lambda g: [],
+        apply_fn=_ids_apply,
+        current_default=lambda g: "",
+    )
+    eaDesktopContentId = BasicGameOptionsDefinition[str](
+        "GameEaDesktopId",
+        "eaDesktopContentId",
+        default=lambda g: [],
+        apply_fn=_ids_apply,
+        current_default=lambda g: "",
+    )
+    supportURL = BasicGameMappingDefinition[str](
+        "GameSupportURL", "supportURL", default=lambda g: ""
+    )
+
+    # The game:
+    game: BasicGame
+
+    # Validated mapping values of the game class:
+    table: BasicGameMappingTable
+
+    # Cache of the resolved values of the mappings:
+    cache: BasicGameMappingCache
+
+    # Index of the current option of the options mappings, by exposed name:
+    indices: dict[str, int]
 
-        return QDir()
+    # Number of filesystem probes made to find the default documents directory:
+    documents_probes: int
 
-    # Game mappings:
     def __init__(self, game: BasicGame):
-        self._game = game
-
-        self.name = BasicGameMapping(game, "Name", "name")
-        self.author = BasicGameMapping(game, "Author", "author")
-        self.version = BasicGameMapping(
-            game,
-            "Version",
-            "version",
-            apply_fn=lambda s: mobase.VersionInfo(s) if isinstance(s, str) else s,
-        )
-        self.description = BasicGameMapping(
-            game,
-            "Description",
-            "description",
-            lambda g: "Adds basic support for game {}.".format(g.gameName()),
-        )
-        self.gameName = BasicGameMapping(game, "GameName", "gameName")
-        self.gameShortName = BasicGameMapping(game, "GameShortName", "gameShortName")
-        self.gameNexusName = BasicGameMapping(
-            game,
-            "GameNexusName",
-            "gameNexusName",
-            default=lambda g: g.gameShortName(),
-        )
-        self.validShortNames = BasicGameMapping(
-            game,
-            "GameValidShortNames",
-            "validShortNames",
-            default=lambda g: [],
-            apply_fn=lambda value: (
-                [c.strip() for c in value.split(",")]  # type: ignore
-                if isinstance(value, str)
-                else value
-            ),
-        )
-        self.nexusGameId = BasicGameMapping(
-            game, "GameNexusId", "nexusGameID", default=lambda g: 0, apply_fn=int
-        )
-        self.binaryName = BasicGameMapping(game, "GameBinary", "binaryName")
-        self.launcherName = BasicGameMapping(
-            game,
-            "GameLauncher",
-            "getLauncherName",
-            default=lambda g: "",
-        )
-        self.dataDirectory = BasicGameMapping(game, "GameDataPath", "dataDirectory")
-        self.documentsDirectory = BasicGameMapping(
-            game,
-            "GameDocumentsDirectory",
-            "documentsDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=BasicGameMappings._default_documents_directory,
-        )
-        self.iniFiles = BasicGameMapping(
-            game,
-            "GameIniFiles",
-            "iniFiles",
-            lambda g: [],
-            apply_fn=lambda value: (
-                [c.strip() for c in value.split(",")]
-                if isinstance(value, str)
-                else value
-            ),
-        )
-        self.savesDirectory = BasicGameMapping(
-            game,
-            "GameSavesDirectory",
-            "savesDirectory",
-            apply_fn=lambda s: QDir(s) if isinstance(s, str) else s,
-            default=lambda g: g.documentsDirectory(),
-        )
-        self.savegameExtension = BasicGameMapping(
-            game, "GameSaveExtension", "savegameExtension", default=lambda g: "save"
-        )
+        self.game = game
+        self.table = BasicGameMappingTable.of(game)
+        self.cache = BasicGameMappingCache()
+        self.indices = {}
+        self.documents_probes = 0
+        self._documents_directory: QDir | None = None
+
+    def default_documents_directory(self) -> QDir:
+        """
+        Find the default documents directory of the game, "My Games/<game name>" or
+        "<game name>" in the Documents folder.
 
-        # Convert Union[int, str, List[Union[int, str]]] to List[str].
-        def ids_apply(v: list[int] | list[str] | int | str) -> list[str]:
-            """
-            Convert various types to a list of string. If the given value is already a
-            list, returns a new list with all values converted to string, otherwise
-            returns a list with the value convert to a string as its only element.
-            """
-            if isinstance(v, (int, str)):
-                v = [str(v)]
-            return [str(x) for x in v]
-
-        self.steamAPPId = BasicGameOptionsMapping(
-            game, "GameSteamId", "steamAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.gogAPPId = BasicGameOptionsMapping(
-            game, "GameGogId", "gogAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.originManifestIds = BasicGameOptionsMapping(
-            game,
-            "GameOriginManifestIds",
-            "originManifestIds",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.originWatcherExecutables = BasicGameMapping(
-            game,
-            "GameOriginWatcherExecutables",
-            "originWatcherExecutables",
-            apply_fn=lambda s: [s] if isinstance(s, str) else s,
-            default=lambda g: [],
-        )
-        self.epicAPPId = BasicGameOptionsMapping(
-            game, "GameEpicId", "epicAPPId", default=lambda g: "", apply_fn=ids_apply
-        )
-        self.eaDesktopContentId = BasicGameOptionsMapping(
-            game,
-            "GameEaDesktopId",
-            "eaDesktopContentId",
-            default=lambda g: "",
-            apply_fn=ids_apply,
-        )
-        self.supportURL = BasicGameMapping(
-            game, "GameSupportURL", "supportURL", default=lambda g: ""
-        )
+        The folder found is kept until refresh_documents_directory() is called, but
+        a miss is probed again next time since the game may create the folder.
+
+        Returns:
+            The documents directory, or an empty QDir if not found.
+        """
+        if self._documents_directory is None:
+            documents = GLOBAL_VARIABLES.resolve("DOCUMENTS")
+            for folder in (
+                "{}/My Games/{}".format(documents, self.game.gameName()),
+                "{}/{}".format(documents, self.game.gameName()),
+            ):
+                qdir = QDir(folder)
+                self.documents_probes += 1
+                if qdir.exists():
+                    self._documents_directory = qdir
+                    break
+            else:
+                self.cache.uncacheable()
+                return QDir()
+
+        return QDir(self._documents_directory)
+
+    def refresh_documents_directory(self):
+        """
+        Probe the default documents directory again on next use, e.g. after the
+        Documents folder was moved.
+        """
+        self._documents_directory = None
+        GLOBAL_VARIABLES.invalidate("DOCUMENTS")
+        self.game.variables.invalidate()
+        self.cache.invalidate()
+
+
+# All the mapping definitions, and the plugin attributes they read:
+MAPPING_DEFINITIONS: tuple[BasicGameMappingDefinition[Any], ...] = tuple(
+    cast(BasicGameMappingDefinition[Any], definition)
+    for definition in vars(BasicGameMappings).values()
+    if isinstance(definition, BasicGameMappingDefinition)
+)
+MAPPING_ATTRIBUTES = frozenset(
+    definition.exposed_name for definition in MAPPING_DEFINITIONS
+)
+
+# Mapping tables of the games with instance attributes, by class, plugin name and
+# attribute values:
+_INSTANCE_TABLES: dict[
+    tuple[type, str, tuple[tuple[str, Any], ...]], BasicGameMappingTable
+] = {}
 
 
 _GameFeature = (
@@ -378,26 +671,73 @@ class BasicGame(mobase.IPluginGame):
     to make it easier to create game plugins without having to implement
     all the methods of mobase.IPluginGame."""
 
-    # List of steam, GOG, origin and Epic games:
-    steam_games: dict[str, Path]
-    gog_games: dict[str, Path]
-    origin_games: dict[str, Path]
-    epic_games: dict[str, Path]
-    eadesktop_games: dict[str, Path]
+    # Launcher discovery, backends only run when their games are needed:
+    discovery: GameDiscovery
+
+    # List of steam, GOG, origin and Epic games, discovered on first access:
+    steam_games: Mapping[str, Path]
+    gog_games: Mapping[str, Path]
+    origin_games: Mapping[str, Path]
+    epic_games: Mapping[str, Path]
+    eadesktop_games: Mapping[str, Path]
 
     @staticmethod
-    def setup():
-        from .eadesktop_utils import find_games as find_eadesktop_games
-        from .epic_utils import find_games as find_epic_games
-        from .gog_utils import find_games as find_gog_games
-        from .origin_utils import find_games as find_origin_games
-        from .steam_utils import find_games as find_steam_games
-
-        BasicGame.steam_games = find_steam_games()
-        BasicGame.gog_games = find_gog_games()
-        BasicGame.origin_games = find_origin_games()
-        BasicGame.epic_games = find_epic_games()
-        BasicGame.eadesktop_games = find_eadesktop_games()
+    def configure_discovery(
+        timeout: float | None = DISCOVERY_TIMEOUT, use_cache: bool = True
+    ):
+        """
+        Reset the launcher discovery. No backend is run by this method.
+
+        Args:
+            timeout: Maximum time to wait for a launcher backend, in seconds.
+                Backends that do not finish in time are treated as if no game was
+                found.
+            use_cache: If True, only re-parse the launcher manifests that changed
+                since the previous discovery.
+        """
+        discovery = GameDiscovery(
+            {store: launcher_finder(store, use_cache) for store in LAUNCHERS},
+            timeout,
+        )
+        BasicGame.discovery = discovery
+        BasicGame.steam_games = LazyGames(discovery, "steam")
+        BasicGame.gog_games = LazyGames(discovery, "gog")
+        BasicGame.origin_games = LazyGames(discovery, "origin")
+        BasicGame.epic_games = LazyGames(discovery, "epic")
+        BasicGame.eadesktop_games = LazyGames(discovery, "eadesktop")
+
+    @staticmethod
+    def setup(
+        parallel: bool = True,
+        timeout: float | None = DISCOVERY_TIMEOUT,
+        use_cache: bool = True,
+    ):
+        """
+        Eagerly discover the games installed through all the supported launchers.
+
+        This is not required since games are discovered on demand, see
+        `configure_discovery()` for the arguments.
+
+        Args:
+            parallel: If True, run the launcher backends concurrently.
+        """
+        BasicGame.configure_discovery(timeout, use_cache)
+        if parallel:
+            BasicGame.discovery.wait()
+        else:
+            for store in LAUNCHERS:
+                BasicGame.discovery.wait([store])
+
+    @staticmethod
+    def prefetch(stores: Iterable[str] | None = None):
+        """
+        Start the discovery of the games from the given launchers in background.
+
+        Args:
+            stores: Launchers to prefetch (see `discovery_utils.LAUNCHERS`), or None
+                for all of them.
+        """
+        BasicGame.discovery.start(stores)
 
     # File containing the plugin:
     _fromName: str
@@ -411,6 +751,20 @@ class BasicGame(mobase.IPluginGame):
     # The feature map:
     _featureMap: dict[type[_GameFeature], _GameFeature]
 
+    # Variables of the game (%GAME_PATH%, %GAME_DOCUMENTS%, ...), plugins can
+    # register their own:
+    variables: VariableExpander
+
+    # Validated mapping attributes of the class:
+    _mapping_table: BasicGameMappingTable
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+
+        # Validate the mapping attributes once per class, the errors are only raised
+        # when the game is created, so intermediate classes can omit attributes:
+        cls._mapping_table = BasicGameMappingTable.build(cls, cls.__name__)
+
     def __init__(self):
         super(BasicGame, self).__init__()
 
@@ -420,9 +774,88 @@ class BasicGame(mobase.IPluginGame):
         self._gamePath = ""
         self._featureMap = {}
 
+        self.variables = VariableExpander(parent=GLOBAL_VARIABLES)
+        # Resolved through the mapping cache, which does not keep the documents
+        # directory while it is not found:
+        self.variables.register(
+            "GAME_DOCUMENTS",
+            lambda: self.documentsDirectory().absolutePath(),
+            cache=False,
+        )
+        self.variables.register(
+            "GAME_PATH", lambda: self.gameDirectory().absolutePath()
+        )
+
         self._mappings: BasicGameMappings = BasicGameMappings(self)
+        self._save_cache: SaveGameCache | None = None
+
+    @staticmethod
+    def launchers_for(path: Path | str) -> list[tuple[str, str]]:
+        """
+        Find the launchers owning the given install location, discovering the
+        games of all the launchers if not already done.
+
+        Args:
+            path: Install location of a game.
+
+        Returns:
+            A list of (store, store ID) for each launcher entry installed at the
+            location, e.g. [("steam", "292030"), ("gog", "1495134320")].
+        """
+        return BasicGame.discovery.owners(path)
 
     # Specific to BasicGame:
+    def find_saves(self, folder: QDir) -> list[tuple[Path, os.stat_result]]:
+        """
+        Find the save files of the game, according to its save layout
+        (GameSaveExtensions, GameSavesMaxDepth and GameSavesPruneDirectories).
+
+        Args:
+            folder: The saves folder.
+
+        Returns:
+            The path and stat result of each save file.
+        """
+        return find_saves(
+            folder.absolutePath(),
+            self._mappings.saveExtensions.get(),
+            self._mappings.savesMaxDepth.get(),
+            self._mappings.savesPruneDirectories.get(),
+        )
+
+    def save_cache(self) -> SaveGameCache:
+        """
+        Retrieve the cache of the parsed saves of the game, stored in the folder of
+        the current profile.
+
+        Returns:
+            The save cache.
+        """
+        path = Path(self._organizer.profilePath(), SAVE_CACHE_NAME)
+        if self._save_cache is None or self._save_cache.path != path:
+            self._save_cache = SaveGameCache(path, self.gameShortName())
+        return self._save_cache
+
+    def _launcher_mappings(self) -> dict[str, BasicGameOptionsMapping[str]]:
+        return {
+            "steam": self._mappings.steamAPPId,
+            "gog": self._mappings.gogAPPId,
+            "origin": self._mappings.originManifestIds,
+            "epic": self._mappings.epicAPPId,
+            "eadesktop": self._mappings.eaDesktopContentId,
+        }
+
+    def _on_plugin_setting_changed(
+        self,
+        plugin_name: str,
+        setting: str,
+        old: mobase.MoVariant,
+        new: mobase.MoVariant,
+    ):
+        if plugin_name == self.name():
+            self.variables.invalidate()
+            self._mappings.cache.invalidate()
+
     def is_steam(self) -> bool:
         return self._mappings.steamAPPId.has_value()
 
@@ -443,6 +876,7 @@ class BasicGame(mobase.IPluginGame):
     def init(self, organizer: mobase.IOrganizer) -> bool:
         self._organizer = organizer
         self._featureMap[mobase.SaveGameInfo] = BasicGameSaveGameInfo()
+        self._organizer.onPluginSettingChanged(self._on_plugin_setting_changed)
         if self._mappings.originWatcherExecutables.get():
             from .origin_utils import OriginWatcher
 
@@ -581,11 +1015,7 @@ class BasicGame(mobase.IPluginGame):
         return []
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            BasicGameSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
-        ]
+        return [BasicGameSaveGame(path, stat) for path, stat in self.find_saves(folder)]
 
     def initializeProfile(
         self, directory: QDir, settings: mobase.ProfileSetting
@@ -629,26 +1059,17 @@ class BasicGame(mobase.IPluginGame):
 
     def setGamePath(self, path: Path | str) -> None:
         self._gamePath = str(path)
-
-        path = Path(path)
+        self.variables.invalidate()
+        self._mappings.cache.invalidate()
 
         # Check if we have a matching steam, GOG, Origin or EA Desktop id and set the
-        # index accordingly:
-        for steamid, steampath in BasicGame.steam_games.items():
-            if steampath == path:
-                self._mappings.steamAPPId.set_value(steamid)
-        for gogid, gogpath in BasicGame.gog_games.items():
-            if gogpath == path:
-                self._mappings.steamAPPId.set_value(gogid)
-        for originid, originpath in BasicGame.origin_games.items():
-            if originpath == path:
-                self._mappings.originManifestIds.set_value(originid)
-        for epicid, epicpath in BasicGame.epic_games.items():
-            if epicpath == path:
-                self._mappings.epicAPPId.set_value(epicid)
-        for eadesktopid, eadesktoppath in BasicGame.eadesktop_games.items():
-            if eadesktoppath == path:
-                self._mappings.eaDesktopContentId.set_value(eadesktopid)
+        # index accordingly (only launchers with IDs for this game are considered):
+        launcher_mappings = self._launcher_mappings()
+        stores = [
+            store for store, mapping in launcher_mappings.items() if mapping.get()
+        ]
+        for store, store_id in BasicGame.discovery.owners(path, stores):
+            launcher_mappings[store].set_value(store_id)
 
     def documentsDirectory(self) -> QDir:
         return self._mappings.documentsDirectory.get()
@@ -658,3 +1079,6 @@ class BasicGame(mobase.IPluginGame):
 
     def _featureList(self):
         return self._featureMap
+
+
+BasicGame.configure_discovery()
@@ -1,23 +1,98 @@
 # -*- encoding: utf-8 -*-
 
+from __future__ import annotations
+
 import configparser
+import hashlib
 import os
+import sys
+from pathlib import Path
 
 from .basic_game import BasicGame
+from .discovery_utils import ManifestCache, default_cache_directory
+
+# Compiled definitions of the INI games, stored with the other caches (the plugin
+# folder may not be writable), one per folder of INI files:
+INI_CACHE_NAME = "ini_games-{}.json"
+
+
+def default_ini_cache_path(directory: Path) -> Path:
+    """
+    Args:
+        directory: The directory containing the INI files.
+
+    Returns:
+        The path to the cache of the INI games of the given directory.
+    """
+    key = hashlib.sha1(os.path.normcase(directory.absolute()).encode("utf-8"))
+    return default_cache_directory().parent.joinpath(
+        INI_CACHE_NAME.format(key.hexdigest()[:16])
+    )
+
+
+def parse_ini_game(path: Path) -> dict[str, str]:
+    """
+    Read the definition of a game from an INI file.
+
+    Args:
+        path: Path to the INI file.
+
+    Returns:
+        The attributes of the game, from the DEFAULT section.
+    """
+    config = configparser.ConfigParser()
+    config.optionxform = str  # type: ignore
+    config.read(path)
+    return dict(config["DEFAULT"].items())
 
 
 class BasicIniGame(BasicGame):
-    def __init__(self, path: str):
+    def __init__(self, path: str, attributes: dict[str, str] | None = None):
         # Set the _fromName to get more "correct" errors:
         self._fromName = os.path.basename(path)
 
-        # Read the file:
-        config = configparser.ConfigParser()
-        config.optionxform = str  # type: ignore
-        config.read(path)
+        # Read the file, unless already parsed:
+        if attributes is None:
+            attributes = parse_ini_game(Path(path))
 
         # Just fill the class with values:
-        for k, v in config["DEFAULT"].items():
+        for k, v in attributes.items():
             setattr(self, k, v)
 
         super().__init__()
+
+    @staticmethod
+    def load_all(directory: Path, cache_path: Path | None = None) -> list[BasicIniGame]:
+        """
+        Create the games for all the INI files in the given directory.
+
+        The directory listing and the parsed definitions are kept in a single cache
+        file, so only new or modified INI files are parsed, and unchanged ones only
+        cost a stat.
+
+        Args:
+            directory: The directory containing the INI files.
+            cache_path (optional): Path to the cache file, `default_ini_cache_path()`
+                by default.
+
+        Returns:
+            The games that could be created.
+        """
+        if cache_path is None:
+            cache_path = default_ini_cache_path(directory)
+        cache = ManifestCache(cache_path)
+        cache.load()
+
+        games: list[BasicIniGame] = []
+        for path in cache.glob(directory, "*.ini"):
+            try:
+                attributes = cache.parse(path, parse_ini_game)
+                games.append(BasicIniGame(str(path), attributes))
+            except Exception as e:
+                print(
+                    "Failed to instantiate {}: {}".format(path.name, e),
+                    file=sys.stderr,
+                )
+
+        cache.save()
+        return games
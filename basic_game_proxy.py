@@ -0,0 +1,120 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import importlib
+import types
+from pathlib import Path
+from typing import Any
+
+import mobase
+from PyQt6.QtCore import QDir
+
+from .basic_game import BasicGame
+
+
+class BasicGameProxy(BasicGame):
+    """
+    Lightweight stand-in for a python game plugin listed in the plugin registry.
+
+    The proxy answers everything MO2 asks of the non-managed games (names, IDs,
+    detection, ...) from the registry attributes, and only imports the game module
+    when a method that depends on the actual plugin is called, e.g. when the game
+    is managed.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        """
+        Args:
+            module: Name of the game module, in the games folder.
+            class_name: Name of the game plugin class in the module.
+        """
+        self._fromName = class_name
+        self._module = module
+        self._class_name = class_name
+        self._plugin: BasicGame | None = None
+
+        super().__init__()
+
+    @staticmethod
+    def create(
+        module: str, class_name: str, attributes: dict[str, Any]
+    ) -> BasicGameProxy:
+        """
+        Create the proxy of a game plugin. The attributes are set on a dedicated
+        subclass, so they are validated once per class like the ones of the actual
+        plugin class.
+
+        Args:
+            module: Name of the game module, in the games folder.
+            class_name: Name of the game plugin class in the module.
+            attributes: Mapping attributes of the plugin, from the registry.
+
+        Returns:
+            The proxy.
+        """
+        proxy_class: type[BasicGameProxy] = types.new_class(
+            class_name, (BasicGameProxy,), exec_body=lambda ns: ns.update(attributes)
+        )
+        return proxy_class(module, class_name)
+
+    def _load(self) -> BasicGame:
+        if self._plugin is None:
+            module = importlib.import_module(f".games.{self._module}", __package__)
+            plugin: BasicGame = getattr(module, self._class_name)()
+            if hasattr(self, "_organizer"):
+                plugin.init(self._organizer)
+            if self._gamePath:
+                plugin.setGamePath(self._gamePath)
+            self._plugin = plugin
+        return self._plugin
+
+    # IPlugin interface:
+
+    def init(self, organizer: mobase.IOrganizer) -> bool:
+        # The actual plugin is initialized when loaded, the proxy only needs the
+        # organizer for that:
+        self._organizer = organizer
+        return True
+
+    # IPluginGame interface:
+
+    def setGamePath(self, path: Path | str) -> None:
+        super().setGamePath(path)
+        if self._plugin is not None:
+            self._plugin.setGamePath(path)
+
+    def dataDirectory(self) -> QDir:
+        return self._load().dataDirectory()
+
+    def documentsDirectory(self) -> QDir:
+        return self._load().documentsDirectory()
+
+    def executableForcedLoads(self) -> list[mobase.ExecutableForcedLoadSetting]:
+        return self._load().executableForcedLoads()
+
+    def executables(self) -> list[mobase.ExecutableInfo]:
+        return self._load().executables()
+
+    def gameVersion(self) -> str:
+        return self._load().gameVersion()
+
+    def iniFiles(self) -> list[str]:
+        return self._load().iniFiles()
+
+    def initializeProfile(
+        self, directory: QDir, settings: mobase.ProfileSetting
+    ) -> None:
+        self._load().initializeProfile(directory, settings)
+
+    def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
+        return self._load().listSaves(folder)
+
+    def savesDirectory(self) -> QDir:
+        return self._load().savesDirectory()
+
+    def setGameVariant(self, variant: str) -> None:
+        self._load().setGameVariant(variant)
+
+    def _featureList(self):
+        return self._load()._featureList()  # pyright: ignore[reportPrivateUsage]
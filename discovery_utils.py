@@ -0,0 +1,506 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+import fnmatch
+import importlib
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar, cast
+
+from PyQt6.QtCore import qDebug, qWarning
+
+GameFinder = Callable[[], dict[str, Path]]
+
+_T = TypeVar("_T")
+
+# Supported launchers, in the order games are looked up:
+LAUNCHERS = ("steam", "gog", "origin", "epic", "eadesktop")
+
+# Launchers whose backend supports a `ManifestCache` (GOG games are read from the
+# registry, there is nothing to cache):
+CACHED_LAUNCHERS = ("steam", "origin", "epic", "eadesktop")
+
+
+def normalize_path(path: Path | str) -> str:
+    """
+    Normalize a path so that equivalent paths compare equal: the path is made
+    absolute, separators and ".." are normalized and the case is folded. Links
+    are not resolved, as that requires a system call per path.
+
+    Args:
+        path: The path to normalize.
+
+    Returns:
+        The normalized path.
+    """
+    return os.path.normcase(os.path.abspath(path)).casefold()
+
+
+def default_cache_directory() -> Path:
+    """
+    Returns:
+        The folder containing the launcher discovery caches.
+    """
+    return Path(
+        os.environ.get("LOCALAPPDATA") or tempfile.gettempdir(),
+        "ModOrganizer",
+        "basic_games",
+        "discovery",
+    )
+
+
+class ManifestCache:
+    """
+    On-disk cache for the manifests parsed by a launcher backend (or any other
+    files parsed at startup, e.g. the INI game definitions).
+
+    Each parsed manifest is stored together with the size and modification time
+    of the file, and is only parsed again when these change. Directory listings
+    are cached the same way using the modification time of the directory, which
+    changes whenever an entry is added, removed or renamed in it.
+
+    Parsed values go through JSON, so parsers must return JSON-compatible values
+    (e.g. lists instead of tuples, str instead of Path).
+
+    Entries that are not used during a session are dropped when saving, so
+    manifests that disappear do not linger in the cache.
+    """
+
+    # Bump this when the format of the cache or of any parsed value changes:
+    VERSION = 1
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Path to the cache file. The cache is not loaded automatically.
+        """
+        self.path = path
+
+        self._entries: dict[str, Any] = {}
+        self._used: dict[str, Any] = {}
+        self._dirty = False
+
+    @staticmethod
+    def _fingerprint(path: Path | str) -> list[int]:
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def load(self) -> None:
+        """Load the cache from disk, starting empty if it is missing or invalid."""
+        try:
+            with open(self.path, "r", encoding="utf-8") as fp:
+                content = json.load(fp)
+            if content["version"] == ManifestCache.VERSION:
+                self._entries = content["entries"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            qWarning(f'Ignoring invalid cache "{self.path}": {e!r}')
+
+    def save(self) -> None:
+        """Write the entries used since the cache was loaded, if anything changed."""
+        if not self._dirty and self._used.keys() == self._entries.keys():
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump({"version": ManifestCache.VERSION, "entries": self._used}, fp)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            qWarning(f'Failed to write cache "{self.path}": {e!r}')
+
+    def _lookup(
+        self, key: str, fingerprint: list[int], compute: Callable[[], _T]
+    ) -> _T:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != fingerprint:
+            entry = [fingerprint, compute()]
+            self._entries[key] = entry
+            self._dirty = True
+        self._used[key] = entry
+        return cast(_T, entry[1])
+
+    def parse(self, filepath: Path, parser: Callable[[Path], _T]) -> _T:
+        """
+        Parse the given file, or retrieve the cached value if the file did not
+        change since it was last parsed.
+
+        Args:
+            filepath: Path of the file to parse.
+            parser: Function parsing the file. Exceptions raised by the parser
+                are propagated and nothing is cached.
+
+        Returns:
+            The value returned by the parser.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        return self._lookup(
+            "file:" + str(filepath),
+            self._fingerprint(filepath),
+            lambda: parser(filepath),
+        )
+
+    def listdir(self, directory: Path) -> list[tuple[str, bool]]:
+        """
+        List the entries of the given directory.
+
+        Args:
+            directory: The directory to list.
+
+        Returns:
+            A list of (name, is_dir) for each entry in the directory.
+
+        Raises:
+            FileNotFoundError: If the directory does not exist.
+        """
+
+        def scan() -> list[tuple[str, bool]]:
+            with os.scandir(directory) as it:
+                return [(entry.name, entry.is_dir()) for entry in it]
+
+        return [
+            (name, is_dir)
+            for name, is_dir in self._lookup(
+                "dir:" + str(directory), self._fingerprint(directory)[1:], scan
+            )
+        ]
+
+    def glob(
+        self, directory: Path, pattern: str, recursive: bool = False
+    ) -> list[Path]:
+        """
+        Find the files matching the given pattern in the given directory.
+
+        Args:
+            directory: The directory to search.
+            pattern: A pattern for the file names, as for `fnmatch`.
+            recursive: If True, also search the subdirectories.
+
+        Returns:
+            The list of matching files, or an empty list if the directory does not
+            exist.
+        """
+        files: list[Path] = []
+        try:
+            entries = self.listdir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            return files
+
+        for name, is_dir in entries:
+            if is_dir:
+                if recursive:
+                    files.extend(self.glob(directory.joinpath(name), pattern, True))
+            elif fnmatch.fnmatch(name, pattern):
+                files.append(directory.joinpath(name))
+        return files
+
+
+@dataclass
+class DiscoveryResult:
+    """
+    Outcome of running a single launcher backend.
+
+    Attributes:
+        store: Name of the launcher backend (e.g. "steam").
+        games: Mapping from store ID to install location, empty if the backend
+            failed or did not finish in time.
+        elapsed: Time spent in the backend, in seconds. For a backend that timed
+            out, this is the time since it started.
+        error: Exception raised by the backend, if any.
+        timed_out: True if the backend did not finish before the timeout.
+    """
+
+    store: str
+    games: dict[str, Path] = field(default_factory=dict[str, Path])
+    elapsed: float = 0.0
+    error: Exception | None = None
+    timed_out: bool = False
+
+    def __str__(self) -> str:
+        if self.timed_out:
+            status = "timed out"
+        elif self.error is not None:
+            status = f"failed ({self.error!r})"
+        else:
+            status = f"{len(self.games)} game(s)"
+        return f"{self.store}: {status} in {self.elapsed * 1000:.1f}ms"
+
+
+def run_finder(store: str, finder: GameFinder) -> DiscoveryResult:
+    """
+    Run a launcher backend, catching and recording any error.
+
+    Args:
+        store: Name of the launcher backend.
+        finder: The backend function.
+
+    Returns:
+        The result of the backend.
+    """
+    start = time.perf_counter()
+    try:
+        games = finder()
+        error = None
+    except Exception as e:
+        games = {}
+        error = e
+    return DiscoveryResult(store, games, time.perf_counter() - start, error)
+
+
+def cached_finder(
+    store: str,
+    finder: Callable[[ManifestCache], dict[str, Path]],
+    cache_directory: Path | None = None,
+) -> GameFinder:
+    """
+    Wrap a launcher backend supporting a manifest cache, loading the cache before
+    running the backend and saving it afterwards.
+
+    Args:
+        store: Name of the launcher backend, used for the name of the cache file.
+        finder: The backend function.
+        cache_directory: Folder containing the cache file, defaults to
+            `default_cache_directory()`.
+
+    Returns:
+        A backend function that does not take any argument.
+    """
+
+    def run() -> dict[str, Path]:
+        cache = ManifestCache(
+            (cache_directory or default_cache_directory()).joinpath(f"{store}.json")
+        )
+        cache.load()
+        games = finder(cache)
+        cache.save()
+        return games
+
+    return run
+
+
+def launcher_finder(store: str, use_cache: bool = True) -> GameFinder:
+    """
+    Create the backend function for one of the supported launchers. The backend
+    module (e.g. `steam_utils` for "steam") is only imported when the backend runs.
+
+    Args:
+        store: Name of the launcher, one of `LAUNCHERS`.
+        use_cache: If True and the launcher supports it, use a `ManifestCache`.
+
+    Returns:
+        The backend function.
+    """
+    module = f"{__package__}.{store}_utils" if __package__ else f"{store}_utils"
+
+    def find_games(cache: ManifestCache | None = None) -> dict[str, Path]:
+        games: dict[str, Path] = importlib.import_module(module).find_games(cache)
+        return games
+
+    if use_cache and store in CACHED_LAUNCHERS:
+        return cached_finder(store, find_games)
+    return find_games
+
+
+class GameDiscovery:
+    """
+    Run launcher backends on demand.
+
+    Each backend runs at most once, in its own daemon thread, the first time the
+    games of its launcher are requested (or when a prefetch is started). A backend
+    stuck on a slow or unreachable drive thus neither stalls the other backends
+    nor prevents the interpreter from exiting.
+
+    Each backend gets at most `timeout` seconds from its own start, after which
+    the launcher is treated as if no game was found, without waiting again on the
+    following requests. If the backend finishes later, its games are available
+    from then on.
+    """
+
+    def __init__(self, finders: Mapping[str, GameFinder], timeout: float | None):
+        """
+        Args:
+            finders: Mapping from store name to backend function.
+            timeout: Maximum time to wait for a backend, in seconds, or None to
+                wait indefinitely.
+        """
+        self.finders = dict(finders)
+        self.timeout = timeout
+
+        self._lock = threading.Lock()
+        self._threads: dict[str, threading.Thread] = {}
+        self._started: dict[str, float] = {}
+        self._results: dict[str, DiscoveryResult] = {}
+
+        # Reverse index, from normalized install location to (store, ID):
+        self._index: dict[str, list[tuple[str, str]]] = {}
+
+    @property
+    def results(self) -> dict[str, DiscoveryResult]:
+        """Results of the backends that ran so far, including timed out ones."""
+        return dict(self._results)
+
+    def _run(self, store: str) -> None:
+        result = run_finder(store, self.finders[store])
+        if result.error is not None:
+            print(
+                f"Failed to discover {store} games: {result.error!r}", file=sys.stderr
+            )
+        qDebug(f"Launcher discovery, {result}")
+
+        with self._lock:
+            for store_id, path in result.games.items():
+                self._index.setdefault(normalize_path(path), []).append(
+                    (store, store_id)
+                )
+            self._results[store] = result
+
+    def start(self, stores: Iterable[str] | None = None) -> None:
+        """
+        Start the backends for the given launchers, if not already started,
+        without waiting for them.
+
+        Args:
+            stores: Launchers to start, or None to start all of them.
+        """
+        with self._lock:
+            for store in self.finders if stores is None else stores:
+                if store in self._threads:
+                    continue
+                thread = threading.Thread(
+                    target=self._run,
+                    args=(store,),
+                    name=f"basic_games-discovery-{store}",
+                    daemon=True,
+                )
+                self._threads[store] = thread
+                self._started[store] = time.perf_counter()
+                thread.start()
+
+    def wait(self, stores: Iterable[str] | None = None) -> dict[str, DiscoveryResult]:
+        """
+        Start the backends for the given launchers if needed, and wait for them.
+
+        Args:
+            stores: Launchers to wait for, or None to wait for all of them.
+
+        Returns:
+            A mapping from store name to discovery result.
+        """
+        stores = list(self.finders if stores is None else stores)
+        self.start(stores)
+
+        for store in stores:
+            thread = self._threads[store]
+            if self.timeout is None:
+                thread.join()
+            else:
+                # Each backend has its own deadline, from its start:
+                deadline = self._started[store] + self.timeout
+                thread.join(max(0.0, deadline - time.perf_counter()))
+
+        results: dict[str, DiscoveryResult] = {}
+        for store in stores:
+            if (result := self._results.get(store)) is None:
+                # Keep the time out as result until the backend finishes, so that
+                # the next requests do not wait for it again:
+                elapsed = time.perf_counter() - self._started[store]
+                result = self._results.setdefault(
+                    store, DiscoveryResult(store, elapsed=elapsed, timed_out=True)
+                )
+                print(
+                    f"Discovery of {store} games did not finish after "
+                    f"{elapsed:.1f}s, ignoring it for now.",
+                    file=sys.stderr,
+                )
+            results[store] = result
+        return results
+
+    def games(self, store: str) -> dict[str, Path]:
+        """
+        Retrieve the games installed through the given launcher, running its
+        backend if needed.
+
+        Args:
+            store: Name of the launcher.
+
+        Returns:
+            A mapping from store ID to install location.
+        """
+        if (result := self._results.get(store)) is None:
+            result = self.wait([store])[store]
+        return result.games
+
+    def owners(
+        self, path: Path | str, stores: Iterable[str] | None = None
+    ) -> list[tuple[str, str]]:
+        """
+        Find the launcher entries installed at the given location, running the
+        backends of the given launchers if needed.
+
+        Args:
+            path: Install location to look up.
+            stores: Launchers to consider, or None to consider all of them.
+
+        Returns:
+            A list of (store, store ID) for each entry installed at the location,
+            in the order of the launchers.
+        """
+        stores = list(self.finders if stores is None else stores)
+        for store in stores:
+            if store not in self._results:
+                self.wait([store])
+
+        entries = self._index.get(normalize_path(path), [])
+        return sorted(
+            (entry for entry in entries if entry[0] in stores),
+            key=lambda entry: stores.index(entry[0]),
+        )
+
+    def stores(self, path: Path | str) -> list[str]:
+        """
+        Find the launchers owning the given install location, running all the
+        backends if needed.
+
+        Args:
+            path: Install location to look up.
+
+        Returns:
+            The names of the launchers with a game installed at the location.
+        """
+        return list(dict.fromkeys(store for store, _ in self.owners(path)))
+
+
+class LazyGames(Mapping[str, Path]):
+    """
+    Read-only mapping from store ID to install location for one launcher, that
+    only runs the launcher backend when first accessed.
+    """
+
+    def __init__(self, discovery: GameDiscovery, store: str):
+        self._discovery = discovery
+        self._store = store
+
+    def __getitem__(self, key: str) -> Path:
+        return self._discovery.games(self._store)[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._discovery.games(self._store)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._discovery.games(self._store))
+
+    def __len__(self) -> int:
+        return len(self._discovery.games(self._store))
+
+    def __repr__(self) -> str:
+        return f"LazyGames({self._store!r})"
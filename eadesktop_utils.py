@@ -1,24 +1,75 @@
 # -*- encoding: utf-8 -*-
 
+from __future__ import annotations
+
 import configparser
 import os
 import xml.etree.ElementTree as et
 from configparser import NoOptionError
 from pathlib import Path
-from typing import Dict
+from typing import TYPE_CHECKING, Dict
+
+from .variables_utils import expand_environment
+
+if TYPE_CHECKING:
+    from .discovery_utils import ManifestCache
+
+
+def parse_user_ini(user_ini: Path) -> str:
+    """
+    Read the install location of the games from the EA Desktop user settings.
+
+    Returns:
+        The path to the folder containing the installed games.
+    """
+    # The INI file in its current form has no section headers.
+    # So we wrangle the input to add it all under a fake section.
+    with open(user_ini) as f:
+        ini_content = "[mod_organizer]\n" + f.read()
+
+    config = configparser.ConfigParser()
+    config.read_string(ini_content)
+
+    try:
+        return config.get("mod_organizer", "user.downloadinplacedir")
+    except NoOptionError:
+        return str(Path(os.environ["ProgramW6432"]) / "EA Games")
+
 
+def parse_installer_data(installer_file: Path) -> str | None:
+    """
+    Read the content ID from an EA Desktop installer data file.
+
+    Returns:
+        The content ID, or None if the file does not contain one.
+    """
+    xml_tree = et.parse(installer_file)
+    root = xml_tree.getroot()
+
+    # For all manifest files the following XPath expression returns the
+    # numeric ID. There are, in some cases, also name IDs but we do not
+    # consider these.
+    content_id = root.find(".//contentIDs/contentID[1]")
 
-def find_games() -> Dict[str, Path]:
+    if content_id is not None and content_id.text:
+        return content_id.text
+    return None
+
+
+def find_games(cache: ManifestCache | None = None) -> Dict[str, Path]:
     """
     Find the list of EA Desktop games installed.
 
+    Args:
+        cache: Cache for the settings and installer data files.
+
     Returns:
         A mapping from EA Desktop content IDs to install locations for available
         EA Desktop games.
     """
     games: Dict[str, Path] = {}
 
-    local_app_data_path = os.path.expandvars("%LocalAppData%")
+    local_app_data_path = expand_environment("%LocalAppData%")
     ea_desktop_settings_path = Path(local_app_data_path).joinpath(
         "Electronic Arts", "EA Desktop"
     )
@@ -27,40 +78,39 @@ def find_games() -> Dict[str, Path]:
         return games
 
     try:
-        user_ini, *_ = list(ea_desktop_settings_path.glob("user_*.ini"))
+        if cache is None:
+            user_ini, *_ = list(ea_desktop_settings_path.glob("user_*.ini"))
+        else:
+            user_ini, *_ = cache.glob(ea_desktop_settings_path, "user_*.ini")
     except ValueError:
         return games
 
-    # The INI file in its current form has no section headers.
-    # So we wrangle the input to add it all under a fake section.
-    with open(user_ini) as f:
-        ini_content = "[mod_organizer]\n" + f.read()
-
-    config = configparser.ConfigParser()
-    config.read_string(ini_content)
-
-    try:
-        install_path = Path(config.get("mod_organizer", "user.downloadinplacedir"))
-    except NoOptionError:
-        install_path = Path(os.environ["ProgramW6432"]) / "EA Games"
-        config.set("mod_organizer", "user.downloadinplacedir", install_path.__str__())
+    if cache is None:
+        install_path = Path(parse_user_ini(user_ini))
+    else:
+        install_path = Path(cache.parse(user_ini, parse_user_ini))
 
     if not install_path.exists():
         return games
 
-    for game_dir in install_path.iterdir():
+    if cache is None:
+        game_dirs = list(install_path.iterdir())
+    else:
+        game_dirs = [
+            install_path.joinpath(name)
+            for name, is_dir in cache.listdir(install_path)
+            if is_dir
+        ]
+
+    for game_dir in game_dirs:
         try:
             installer_file = game_dir.joinpath("__Installer", "installerdata.xml")
-            xml_tree = et.parse(installer_file)
-            root = xml_tree.getroot()
-
-            # For all manifest files the following XPath expression returns the
-            # numeric ID. There are, in some cases, also name IDs but we do not
-            # consider these.
-            content_id = root.find(".//contentIDs/contentID[1]")
+            if cache is None:
+                game_id = parse_installer_data(installer_file)
+            else:
+                game_id = cache.parse(installer_file, parse_installer_data)
 
-            if content_id is not None and content_id.text:
-                game_id = content_id.text
+            if game_id:
                 games[game_id] = game_dir
         except FileNotFoundError:
             pass
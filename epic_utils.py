@@ -8,9 +8,38 @@ import sys
 import winreg
 from collections.abc import Iterable
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from .variables_utils import expand_environment
 
-def find_epic_games() -> Iterable[tuple[str, Path]]:
+if TYPE_CHECKING:
+    from .discovery_utils import ManifestCache
+
+
+def parse_epic_manifest(manifest_file_path: Path) -> list[str] | None:
+    """
+    Read an Epic Games manifest (*.item) file.
+
+    Returns:
+        The application name and install location, or None if the manifest is
+        invalid.
+    """
+    try:
+        with open(manifest_file_path, encoding="utf-8") as manifest_file:
+            manifest_file_data = json.load(manifest_file)
+        return [manifest_file_data["AppName"], manifest_file_data["InstallLocation"]]
+    except (json.JSONDecodeError, KeyError):
+        print(
+            "Unable to parse Epic Games manifest file",
+            manifest_file_path,
+            file=sys.stderr,
+        )
+        return None
+
+
+def find_epic_games(
+    cache: ManifestCache | None = None,
+) -> Iterable[tuple[str, Path]]:
     try:
         with winreg.OpenKey(
             winreg.HKEY_LOCAL_MACHINE,
@@ -20,24 +49,49 @@ def find_epic_games() -> Iterable[tuple[str, Path]]:
     except FileNotFoundError:
         return
 
-    manifests_path = Path(os.path.expandvars(epic_app_data_path)).joinpath("Manifests")
-    if manifests_path.exists():
-        for manifest_file_path in manifests_path.glob("*.item"):
-            try:
-                with open(manifest_file_path, encoding="utf-8") as manifest_file:
-                    manifest_file_data = json.load(manifest_file)
-                yield manifest_file_data["AppName"], Path(
-                    manifest_file_data["InstallLocation"]
-                )
-            except (json.JSONDecodeError, KeyError):
-                print(
-                    "Unable to parse Epic Games manifest file",
-                    manifest_file_path,
-                    file=sys.stderr,
-                )
-
-
-def find_legendary_games() -> Iterable[tuple[str, Path]]:
+    manifests_path = Path(expand_environment(epic_app_data_path)).joinpath("Manifests")
+    if cache is None:
+        manifests = [
+            parse_epic_manifest(manifest_file_path)
+            for manifest_file_path in manifests_path.glob("*.item")
+        ]
+    else:
+        manifests = [
+            cache.parse(manifest_file_path, parse_epic_manifest)
+            for manifest_file_path in cache.glob(manifests_path, "*.item")
+        ]
+
+    for manifest in manifests:
+        if manifest:
+            yield manifest[0], Path(manifest[1])
+
+
+def parse_legendary_installed(installed_path: Path) -> list[list[str]]:
+    """
+    Read the installed games from the Legendary installed.json file.
+
+    Returns:
+        The application name and install path of each installed game.
+    """
+    try:
+        with open(installed_path, encoding="utf-8") as installed_file:
+            installed_games = json.load(installed_file)
+        return [
+            [game["app_name"], game["install_path"]]
+            for game in installed_games.values()
+        ]
+    except (json.JSONDecodeError, AttributeError, KeyError):
+        print(
+            "Unable to parse installed games from Legendary",
+            installed_path,
+            file=sys.stderr,
+        )
+        return []
+
+
+def find_legendary_games(
+    cache: ManifestCache | None = None,
+) -> Iterable[tuple[str, Path]]:
     # Based on legendary source:
     # https://github.com/derrod/legendary/blob/master/legendary/lfs/lgndry.py
     if config_path := os.environ.get("XDG_CONFIG_HOME"):
@@ -47,21 +101,16 @@ def find_legendary_games() -> Iterable[tuple[str, Path]]:
 
     installed_path = legendary_config_path / "installed.json"
     if installed_path.exists():
-        try:
-            with open(installed_path, encoding="utf-8") as installed_file:
-                installed_games = json.load(installed_file)
-            for game in installed_games.values():
-                yield game["app_name"], Path(game["install_path"])
-        except (json.JSONDecodeError, AttributeError, KeyError):
-            print(
-                "Unable to parse installed games from Legendary",
-                installed_path,
-                file=sys.stderr,
-            )
-
-
-def find_games() -> dict[str, Path]:
-    return dict(itertools.chain(find_epic_games(), find_legendary_games()))
+        if cache is None:
+            installed_games = parse_legendary_installed(installed_path)
+        else:
+            installed_games = cache.parse(installed_path, parse_legendary_installed)
+        for app_name, install_path in installed_games:
+            yield app_name, Path(install_path)
+
+
+def find_games(cache: ManifestCache | None = None) -> dict[str, Path]:
+    return dict(itertools.chain(find_epic_games(cache), find_legendary_games(cache)))
 
 
 if __name__ == "__main__":
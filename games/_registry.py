@@ -0,0 +1,1060 @@
+# This file is generated by plugin_registry.py, do not edit it manually.
+
+from typing import Any
+
+REGISTRY: dict[str, dict[str, Any]] = {
+    "game_assettocorsa": {
+        "hash": "a04eb9e5b387e4b740bb0f069437fcf725de4eb8",
+        "plugins": [
+            {
+                "class": "AssettoCorsaGame",
+                "attributes": {
+                    "Name": "Assetto Corsa Support Plugin",
+                    "Author": "Deorder",
+                    "Version": "0.0.1",
+                    "GameName": "Assetto Corsa",
+                    "GameShortName": "ac",
+                    "GameBinary": "AssettoCorsa.exe",
+                    "GameDataPath": "",
+                    "GameSteamId": 244210,
+                    "GameDocumentsDirectory": "%DOCUMENTS%/Assetto Corsa",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Assetto-Corsa",
+                },
+            },
+        ],
+    },
+    "game_bladeandsorcery": {
+        "hash": "b1bba65cc1c5bd43869b081aef184cb6019153eb",
+        "plugins": [
+            {
+                "class": "BaSGame",
+                "attributes": {
+                    "Name": "Blade & Sorcery Plugin",
+                    "Author": "R3z Shark & Silarn",
+                    "Version": "0.5.0",
+                    "GameName": "Blade & Sorcery",
+                    "GameShortName": "bladeandsorcery",
+                    "GameBinary": "BladeAndSorcery.exe",
+                    "GameDataPath": "BladeAndSorcery_Data\\\\StreamingAssets\\\\Mods",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/My Games/BladeAndSorcery",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/Saves/Default",
+                    "GameSaveExtension": "chr",
+                    "GameSavesMaxDepth": 0,
+                    "GameSteamId": 629730,
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Blade-&-Sorcery",
+                },
+            },
+        ],
+    },
+    "game_control": {
+        "hash": "309b9bbe2a9c7408e7a82ba53640c4774cd2387a",
+        "plugins": [
+            {
+                "class": "ControlGame",
+                "attributes": {
+                    "Name": "Control Support Plugin",
+                    "Author": "Zash",
+                    "Version": "1.0.0",
+                    "GameName": "Control",
+                    "GameShortName": "control",
+                    "GameNexusId": 2936,
+                    "GameSteamId": 870780,
+                    "GameGogId": 2049187585,
+                    "GameBinary": "Control.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_daggerfallunity": {
+        "hash": "76619f4a22148ec6d30b3dbd4d713059b04fbd86",
+        "plugins": [
+            {
+                "class": "DaggerfallUnityGame",
+                "attributes": {
+                    "Name": "Daggerfall Unity Support Plugin",
+                    "Author": "HomerSimpleton",
+                    "Version": "1.0.0",
+                    "GameName": "Daggerfall Unity",
+                    "GameShortName": "daggerfallunity",
+                    "GameBinary": "DaggerfallUnity.exe",
+                    "GameLauncher": "DaggerfallUnity.exe",
+                    "GameDataPath": "%GAME_PATH%/DaggerfallUnity_Data/StreamingAssets",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Daggerfall-Unity",
+                },
+            },
+        ],
+    },
+    "game_dao": {
+        "hash": "dab36ab4f775e496ba8b0343ac1f9f605bddb281",
+        "plugins": [
+            {
+                "class": "DAOriginsGame",
+                "attributes": {
+                    "Name": "Dragon Age Origins Support Plugin",
+                    "Author": "Patchier",
+                    "Version": "1.1.1",
+                    "GameName": "Dragon Age: Origins",
+                    "GameShortName": "dragonage",
+                    "GameBinary": "bin_ship\\DAOrigins.exe",
+                    "GameDataPath": "%DOCUMENTS%\\BioWare\\Dragon Age\\packages\\core\\override",
+                    "GameSavesDirectory": "%DOCUMENTS%\\BioWare\\Dragon Age\\Characters",
+                    "GameSaveExtension": "das",
+                    "GameSteamId": [
+                        17450,
+                        47810,
+                    ],
+                    "GameGogId": 1949616134,
+                    "GameEaDesktopId": [
+                        70377,
+                        70843,
+                    ],
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dragon-Age:-Origins",
+                },
+            },
+        ],
+    },
+    "game_darkestdungeon": {
+        "hash": "c76915515c7d41fd8a85cda8b89a906140bb212a",
+        "plugins": [
+            {
+                "class": "DarkestDungeonGame",
+                "attributes": {
+                    "Name": "DarkestDungeon",
+                    "Author": "erri120",
+                    "Version": "0.2.0",
+                    "GameName": "Darkest Dungeon",
+                    "GameShortName": "darkestdungeon",
+                    "GameNexusName": "darkestdungeon",
+                    "GameNexusId": 804,
+                    "GameSteamId": 262060,
+                    "GameGogId": 1719198803,
+                    "GameBinary": "_windowsnosteam//darkest.exe",
+                    "GameDataPath": "",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Darkest-Dungeon",
+                },
+            },
+        ],
+    },
+    "game_darkmessiahofmightandmagic": {
+        "hash": "fa7ca3d7fe06e00b26b3e2cfd273695d8d5dac7f",
+        "plugins": [
+            {
+                "class": "DarkMessiahOfMightAndMagicGame",
+                "attributes": {
+                    "Name": "Dark Messiah of Might and Magic Support Plugin",
+                    "Author": "Holt59",
+                    "Version": "0.1.0",
+                    "GameName": "Dark Messiah of Might & Magic",
+                    "GameShortName": "darkmessiahofmightandmagic",
+                    "GameNexusName": "darkmessiahofmightandmagic",
+                    "GameNexusId": 628,
+                    "GameSteamId": 2100,
+                    "GameBinary": "mm.exe",
+                    "GameDataPath": "mm",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dark-Messiah-of-Might-&-Magic",
+                    "GameDocumentsDirectory": "%GAME_PATH%/mm",
+                    "GameSavesDirectory": "%GAME_PATH%/mm/SAVE",
+                    "GameSaveExtension": "sav",
+                },
+            },
+        ],
+    },
+    "game_darksouls": {
+        "hash": "ac94c8887cfc0b4687c05d1de7b45a92860ddbff",
+        "plugins": [
+            {
+                "class": "DarkSoulsGame",
+                "attributes": {
+                    "Name": "DarkSouls",
+                    "Author": "Holt59",
+                    "Version": "0.1.0",
+                    "GameName": "Dark Souls",
+                    "GameShortName": "darksouls",
+                    "GameNexusName": "darksouls",
+                    "GameNexusId": 162,
+                    "GameSteamId": 211420,
+                    "GameBinary": "DATA/DARKSOULS.exe",
+                    "GameDataPath": "DATA",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/NBGI/DarkSouls",
+                    "GameSavesDirectory": "%DOCUMENTS%/NBGI/DarkSouls",
+                    "GameSaveExtension": "sl2",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dark-Souls",
+                },
+            },
+        ],
+    },
+    "game_divinityoriginalsin": {
+        "hash": "fe8c661cbb39e2d2da5f1143f54d182ce03dfce3",
+        "plugins": [
+            {
+                "class": "DivinityOriginalSinGame",
+                "attributes": {
+                    "Name": "Divinity: Original Sin (Classic) Support Plugin",
+                    "Author": "LostDragonist",
+                    "Version": "1.0.0",
+                    "GameName": "Divinity: Original Sin (Classic)",
+                    "GameShortName": "divinityoriginalsin",
+                    "GameNexusName": "divinityoriginalsin",
+                    "GameValidShortNames": [
+                        "divinityoriginalsin",
+                    ],
+                    "GameNexusId": 573,
+                    "GameSteamId": [
+                        230230,
+                    ],
+                    "GameBinary": "Shipping/EoCApp.exe",
+                    "GameDataPath": "Data",
+                    "GameSaveExtension": "lsv",
+                    "GameDocumentsDirectory": "%USERPROFILE%/Documents/Larian Studios/Divinity Original Sin",
+                    "GameSavesDirectory": "%USERPROFILE%/Documents/Larian Studios/Divinity Original Sin/PlayerProfiles",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Divinity:-Original-Sin",
+                },
+            },
+        ],
+    },
+    "game_dragonsdogmadarkarisen": {
+        "hash": "b67e14bda61927b7b990beecc82d4416b3d1fbd3",
+        "plugins": [
+            {
+                "class": "NoMansSkyGame",
+                "attributes": {
+                    "Name": "Dragon's Dogma: Dark Arisen Support Plugin",
+                    "Author": "Luca/EzioTheDeadPoet",
+                    "Version": "1.0.0",
+                    "GameName": "Dragon's Dogma: Dark Arisen",
+                    "GameShortName": "dragonsdogma",
+                    "GameSteamId": 367500,
+                    "GameGogId": 1242384383,
+                    "GameBinary": "DDDA.exe",
+                    "GameDataPath": "nativePC",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dragon's-Dogma:-Dark-Arisen",
+                },
+            },
+        ],
+    },
+    "game_dungeonsiege1": {
+        "hash": "0c6da983a8ba8e561fd76a5c4e16a2d7230dd25f",
+        "plugins": [
+            {
+                "class": "DungeonSiegeIGame",
+                "attributes": {
+                    "Name": "Dungeon Siege I",
+                    "Author": "mrudat",
+                    "Version": "0.0.1",
+                    "GameName": "Dungeon Siege I",
+                    "GameShortName": "dungeonsiege1",
+                    "GameNexusName": "dungeonsiege1",
+                    "GameNexusId": 541,
+                    "GameSteamId": [
+                        39190,
+                    ],
+                    "GameGogId": [
+                        1142020247,
+                    ],
+                    "GameBinary": "DungeonSiege.exe",
+                    "GameDataPath": "",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/Save",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/Dungeon Siege",
+                    "GameSaveExtension": "dssave",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dungeon-Siege-I",
+                },
+            },
+        ],
+    },
+    "game_dungeonsiege2": {
+        "hash": "98a0e7760c82e2f33e445e39932158a6db51fe98",
+        "plugins": [
+            {
+                "class": "DungeonSiegeIIGame",
+                "attributes": {
+                    "Name": "Dungeon Siege II",
+                    "Author": "Holt59",
+                    "Version": "0.1.1",
+                    "GameName": "Dungeon Siege II",
+                    "GameShortName": "dungeonsiegeii",
+                    "GameNexusName": "dungeonsiegeii",
+                    "GameNexusId": 2078,
+                    "GameSteamId": [
+                        39200,
+                    ],
+                    "GameGogId": [
+                        1142020247,
+                    ],
+                    "GameBinary": "DungeonSiege2.exe",
+                    "GameDataPath": "",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/Save",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/My Games/Dungeon Siege 2",
+                    "GameSaveExtension": "ds2party",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Dungeon-Siege-II",
+                },
+            },
+        ],
+    },
+    "game_f123": {
+        "hash": "adc2adf2f21fc8d7ae3929f52c3f99a33055bb18",
+        "plugins": [
+            {
+                "class": "F123Game",
+                "attributes": {
+                    "Name": "F1 23 Support Plugin",
+                    "Author": "ju5tA1ex",
+                    "Version": "1.0.0",
+                    "GameName": "F1 23",
+                    "GameShortName": "F1 23",
+                    "GameSteamId": 2108330,
+                    "GameBinary": "F1_23.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_gta-3-de": {
+        "hash": "9d9d5ddf6631fab31fcf996e81a725fd7a6c724a",
+        "plugins": [
+            {
+                "class": "GTA3DefinitiveEditionGame",
+                "attributes": {
+                    "Name": "Grand Theft Auto III - Definitive Edition Support Plugin",
+                    "Author": "dekart811",
+                    "Version": "1.0",
+                    "GameName": "GTA III - Definitive Edition",
+                    "GameShortName": "grandtheftautothetrilogy",
+                    "GameNexusName": "grandtheftautothetrilogy",
+                    "GameBinary": "Gameface/Binaries/Win64/LibertyCity.exe",
+                    "GameDataPath": "Gameface/Content/Paks/~mods",
+                    "GameDocumentsDirectory": "%USERPROFILE%/Documents/Rockstar Games/GTA III Definitive Edition/Config/WindowsNoEditor",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/../../SaveGames",
+                    "GameSaveExtension": "sav",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Grand-Theft-Auto:-The-Trilogy-%E2%80%90-The-Definitive-Edition",
+                },
+            },
+        ],
+    },
+    "game_gta-san-andreas-de": {
+        "hash": "566d06996b0ae1874447231999510ecf80fe9100",
+        "plugins": [
+            {
+                "class": "GTASanAndreasDefinitiveEditionGame",
+                "attributes": {
+                    "Name": "Grand Theft Auto: San Andreas - Definitive Edition Support Plugin",
+                    "Author": "dekart811",
+                    "Version": "1.0",
+                    "GameName": "GTA: San Andreas - Definitive Edition",
+                    "GameShortName": "grandtheftautothetrilogy",
+                    "GameNexusName": "grandtheftautothetrilogy",
+                    "GameBinary": "Gameface/Binaries/Win64/SanAndreas.exe",
+                    "GameDataPath": "Gameface/Content/Paks/~mods",
+                    "GameDocumentsDirectory": "%USERPROFILE%/Documents/Rockstar Games/GTA San Andreas Definitive Edition/Config/WindowsNoEditor",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/../../SaveGames",
+                    "GameSaveExtension": "sav",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Grand-Theft-Auto:-The-Trilogy-%E2%80%90-The-Definitive-Edition",
+                },
+            },
+        ],
+    },
+    "game_gta-vice-city-de": {
+        "hash": "78f999af464e32f07d6e2b1349395312f5449219",
+        "plugins": [
+            {
+                "class": "GTAViceCityDefinitiveEditionGame",
+                "attributes": {
+                    "Name": "Grand Theft Auto: Vice City - Definitive Edition Support Plugin",
+                    "Author": "dekart811",
+                    "Version": "1.0",
+                    "GameName": "GTA: Vice City - Definitive Edition",
+                    "GameShortName": "grandtheftautothetrilogy",
+                    "GameNexusName": "grandtheftautothetrilogy",
+                    "GameBinary": "Gameface/Binaries/Win64/ViceCity.exe",
+                    "GameDataPath": "Gameface/Content/Paks/~mods",
+                    "GameDocumentsDirectory": "%USERPROFILE%/Documents/Rockstar Games/GTA Vice City Definitive Edition/Config/WindowsNoEditor",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/../../SaveGames",
+                    "GameSaveExtension": "sav",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Grand-Theft-Auto:-The-Trilogy-%E2%80%90-The-Definitive-Edition",
+                },
+            },
+        ],
+    },
+    "game_kerbalspaceprogram": {
+        "hash": "c94393ea3dec28d96145437917d09e9a84159986",
+        "plugins": [
+            {
+                "class": "KerbalSpaceProgramGame",
+                "attributes": {
+                    "Name": "Kerbal Space Program Support Plugin",
+                    "Author": "LaughingHyena",
+                    "Version": "1.0.0",
+                    "GameName": "Kerbal Space Program",
+                    "GameShortName": "kerbalspaceprogram",
+                    "GameNexusName": "kerbalspaceprogram",
+                    "GameSteamId": [
+                        220200,
+                        283740,
+                        982970,
+                    ],
+                    "GameBinary": "KSP_x64.exe",
+                    "GameDataPath": "GameData",
+                    "GameSavesDirectory": "%GAME_PATH%/saves",
+                    "GameSaveExtension": "sfs",
+                    "GameSavesMaxDepth": 1,
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Kerbal-Space-Program",
+                },
+            },
+        ],
+    },
+    "game_kingdomcomedeliverance": {
+        "hash": "b40a8f3fea11b854b0e7d02dfc2b9b46de3ae0c0",
+        "plugins": [
+            {
+                "class": "KingdomComeDeliveranceGame",
+                "attributes": {
+                    "Name": "Kingdom Come Deliverance Support Plugin",
+                    "Author": "Silencer711",
+                    "Version": "1.0.0",
+                    "GameName": "Kingdom Come: Deliverance",
+                    "GameShortName": "kingdomcomedeliverance",
+                    "GameNexusName": "kingdomcomedeliverance",
+                    "GameNexusId": 2298,
+                    "GameSteamId": [
+                        379430,
+                    ],
+                    "GameGogId": [
+                        1719198803,
+                    ],
+                    "GameEpicId": "Eel",
+                    "GameBinary": "bin/Win64/KingdomCome.exe",
+                    "GameDataPath": "mods",
+                    "GameSaveExtension": "whs",
+                    "GameDocumentsDirectory": "%GAME_PATH%",
+                    "GameSavesDirectory": "%USERPROFILE%/Saved Games/kingdomcome/saves",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Kingdom-Come:-Deliverance",
+                },
+            },
+        ],
+    },
+    "game_metalgearsolid2mc": {
+        "hash": "a1cf9c11a372adb6d71d3e0c931dd5497f184423",
+        "plugins": [
+            {
+                "class": "MetalGearSolid2MCGame",
+                "attributes": {
+                    "Name": "METAL GEAR SOLID 2: Sons of Liberty - Master Collection Version Support Plugin",
+                    "Author": "AkiraJkr",
+                    "Version": "1.0.0",
+                    "GameName": "METAL GEAR SOLID 2: Sons of Liberty - Master Collection Version",
+                    "GameShortName": "metalgearsolid2mc",
+                    "GameNexusName": "metalgearsolid2mc",
+                    "GameSteamId": 2131640,
+                    "GameBinary": "METAL GEAR SOLID2.exe",
+                    "GameDataPath": "",
+                    "GameLauncher": "launcher.exe",
+                },
+            },
+        ],
+    },
+    "game_metalgearsolid3mc": {
+        "hash": "6fc20c6dfe5baa7b93f94afd17c5e3244116da39",
+        "plugins": [
+            {
+                "class": "MetalGearSolid3MCGame",
+                "attributes": {
+                    "Name": "METAL GEAR SOLID 3: Snake Eater - Master Collection Version Support Plugin",
+                    "Author": "AkiraJkr",
+                    "Version": "1.0.0",
+                    "GameName": "METAL GEAR SOLID 3: Snake Eater - Master Collection Version",
+                    "GameShortName": "metalgearsolid3mc",
+                    "GameNexusName": "metalgearsolid3mc",
+                    "GameSteamId": 2131650,
+                    "GameBinary": "METAL GEAR SOLID3.exe",
+                    "GameDataPath": "",
+                    "GameLauncher": "launcher.exe",
+                },
+            },
+        ],
+    },
+    "game_mirrorsedge": {
+        "hash": "501d88e4122b28c78b103119f91adfd5f2710c1e",
+        "plugins": [
+            {
+                "class": "MirrorsEdgeGame",
+                "attributes": {
+                    "Name": "Mirror's Edge Support Plugin",
+                    "Author": "Luca/EzioTheDeadPoet",
+                    "Version": "1.0.0",
+                    "GameName": "Mirror's Edge",
+                    "GameShortName": "mirrorsedge",
+                    "GameSteamId": 17410,
+                    "GameGogId": 1893001152,
+                    "GameBinary": "Binaries/MirrorsEdge.exe",
+                    "GameDataPath": "TdGame",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Mirror's-Edge",
+                },
+            },
+        ],
+    },
+    "game_monsterhunterrise": {
+        "hash": "997292e9ebfb0635e0d5d1683ef798bc34fd1316",
+        "plugins": [
+            {
+                "class": "MonsterHunterRiseGame",
+                "attributes": {
+                    "Name": "Monster Hunter: Rise Support Plugin",
+                    "Author": "RodolfoFigueroa",
+                    "Version": "1.0.0",
+                    "GameName": "Monster Hunter: Rise",
+                    "GameShortName": "monsterhunterrise",
+                    "GameBinary": "MonsterHunterRise.exe",
+                    "GameDataPath": "%GAME_PATH%",
+                    "GameSaveExtension": "bin",
+                    "GameNexusId": 4095,
+                    "GameSteamId": 1446780,
+                },
+            },
+        ],
+    },
+    "game_monsterhunterworld": {
+        "hash": "d961b79a3449f3ce745782797ebee27c96426314",
+        "plugins": [
+            {
+                "class": "MonsterHunterWorldGame",
+                "attributes": {
+                    "Name": "Monster Hunter: World Support Plugin",
+                    "Author": "prz",
+                    "Version": "1.0.0",
+                    "GameName": "Monster Hunter: World",
+                    "GameShortName": "monsterhunterworld",
+                    "GameNexusName": "monsterhunterworld",
+                    "GameNexusId": 2531,
+                    "GameBinary": "MonsterHunterWorld.exe",
+                    "GameLauncher": "MonsterHunterWorld.exe",
+                    "GameDataPath": "%GAME_PATH%",
+                    "GameSaveExtension": "dat",
+                    "GameSteamId": 582010,
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Monster-Hunter:-World",
+                },
+            },
+        ],
+    },
+    "game_mountandblade2": {
+        "hash": "ae943166b4d97d7a17b04c39934809a1df07c155",
+        "plugins": [
+            {
+                "class": "MountAndBladeIIGame",
+                "attributes": {
+                    "Name": "Mount & Blade II: Bannerlord",
+                    "Author": "Holt59",
+                    "Version": "0.1.0",
+                    "Description": "Adds support for Mount & Blade II: Bannerlord",
+                    "GameName": "Mount & Blade II: Bannerlord",
+                    "GameShortName": "mountandblade2bannerlord",
+                    "GameDataPath": "Modules",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Mount-&-Blade-II:-Bannerlord",
+                    "GameBinary": "bin/Win64_Shipping_Client/TaleWorlds.MountAndBlade.Launcher.exe",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/Mount and Blade II Bannerlord/Configs",
+                    "GameSaveExtension": "sav",
+                    "GameSavesDirectory": "%DOCUMENTS%/Mount and Blade II Bannerlord/Game Saves/Native",
+                    "GameNexusId": 3174,
+                    "GameSteamId": 261550,
+                },
+            },
+        ],
+    },
+    "game_msfs2020": {
+        "hash": "86c6e37a8748ea20c92cda1bc3aa119a4ccafac2",
+        "plugins": [
+            {
+                "class": "MSFS2020Game",
+                "attributes": {
+                    "Name": "Microsoft Flight Simulator 2020 Support Plugin",
+                    "Author": "Deorder",
+                    "Version": "0.0.1",
+                    "GameName": "Microsoft Flight Simulator 2020",
+                    "GameShortName": "msfs2020",
+                    "GameBinary": "FlightSimulator.exe",
+                    "GameSteamId": [
+                        1250410,
+                    ],
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Microsoft-Flight-Simulator-(2020)",
+                },
+            },
+        ],
+    },
+    "game_nfshs": {
+        "hash": "e4b9073d1619f4c0711c24db44150cf3523b5a82",
+        "plugins": [
+            {
+                "class": "NFSHSGame",
+                "attributes": {
+                    "Name": "Need for Speed: High Stakes Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Need for Speed: High Stakes",
+                    "GameShortName": "nfshs",
+                    "GameNexusName": "needforspeedhighstakes",
+                    "GameNexusId": 6032,
+                    "GameBinary": "nfshs.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_nierautomata": {
+        "hash": "944d3054242756142240d37ee54774cf94bdc9e9",
+        "plugins": [
+            {
+                "class": "NierAutomataGame",
+                "attributes": {
+                    "Name": "NieR:Automata Support Plugin",
+                    "Author": "Luca/EzioTheDeadPoet",
+                    "Version": "1.0.0",
+                    "GameName": "NieR:Automata",
+                    "GameShortName": "nierautomata",
+                    "GameSteamId": 524220,
+                    "GameBinary": "NieRAutomata.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_nomanssky": {
+        "hash": "e7c3a8e5f8528afb0fba197f3791d3f584e3e6b0",
+        "plugins": [
+            {
+                "class": "NoMansSkyGame",
+                "attributes": {
+                    "Name": "No Man's Sky Support Plugin",
+                    "Author": "Luca/EzioTheDeadPoet",
+                    "Version": "1.0.0",
+                    "GameName": "No Man's Sky",
+                    "GameShortName": "nomanssky",
+                    "GameNexusName": "nomanssky",
+                    "GameNexusId": 1634,
+                    "GameSteamId": 275850,
+                    "GameGogId": 1446213994,
+                    "GameBinary": "Binaries/NMS.exe",
+                    "GameDataPath": "GAMEDATA/PCBANKS/MODS",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-No-Man's-Sky",
+                },
+            },
+        ],
+    },
+    "game_sekiroshadowsdietwice": {
+        "hash": "b271957cbbe4fa728ce239e3c2daf51024b57c81",
+        "plugins": [
+            {
+                "class": "SekiroShadowsDieTwiceGame",
+                "attributes": {
+                    "Name": "Sekiro: Shadows Die Twice Support Plugin",
+                    "Author": "Kane Dou",
+                    "Version": "1.0.0",
+                    "GameName": "Sekiro: Shadows Die Twice",
+                    "GameShortName": "sekiro",
+                    "GameBinary": "sekiro.exe",
+                    "GameDataPath": "mods",
+                    "GameSaveExtension": "sl2",
+                    "GameSteamId": 814380,
+                },
+            },
+        ],
+    },
+    "game_stardewvalley": {
+        "hash": "57fd5d131c83299de5e2c20eea99fb04b46c3454",
+        "plugins": [
+            {
+                "class": "StardewValleyGame",
+                "attributes": {
+                    "Name": "Stardew Valley Support Plugin",
+                    "Author": "Syer10",
+                    "Version": "0.1.0a",
+                    "GameName": "Stardew Valley",
+                    "GameShortName": "stardewvalley",
+                    "GameNexusName": "stardewvalley",
+                    "GameNexusId": 1303,
+                    "GameSteamId": 413150,
+                    "GameGogId": 1453375253,
+                    "GameBinary": "Stardew Valley.exe",
+                    "GameDataPath": "mods",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/StardewValley",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/Saves",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Stardew-Valley",
+                },
+            },
+        ],
+    },
+    "game_starsector": {
+        "hash": "109f94663b53c95e77af9de8611f510a6ce6e249",
+        "plugins": [
+            {
+                "class": "Starsector",
+                "attributes": {
+                    "Name": "Starsector Support Plugin",
+                    "Author": "ddbb07",
+                    "Version": "1.0.1",
+                    "GameName": "Starsector",
+                    "GameShortName": "starsector",
+                    "GameNexusName": "starsector",
+                    "GameBinary": "starsector.exe",
+                    "GameDataPath": "mods",
+                    "GameSavesDirectory": "%GAME_PATH%/saves",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Starsector",
+                },
+            },
+        ],
+    },
+    "game_starwars-empire-at-war-foc": {
+        "hash": "945898ff4621eecbb50ffcd90bf8f8e8b38d574e",
+        "plugins": [
+            {
+                "class": "StarWarsEmpireAtWarGame",
+                "attributes": {
+                    "Name": "STAR WARS Empire at War - Force of Corruption",
+                    "Author": "erri120",
+                    "Version": "1.0.0",
+                    "GameName": "STAR WARS™ Empire at War: Forces of Corruption",
+                    "GameShortName": "starwarsempireatwar",
+                    "GameNexusName": "starwarsempireatwar",
+                    "GameNexusId": 453,
+                    "GameSteamId": 32470,
+                    "GameGogId": 1421404887,
+                    "GameBinary": "corruption/StarWarsG.exe",
+                    "GameDataPath": "corruption/Data",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Star-Wars:-Empire-At-War",
+                },
+            },
+        ],
+    },
+    "game_starwars-empire-at-war": {
+        "hash": "e6db7eacb19643e2b815051e2252a28c078d3f95",
+        "plugins": [
+            {
+                "class": "StarWarsEmpireAtWarGame",
+                "attributes": {
+                    "Name": "STAR WARS Empire at War",
+                    "Author": "erri120",
+                    "Version": "1.0.0",
+                    "GameName": "STAR WARS™ Empire at War",
+                    "GameShortName": "starwarsempireatwar",
+                    "GameNexusName": "starwarsempireatwar",
+                    "GameNexusId": 453,
+                    "GameSteamId": 32470,
+                    "GameGogId": 1421404887,
+                    "GameBinary": "GameData/StarWarsG.exe",
+                    "GameDataPath": "GameData/Data",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Star-Wars:-Empire-At-War",
+                },
+            },
+        ],
+    },
+    "game_tdu": {
+        "hash": "5619aa9cc0aae3444477ba6bca8c4069c94f9996",
+        "plugins": [
+            {
+                "class": "TDUGame",
+                "attributes": {
+                    "Name": "Test Drive Unlimited Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Test Drive Unlimited",
+                    "GameShortName": "tdu",
+                    "GameNexusName": "testdriveunlimited",
+                    "GameNexusId": 4615,
+                    "GameBinary": "TestDriveUnlimited.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_tdu2": {
+        "hash": "80c77d747ba99441dec168e109f67f346ca47c74",
+        "plugins": [
+            {
+                "class": "TDU2Game",
+                "attributes": {
+                    "Name": "Test Drive Unlimited 2 Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Test Drive Unlimited 2",
+                    "GameShortName": "tdu2",
+                    "GameNexusName": "testdriveunlimited2",
+                    "GameNexusId": 2353,
+                    "GameSteamId": 9930,
+                    "GameBinary": "UpLauncher.exe",
+                    "GameDataPath": "",
+                },
+            },
+        ],
+    },
+    "game_thebindingofisaacrebirth": {
+        "hash": "b7f66321f6dc3b2214039d0c7ec9a2343ef89b19",
+        "plugins": [
+            {
+                "class": "TheBindingOfIsaacRebirthGame",
+                "attributes": {
+                    "Name": "The Binding of Isaac: Rebirth - Support Plugin",
+                    "Author": "Luca/EzioTheDeadPoet",
+                    "Version": "0.1.0",
+                    "GameName": "The Binding of Isaac: Rebirth",
+                    "GameShortName": "thebindingofisaacrebirth",
+                    "GameNexusName": "thebindingofisaacrebirth",
+                    "GameNexusId": 1293,
+                    "GameSteamId": 250900,
+                    "GameBinary": "isaac-ng.exe",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/My Games/Binding of Isaac Afterbirth+",
+                    "GameDataPath": "%DOCUMENTS%/My Games/Binding of Isaac Afterbirth+ Mods",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-The-Binding-of-Isaac:-Rebirth",
+                },
+            },
+        ],
+    },
+    "game_thps3": {
+        "hash": "f81ec9c58d6996405cbd09f5f2940e9b66e97c7e",
+        "plugins": [
+            {
+                "class": "THPS3Game",
+                "attributes": {
+                    "Name": "Tony Hawk's Pro Skater 3 Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Tony Hawk's Pro Skater 3",
+                    "GameShortName": "thps3",
+                    "GameBinary": "Skate3.exe",
+                    "GameDataPath": "Data",
+                },
+            },
+        ],
+    },
+    "game_thps4": {
+        "hash": "2b53720ba87a4812e7351431ffb0ad1f62640b2e",
+        "plugins": [
+            {
+                "class": "THPS4Game",
+                "attributes": {
+                    "Name": "Tony Hawk's Pro Skater 4 Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Tony Hawk's Pro Skater 4",
+                    "GameShortName": "thps4",
+                    "GameBinary": "Skate4.exe",
+                    "GameDataPath": "Data",
+                },
+            },
+        ],
+    },
+    "game_thug": {
+        "hash": "f56dab4c7fa26e6b2d53a3a33aa6b8a14c1d23fc",
+        "plugins": [
+            {
+                "class": "THPS4Game",
+                "attributes": {
+                    "Name": "Tony Hawk's Underground Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Tony Hawk's Underground",
+                    "GameShortName": "thug",
+                    "GameBinary": "THUG.exe",
+                    "GameDataPath": "Data",
+                },
+            },
+        ],
+    },
+    "game_thug2": {
+        "hash": "b3d5304c0bbc8bde622681856229bbb7343b2829",
+        "plugins": [
+            {
+                "class": "THPS4Game",
+                "attributes": {
+                    "Name": "Tony Hawk's Underground 2 Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "GameName": "Tony Hawk's Underground 2",
+                    "GameShortName": "thug2",
+                    "GameBinary": "THUG2.exe",
+                    "GameDataPath": "Data",
+                },
+            },
+        ],
+    },
+    "game_tmuf": {
+        "hash": "6108deb8af6ad82274c549c22268cac82ec0cdab",
+        "plugins": [
+            {
+                "class": "TmufGame",
+                "attributes": {
+                    "Name": "Trackmania United Forever Support Plugin",
+                    "Author": "uwx",
+                    "Version": "1.0.0",
+                    "Description": "Adds support for Trackmania United Forever game folder mods.",
+                    "GameName": "Trackmania United Forever",
+                    "GameShortName": "tmuf",
+                    "GameNexusName": "trackmaniaunited",
+                    "GameNexusId": 1500,
+                    "GameSteamId": 7200,
+                    "GameBinary": "TmForeverLauncher.exe",
+                    "GameDataPath": "GameData",
+                },
+            },
+        ],
+    },
+    "game_trainsimulator": {
+        "hash": "50f1b4b59ea1c83807ebb7f1e8d0676f7ff60f30",
+        "plugins": [
+            {
+                "class": "RailworksGame",
+                "attributes": {
+                    "Name": "Train Simulator Classic Support Plugin",
+                    "Author": "Ryan Young",
+                    "Version": "1.1.0",
+                    "GameName": "Train Simulator",
+                    "GameShortName": "railworks",
+                    "GameBinary": "RailWorks.exe",
+                    "GameDataPath": "",
+                    "GameSteamId": "24010",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Train-Simulator-Classic",
+                },
+            },
+        ],
+    },
+    "game_valkyriachronicles": {
+        "hash": "b23b69dbdd46a90e748c02a19c3e666dca82d267",
+        "plugins": [
+            {
+                "class": "ValkyriaChroniclesGame",
+                "attributes": {
+                    "Name": "Valkyria Chronicles Support Plugin",
+                    "Author": "Ketsuban",
+                    "Version": "1.0.0",
+                    "GameName": "Valkyria Chronicles",
+                    "GameShortName": "vc1",
+                    "GameBinary": "Valkyria.exe",
+                    "GameLauncher": "Launcher.exe",
+                    "GameDataPath": "%GAME_PATH%",
+                    "GameSavesDirectory": "%GAME_PATH%/savedata",
+                    "GameSteamId": 294860,
+                },
+            },
+        ],
+    },
+    "game_witcher1": {
+        "hash": "30ef792b4086a86aa28b37719590ff182fd23414",
+        "plugins": [
+            {
+                "class": "Witcher1Game",
+                "attributes": {
+                    "Name": "Witcher 1 Support Plugin",
+                    "Author": "erri120",
+                    "Version": "1.0.0",
+                    "GameName": "The Witcher: Enhanced Edition",
+                    "GameShortName": "witcher",
+                    "GameNexusName": "witcher",
+                    "GameNexusId": 150,
+                    "GameSteamId": 20900,
+                    "GameGogId": 1207658924,
+                    "GameBinary": "System/witcher.exe",
+                    "GameDataPath": "Data",
+                    "GameSaveExtension": "TheWitcherSave",
+                    "GameDocumentsDirectory": "%DOCUMENTS%/The Witcher",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/saves",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-The-Witcher",
+                },
+            },
+        ],
+    },
+    "game_witcher2": {
+        "hash": "eae3074bb65f0ed7a61e4e3f2a81834c41ac7d7b",
+        "plugins": [
+            {
+                "class": "Witcher2Game",
+                "attributes": {
+                    "Name": "Witcher 2 Support Plugin",
+                    "Author": "DefinitelyNotSade",
+                    "Version": "1.0.0",
+                    "GameName": "The Witcher 2: Assassins of Kings",
+                    "GameShortName": "witcher2",
+                    "GameSteamId": 20920,
+                    "GameGogId": 1207658930,
+                    "GameLauncher": "Launcher.exe",
+                    "GameBinary": "bin/witcher2.exe",
+                    "GameDataPath": "CookedPC",
+                    "GameSaveExtension": "sav",
+                    "GameSavesMaxDepth": 0,
+                    "GameDocumentsDirectory": "%DOCUMENTS%/witcher 2/Config",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/../gamesaves",
+                },
+            },
+        ],
+    },
+    "game_witcher3": {
+        "hash": "21f6d38ef78f6960ac83ba6a9e06b067dfcd19f7",
+        "plugins": [
+            {
+                "class": "Witcher3Game",
+                "attributes": {
+                    "Name": "Witcher 3 Support Plugin",
+                    "Author": "Holt59",
+                    "Version": "1.0.0a",
+                    "GameName": "The Witcher 3: Wild Hunt",
+                    "GameShortName": "witcher3",
+                    "GameNexusId": 952,
+                    "GameSteamId": [
+                        499450,
+                        292030,
+                    ],
+                    "GameGogId": [
+                        1640424747,
+                        1495134320,
+                        1207664663,
+                        1207664643,
+                    ],
+                    "GameBinary": "bin/x64/witcher3.exe",
+                    "GameDataPath": "Mods",
+                    "GameSaveExtension": "sav",
+                    "GameSavesMaxDepth": 0,
+                    "GameDocumentsDirectory": "%DOCUMENTS%/The Witcher 3",
+                    "GameSavesDirectory": "%GAME_DOCUMENTS%/gamesaves",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-The-Witcher-3",
+                },
+            },
+        ],
+    },
+    "game_xplane11": {
+        "hash": "4cee2170187a92b9f49648abd3479ae5f1a86c53",
+        "plugins": [
+            {
+                "class": "XP11Game",
+                "attributes": {
+                    "Name": "X-Plane 11 Support Plugin",
+                    "Author": "Deorder",
+                    "Version": "0.0.1",
+                    "GameName": "X-Plane 11",
+                    "GameShortName": "xp11",
+                    "GameBinary": "X-Plane.exe",
+                    "GameDataPath": "",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-X%E2%80%90Plane-11",
+                },
+            },
+        ],
+    },
+    "game_zeusandposeidon": {
+        "hash": "85acdfca7c1d559b7ad4c61ac5d4ad1ee6662f97",
+        "plugins": [
+            {
+                "class": "ZeusAndPoseidonGame",
+                "attributes": {
+                    "Name": "Zeus and Poseidon Support Plugin",
+                    "Author": "Holt59",
+                    "Version": "1.0.0a",
+                    "GameName": "Zeus and Poseidon",
+                    "GameShortName": "zeusandposeidon",
+                    "GameSteamId": 566050,
+                    "GameGogId": 1207659039,
+                    "GameBinary": "Zeus.exe",
+                    "GameDataPath": "Adventures",
+                    "GameDocumentsDirectory": "%GAME_PATH%",
+                    "GameSavesDirectory": "%GAME_PATH%/Save",
+                    "GameSaveExtension": "sav",
+                    "GameSupportURL": "https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/Game:-Zeus%EF%BC%8BPoseidon",
+                },
+            },
+        ],
+    },
+}
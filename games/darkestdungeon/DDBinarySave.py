@@ -0,0 +1,141 @@
+# -*- encoding: utf-8 -*-
+
+import struct
+from typing import BinaryIO, TypeVar, cast
+
+
+def _field_hash(name: str) -> int:
+    # Hash of the field names in binary saves (Java string hash, with 53):
+    value = 0
+    for char in name:
+        value = (value * 53 + ord(char)) & 0xFFFFFFFF
+    return value
+
+
+# Header of binary saves: magic, version, header length, Meta1 size, number of Meta1
+# entries, Meta1 offset, number of Meta2 entries, Meta2 offset, data length and data
+# offset:
+_HEADER = struct.Struct("<4sII4xIII16xII4xII")
+
+# Meta2 entry (one per field): name hash, offset in the data and field info:
+_META2_ENTRY = struct.Struct("<III")
+
+# Size of the first read of a binary save, usually containing the whole index:
+_INDEX_READ_SIZE = 16384
+
+_T = TypeVar("_T", int, float, bool, str, bytes)
+
+
+class DarkestDungeonBinarySave:
+    """
+    Reader of binary Darkest Dungeon saves, only loading the header and the field
+    index (see https://github.com/robojumper/DarkestDungeonSaveEditor).
+
+    Fields are located from the hash of their name, so the value of a field costs
+    a single read, whatever the size of the save.
+    """
+
+    MAGIC = b"\x01\xb1\x00\x00"
+
+    def __init__(self, fp: BinaryIO):
+        """
+        Args:
+            fp: The save file, opened in binary mode and positioned at its start.
+
+        Raises:
+            ValueError: If the file is not a binary save or is corrupted.
+        """
+        index = fp.read(_INDEX_READ_SIZE)
+        if len(index) < _HEADER.size or not index.startswith(self.MAGIC):
+            raise ValueError("Not a binary save")
+        (
+            _,
+            _,
+            headerLength,
+            _,
+            _,
+            meta1Offset,
+            numMeta2Entries,
+            meta2Offset,
+            dataLength,
+            dataOffset,
+        ) = _HEADER.unpack_from(index)
+        if headerLength != 64:
+            raise ValueError("Header Length is not 64: " + str(headerLength))
+        if (meta2Offset - meta1Offset) % 16 != 0:
+            raise ValueError(
+                "Meta1 has wrong number of bytes: " + str(meta2Offset - meta1Offset)
+            )
+        if dataOffset - meta2Offset != numMeta2Entries * _META2_ENTRY.size:
+            raise ValueError(
+                "Meta2 has wrong number of bytes: " + str(dataOffset - meta2Offset)
+            )
+        if dataOffset > len(index):
+            index += fp.read(dataOffset - len(index))
+            if dataOffset > len(index):
+                raise ValueError("Truncated save")
+
+        self._fp = fp
+        self._dataOffset = dataOffset
+
+        # A field spans the data up to the next field, objects (whose fields are
+        # stored after them) do not have a value:
+        entries = list(_META2_ENTRY.iter_unpack(index[meta2Offset:dataOffset]))
+        offsets = sorted(offset for _, offset, _ in entries) + [dataLength]
+        ends = dict(zip(offsets, offsets[1:]))
+        self._fields: dict[int, list[tuple[int, int, int]]] = {}
+        for entryHash, offset, fieldInfo in entries:
+            if fieldInfo & 0b1:
+                continue
+            nameLength = (fieldInfo & 0b11111111100) >> 2
+            self._fields.setdefault(entryHash, []).append(
+                (offset, ends[offset] - offset, nameLength)
+            )
+
+    def field(self, name: str, kind: type[_T]) -> _T | None:
+        """
+        Read the value of a field.
+
+        Args:
+            name: Name of the field. If several fields have this name (in different
+                objects), the first one is read.
+            kind: Type of the value: int, float, bool, str, or bytes for the raw
+                value.
+
+        Returns:
+            The value of the field, or None if the save has no such field.
+
+        Raises:
+            ValueError: If the value cannot be read as the given type.
+        """
+        for offset, size, nameLength in self._fields.get(_field_hash(name), []):
+            self._fp.seek(self._dataOffset + offset)
+            raw = self._fp.read(size)
+            # Different names can have the same hash:
+            if raw[: nameLength - 1] != name.encode("utf-8"):
+                continue
+            return self._decode(raw, offset + nameLength, nameLength, kind)
+        return None
+
+    @staticmethod
+    def _decode(raw: bytes, position: int, start: int, kind: type[_T]) -> _T:
+        # Values are raw bytes following the null-terminated name, 4-byte values
+        # (including the length of strings) being aligned in the data:
+        aligned = start + (4 - position % 4) % 4
+        try:
+            if kind is bytes:
+                value: object = raw[start:]
+            elif kind is bool:
+                value = raw[start] != 0
+            elif kind is int:
+                (value,) = struct.unpack_from("<i", raw, aligned)
+            elif kind is float:
+                (value,) = struct.unpack_from("<f", raw, aligned)
+            else:
+                (length,) = struct.unpack_from("<i", raw, aligned)
+                if not 0 < length <= len(raw) - aligned - 4:
+                    raise ValueError(f"Invalid string length: {length}")
+                value = raw[aligned + 4 : aligned + 3 + length].decode("utf-8")
+        except (IndexError, struct.error) as e:
+            raise ValueError(f"Truncated {kind.__name__} field") from e
+        return cast(_T, value)
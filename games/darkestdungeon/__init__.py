@@ -0,0 +1,5 @@
+from .DDBinarySave import DarkestDungeonBinarySave
+
+__all__ = [
+    "DarkestDungeonBinarySave",
+]
@@ -1,20 +1,21 @@
 import datetime
 import os
-import struct
 import time
 from collections.abc import Mapping
 from pathlib import Path
-from typing import BinaryIO
+from typing import NamedTuple
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir, QFile, QFileInfo
 
 from ..basic_features import BasicLocalSavegames
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
+    LazyField,
     format_date,
 )
+from ..basic_features.binary_layout import BinaryLayout, LayoutField, fixed_string
 from ..basic_game import BasicGame
 
 
@@ -161,48 +162,43 @@ class BlackAndWhite2ModDataChecker(mobase.ModDataChecker):
             return mobase.ModDataChecker.VALID
 
 
-class BlackAndWhite2SaveGame(BasicGameSaveGame):
-    _saveInfLayout = {
-        "start": [0x00000000, 0x00000004],
-        "name": [0x00000004, 0x0000002C],
-        "empty": [0x0000002C, 0x00000104],
-        "land": [0x00000104, 0x00000108],
-        "date": [0x00000108, 0x00000110],
-        "empty1": [0x00000110, 0x00000114],
-        "elapsed": [0x00000114, 0x00000118],
-        "empty2": [0x00000108, 0x0000011C],
-    }
+class SaveGameInf(NamedTuple):
+    name: str
+    land: int
+    date: int
+    elapsed: int
+
+
+class BlackAndWhite2SaveGame(LazyBasicGameSaveGame):
+    _saveInfLayout = BinaryLayout(
+        SaveGameInf,
+        # Name embedded in "SaveGame.inf" with UTF-16 encoding
+        LayoutField("name", 0x00000004, "40s", fixed_string("utf-16")),
+        # Land number embedded in "SaveGame.inf" as an int written in binary
+        LayoutField("land", 0x00000104, "I"),
+        # Date in 100th of nanosecond (NT time)
+        LayoutField("date", 0x00000108, "q"),
+        # Elapsed time in second
+        LayoutField("elapsed", 0x00000114, "I"),
+    )
 
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self._filepath = Path(filepath)
-        self.name: str = ""
-        self.land: int = -1
-        self.elapsed: int = 0
-        self.lastsave: int = 0
-        with open(self._filepath.joinpath("SaveGame.inf"), "rb") as info:
-            # Name embedded in "SaveGame.inf" with UTF-16 encoding
-            self.name = self.readInf(info, "name").decode("utf-16")
-            # Land number embedded in "SaveGame.inf" as an int written in binary
-            self.land = int.from_bytes(self.readInf(info, "land"), "little")
-            # Getting elapsed time in second
-            self.elapsed = int.from_bytes(self.readInf(info, "elapsed"), "little")
-            # Getting date in 100th of nanosecond need to convert NT time
-            # to UNIX time and offset localtime
-            self.lastsave = int(
-                (
-                    (
-                        struct.unpack("q", self.readInf(info, "date"))[0] / 10000
-                        - 11644473600000
-                    )
-                )
-                - (time.localtime().tm_gmtoff * 1000)
-            )
-            info.close()
+    name = LazyField("")
+    land = LazyField(-1)
+    elapsed = LazyField(0)
+    lastsave = LazyField(0)
 
-    def readInf(self, inf: BinaryIO, key: str):
-        inf.seek(self._saveInfLayout[key][0])
-        return inf.read(self._saveInfLayout[key][1] - self._saveInfLayout[key][0])
+    def __init__(self, filepath: Path):
+        super().__init__(Path(filepath))
+
+    def parse(self):
+        info = self._saveInfLayout.read_file(self._filepath.joinpath("SaveGame.inf"))
+        self.name = info.name
+        self.land = info.land
+        self.elapsed = info.elapsed
+        # Converting date from NT time to UNIX time and offset localtime
+        self.lastsave = int(
+            (info.date / 10000 - 11644473600000) - (time.localtime().tm_gmtoff * 1000)
+        )
 
     def allFiles(self) -> list[str]:
         files = [str(file) for file in self._filepath.glob("./*")]
@@ -210,6 +206,8 @@ class BlackAndWhite2SaveGame(BasicGameSaveGame):
         return files
 
     def getCreationTime(self) -> QDateTime:
+        if not self.lastsave:
+            return super().getCreationTime()
         return QDateTime.fromMSecsSinceEpoch(self.lastsave)
 
     def getElapsed(self) -> str:
@@ -1,33 +1,65 @@
-import json
+import os
 from collections.abc import Mapping
 from pathlib import Path
 
 import mobase
 from PyQt6.QtCore import QDateTime, QDir
 
+from ..basic_features.basic_save_game_cache import SaveGameCache
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
+    LazyField,
     format_date,
 )
+from ..basic_features.json_stream import read_json_keys
 from ..basic_game import BasicGame
 
-
-class BaSSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        with open(self._filepath, "rb") as save:
-            save_data = json.load(save)
-        self._gameMode: str = save_data["gameModeId"]
+# Keys of the save data shown in the save info widget:
+_SAVE_KEYS = ("gameModeId", "creatureId", "ethnicGroupId", "playTime")
+
+
+def parse_bas_save(filepath: Path) -> dict[str, str]:
+    # Saves also contain the whole inventory, which is not read:
+    save_data = read_json_keys(filepath, [(key,) for key in _SAVE_KEYS])
+    return {key: str(save_data[(key,)]) for key in _SAVE_KEYS}
+
+
+class BaSSaveGame(LazyBasicGameSaveGame):
+    _gameMode = LazyField("")
+    _gender = LazyField("Female")
+    _ethnicity = LazyField("")
+    _elapsed = LazyField((0, 0, 0.0))
+
+    def __init__(
+        self,
+        filepath: Path,
+        stat: os.stat_result | None = None,
+        cache: SaveGameCache | None = None,
+    ):
+        super().__init__(filepath, stat)
+        if stat is None:
+            stat = self._filepath.stat()
+        self._cache = cache
+        self._stat = stat
+        self._created = stat.st_ctime
+        self._modified = stat.st_mtime
+
+    def parse(self):
+        save_data: dict[str, str] | None
+        if self._cache is None:
+            save_data = parse_bas_save(self._filepath)
+        else:
+            save_data = self._cache.get(self._filepath, parse_bas_save, self._stat)
+        if save_data is None:
+            return
+        self._gameMode = save_data["gameModeId"]
         self._gender = (
             "Male" if save_data["creatureId"] == "PlayerDefaultMale" else "Female"
         )
-        self._ethnicity: str = save_data["ethnicGroupId"]
+        self._ethnicity = save_data["ethnicGroupId"]
         h, m, s = save_data["playTime"].split(":")
         self._elapsed = (int(h), int(m), float(s))
-        f_stat = self._filepath.stat()
-        self._created = f_stat.st_ctime
-        self._modified = f_stat.st_mtime
 
     def getName(self) -> str:
         return f"{self.getPlayerSlug()} - {self._gameMode}"
@@ -75,6 +107,7 @@ class BaSGame(BasicGame):
     GameDocumentsDirectory = "%DOCUMENTS%/My Games/BladeAndSorcery"
     GameSavesDirectory = "%GAME_DOCUMENTS%/Saves/Default"
     GameSaveExtension = "chr"
+    GameSavesMaxDepth = 0
     GameSteamId = 629730
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
@@ -89,7 +122,10 @@ class BaSGame(BasicGame):
         return True
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            BaSSaveGame(path) for path in Path(folder.absolutePath()).glob(f"*.{ext}")
+        cache = self.save_cache()
+        saves = self.find_saves(folder)
+        result: list[mobase.ISaveGame] = [
+            BaSSaveGame(path, stat, cache) for path, stat in saves
         ]
+        cache.prune(path for path, _ in saves)
+        return result
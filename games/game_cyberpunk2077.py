@@ -12,11 +12,14 @@ import mobase
 from PyQt6.QtCore import QDateTime, QDir, qCritical, qInfo, qWarning
 
 from ..basic_features import BasicLocalSavegames, BasicModDataChecker, GlobPatterns
+from ..basic_features.basic_save_game_cache import SaveGameCache
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
+    LazyField,
     format_date,
 )
+from ..basic_features.json_stream import read_json_keys
 from ..basic_features.utils import is_directory
 from ..basic_game import BasicGame
 
@@ -140,40 +143,72 @@ def time_from_seconds(s: int | float) -> str:
     return f"{h:02}:{m:02}:{s:02}"
 
 
+# Keys of the save metadata shown in the save info widget:
+_METADATA_KEYS = (
+    "name",
+    "timestampString",
+    "playthroughTime",
+    "trackedQuestEntry",
+    "level",
+    "streetCred",
+    "lifePath",
+    "difficulty",
+    "bodyGender",
+    "brainGender",
+    "buildPatch",
+)
+
+
+def read_cyberpunk_save_metadata(metadata_file: Path) -> dict[str, Any]:
+    values = read_json_keys(
+        metadata_file, [("Data", "metadata", key) for key in _METADATA_KEYS]
+    )
+    return {key: values[("Data", "metadata", key)] for key in _METADATA_KEYS}
+
+
 def parse_cyberpunk_save_metadata(save_path: Path, save: mobase.ISaveGame):
     metadata_file = save_path / "metadata.9.json"
-    try:
-        with open(metadata_file) as file:
-            meta_data = json.load(file)["Data"]["metadata"]
-            name = meta_data["name"]
-            if name != (save_name := save.getName()):
-                name = f"{save_name}  ({name})"
-            return {
-                "Name": name,
-                "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
-                "Play Time": time_from_seconds(meta_data["playthroughTime"]),
-                "Quest": meta_data["trackedQuestEntry"],
-                "Level": int(meta_data["level"]),
-                "Street Cred": int(meta_data["streetCred"]),
-                "Life Path": meta_data["lifePath"],
-                "Difficulty": meta_data["difficulty"],
-                "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
-                "Game version": meta_data["buildPatch"],
-            }
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
-
-
-class CyberpunkSaveGame(BasicGameSaveGame):
+    if isinstance(save, CyberpunkSaveGame) and save.cache is not None:
+        meta_data = save.cache.get(metadata_file, read_cyberpunk_save_metadata)
+        if meta_data is None:
+            return None
+    else:
+        try:
+            meta_data = read_cyberpunk_save_metadata(metadata_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    name = meta_data["name"]
+    if name != (save_name := save.getName()):
+        name = f"{save_name}  ({name})"
+    return {
+        "Name": name,
+        "Date": format_date(meta_data["timestampString"], "hh:mm:ss, d.M.yyyy"),
+        "Play Time": time_from_seconds(meta_data["playthroughTime"]),
+        "Quest": meta_data["trackedQuestEntry"],
+        "Level": int(meta_data["level"]),
+        "Street Cred": int(meta_data["streetCred"]),
+        "Life Path": meta_data["lifePath"],
+        "Difficulty": meta_data["difficulty"],
+        "Gender": f'{meta_data["bodyGender"]} / {meta_data["brainGender"]}',
+        "Game version": meta_data["buildPatch"],
+    }
+
+
+class CyberpunkSaveGame(LazyBasicGameSaveGame):
     _name_file = "NamedSave.txt"  # from mod: Named Saves
 
-    def __init__(self, filepath: Path):
+    _name = LazyField("")
+
+    def __init__(self, filepath: Path, cache: SaveGameCache | None = None):
         super().__init__(filepath)
+        self.cache = cache
+
+    def parse(self):
         try:  # Custom name from Named Saves
-            with open(filepath / self._name_file) as file:
+            with open(self._filepath / self._name_file) as file:
                 self._name = file.readline()
         except FileNotFoundError:
-            self._name = ""
+            pass
 
     def getName(self) -> str:
         return self._name or super().getName()
@@ -299,6 +334,7 @@ class Cyberpunk2077Game(BasicGame):
     GameDocumentsDirectory = "%USERPROFILE%/AppData/Local/CD Projekt Red/Cyberpunk 2077"
     GameSavesDirectory = "%USERPROFILE%/Saved Games/CD Projekt Red/Cyberpunk 2077"
     GameSaveExtension = "dat"
+    GameSavesMaxDepth = 1
     GameSteamId = 1091500
     GameGogId = 1423049311
     GameSupportURL = (
@@ -384,11 +420,14 @@ class Cyberpunk2077Game(BasicGame):
         return ["UserSettings.json"]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            CyberpunkSaveGame(path.parent)
-            for path in Path(folder.absolutePath()).glob(f"**/*.{ext}")
+        cache = self.save_cache()
+        saves = self.find_saves(folder)
+        result: list[mobase.ISaveGame] = [
+            CyberpunkSaveGame(path.parent, cache) for path, _ in saves
         ]
+        # The metadata files are parsed by the save info widget:
+        cache.prune(path.parent / "metadata.9.json" for path, _ in saves)
+        return result
 
     def settings(self) -> list[mobase.PluginSetting]:
         return [
@@ -1,11 +1,18 @@
-import json
 from pathlib import Path
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo, QStandardPaths
 
-from ..basic_game import BasicGame, BasicGameSaveGame
+from ..basic_features.basic_save_game_cache import SaveGameCache
+from ..basic_features.basic_save_game_info import (
+    LazyBasicGameSaveGame,
+    LazyField,
+    load_saves,
+)
+from ..basic_features.json_stream import read_json_keys
+from ..basic_game import BasicGame
 from ..steam_utils import find_steam_path
+from .darkestdungeon import DarkestDungeonBinarySave
 
 
 class DarkestDungeonModDataChecker(mobase.ModDataChecker):
@@ -58,96 +65,32 @@ class DarkestDungeonModDataChecker(mobase.ModDataChecker):
         return mobase.ModDataChecker.INVALID
 
 
-class DarkestDungeonSaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
+class DarkestDungeonSaveGame(LazyBasicGameSaveGame):
+    name = LazyField("")
+
+    def __init__(self, filepath: Path, cache: SaveGameCache | None = None):
         super().__init__(filepath)
-        dataPath = filepath.joinpath("persist.game.json")
-        self.name: str = ""
-        if self.isBinary(dataPath):
-            self.loadBinarySaveFile(dataPath)
+        self._cache = cache
+
+    def parse(self):
+        dataPath = self._filepath.joinpath("persist.game.json")
+        if self._cache is None:
+            self.name = self.loadSaveFile(dataPath)
         else:
-            self.loadJSONSaveFile(dataPath)
+            self.name = self._cache.get(dataPath, self.loadSaveFile) or ""
 
-    @staticmethod
-    def isBinary(dataPath: Path) -> bool:
-        with dataPath.open(mode="rb") as fp:
-            magic = fp.read(4)
-            # magic number in binary save files
-            return magic == b"\x01\xb1\x00\x00"
-
-    def loadJSONSaveFile(self, dataPath: Path):
-        text = dataPath.read_text()
-        content = json.loads(text)
-        data = content["data"]
-        self.name = str(data["estatename"])
-
-    def loadBinarySaveFile(self, dataPath: Path):
-        # see https://github.com/robojumper/DarkestDungeonSaveEditor
+    @classmethod
+    def loadSaveFile(cls, dataPath: Path) -> str:
         with dataPath.open(mode="rb") as fp:
-            # read Header
-
-            # skip to headerLength
-            fp.seek(8, 0)
-            headerLength = int.from_bytes(fp.read(4), "little")
-            if headerLength != 64:
-                raise ValueError("Header Length is not 64: " + str(headerLength))
-            fp.seek(4, 1)
-
-            # meta1Size = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
-            # numMeta1Entries = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
-
-            meta1Offset = int.from_bytes(fp.read(4), "little")
-            fp.seek(16, 1)
-            numMeta2Entries = int.from_bytes(fp.read(4), "little")
-            meta2Offset = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
-
-            # dataLength = int.from_bytes(fp.read(4), "little")
-            fp.seek(4, 1)
-
-            dataOffset = int.from_bytes(fp.read(4), "little")
-
-            # read Meta1 Block
-            fp.seek(meta1Offset, 0)
-            meta1DataLength = meta2Offset - meta1Offset
-            if meta1DataLength % 16 != 0:
-                raise ValueError(
-                    "Meta1 has wrong number of bytes: " + str(meta1DataLength)
-                )
+            if fp.read(4) != DarkestDungeonBinarySave.MAGIC:
+                return cls.loadJSONSaveFile(dataPath)
+            fp.seek(0)
+            return DarkestDungeonBinarySave(fp).field("estatename", str) or ""
 
-            # read Meta2 Block
-            fp.seek(meta2Offset, 0)
-            meta2DataLength = dataOffset - meta2Offset
-            if meta2DataLength % 12 != 0:
-                raise ValueError(
-                    "Meta2 has wrong number of bytes: " + str(meta2DataLength)
-                )
-            meta2List: list[tuple[int, int, int]] = []
-            for x in range(numMeta2Entries):
-                entryHash = int.from_bytes(fp.read(4), "little")
-                offset = int.from_bytes(fp.read(4), "little")
-                fieldInfo = int.from_bytes(fp.read(4), "little")
-                meta2List.append((entryHash, offset, fieldInfo))
-
-            # read Data
-            fp.seek(dataOffset, 0)
-            for x in range(numMeta2Entries):
-                meta2Entry = meta2List[x]
-                fp.seek(dataOffset + meta2Entry[1], 0)
-                nameLength = (meta2Entry[2] & 0b11111111100) >> 2
-                # null terminated string
-                nameBytes = fp.read(nameLength - 1)
-                fp.seek(1, 1)
-                name = bytes.decode(nameBytes, "utf-8")
-                if name != "estatename":
-                    continue
-                valueLength = int.from_bytes(fp.read(4), "little")
-                valueBytes = fp.read(valueLength - 1)
-                value = bytes.decode(valueBytes, "utf-8")
-                self.name = value
-                break
+    @staticmethod
+    def loadJSONSaveFile(dataPath: Path) -> str:
+        content = read_json_keys(dataPath, [("data", "estatename")])
+        return str(content[("data", "estatename")])
 
     def getName(self) -> str:
         if self.name == "":
@@ -233,4 +176,10 @@ class DarkestDungeonGame(BasicGame):
                 continue
             profiles.append(path)
 
-        return [DarkestDungeonSaveGame(path) for path in profiles]
+        cache = self.save_cache()
+        # Saves are named from their (binary) content:
+        saves: list[mobase.ISaveGame] = load_saves(
+            [DarkestDungeonSaveGame(path, cache) for path in profiles]
+        )
+        cache.prune(path.joinpath("persist.game.json") for path in profiles)
+        return saves
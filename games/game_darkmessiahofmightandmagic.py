@@ -1,13 +1,31 @@
-import struct
 from pathlib import Path
+from typing import NamedTuple
 
 import mobase
 from PyQt6.QtGui import QImage
 
 from ..basic_features import BasicGameSaveGameInfo
+from ..basic_features.binary_layout import BinaryLayout, LayoutField
 from ..basic_game import BasicGame
 
 
+class TGAHeader(NamedTuple):
+    width: int
+    height: int
+    bpp: int
+    descriptor: int
+
+
+# Header of the save screenshots (the image data follows the header):
+_TGA_HEADER = BinaryLayout(
+    TGAHeader,
+    LayoutField("width", 12, "H"),
+    LayoutField("height", 14, "H"),
+    LayoutField("bpp", 16, "B"),
+    LayoutField("descriptor", 17, "B"),
+)
+
+
 class DarkMessiahOfMightAndMagicGame(BasicGame):
     Name = "Dark Messiah of Might and Magic Support Plugin"
     Author = "Holt59"
@@ -35,11 +53,11 @@ class DarkMessiahOfMightAndMagicGame(BasicGame):
         with open(
             filepath.parent.joinpath(filepath.name.replace(".sav", ".tga")), "rb"
         ) as fp:
+            header = _TGA_HEADER.read(fp)
+            if header.bpp != 24:
+                return None
             data = fp.read()
-        _, _, w, h, bpp, _ = struct.unpack("<HHHHBB", data[8:18])
-        if bpp != 24:
-            return None
-        return QImage(data[18:], w, h, QImage.Format.Format_RGB888)
+        return QImage(data, header.width, header.height, QImage.Format.Format_RGB888)
 
     def init(self, organizer: mobase.IOrganizer):
         super().init(organizer)
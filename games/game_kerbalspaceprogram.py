@@ -36,6 +36,7 @@ class KerbalSpaceProgramGame(BasicGame):
     GameDataPath = "GameData"
     GameSavesDirectory = "%GAME_PATH%/saves"
     GameSaveExtension = "sfs"
+    GameSavesMaxDepth = 1
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-Kerbal-Space-Program"
@@ -51,8 +52,7 @@ class KerbalSpaceProgramGame(BasicGame):
         return True
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
         return [
-            KerbalSpaceProgramSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*/*.{ext}")
+            KerbalSpaceProgramSaveGame(path, stat)
+            for path, stat in self.find_saves(folder)
         ]
@@ -4,6 +4,7 @@ import re
 from PyQt6.QtCore import QDir
 
 from ..basic_game import BasicGame
+from ..variables_utils import expand_environment
 
 
 class MSFS2020Game(BasicGame):
@@ -22,7 +23,7 @@ class MSFS2020Game(BasicGame):
 
     def dataDirectory(self) -> QDir:
         # Find and use package path specified in Asobo engine options
-        AppDataPath = os.path.expandvars(r"%APPDATA%\Microsoft Flight Simulator")
+        AppDataPath = expand_environment(r"%APPDATA%\Microsoft Flight Simulator")
         UserCfgPath = os.path.join(AppDataPath, "UserCfg.opt")
         InstalledPackagesPathPattern = re.compile(
             r'InstalledPackagesPath\s*=\s*"(.*)"', re.IGNORECASE
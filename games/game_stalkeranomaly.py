@@ -1,3 +1,4 @@
+import os
 from enum import IntEnum
 from pathlib import Path
 
@@ -5,12 +6,29 @@ import mobase
 from PyQt6.QtCore import QDir, QFileInfo, Qt
 from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
 
+from ..basic_features.basic_save_game_cache import SaveGameCache
 from ..basic_features.basic_save_game_info import (
-    BasicGameSaveGame,
     BasicGameSaveGameInfo,
+    LazyBasicGameSaveGame,
+    LazyField,
+    load_saves,
 )
 from ..basic_game import BasicGame
-from .stalkeranomaly import XRSave
+from .stalkeranomaly import XRSave, XRSaveSummary
+
+
+def read_save_summary(filepath: Path) -> list[object] | None:
+    """
+    Read the values of the summary of a save, as stored in the save cache.
+
+    Args:
+        filepath: Path to the save.
+
+    Returns:
+        The values of the summary fields, or None if the save has no player.
+    """
+    summary = XRSave.read_summary(filepath)
+    return None if summary is None else list(summary)
 
 
 class StalkerAnomalyModDataChecker(mobase.ModDataChecker):
@@ -127,24 +145,34 @@ class StalkerAnomalyModDataContent(mobase.ModDataContent):
         return self.content
 
 
-class StalkerAnomalySaveGame(BasicGameSaveGame):
+class StalkerAnomalySaveGame(LazyBasicGameSaveGame):
     _filepath: Path
 
-    xr_save: XRSave
-
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self._filepath = filepath
-        self.xr_save = XRSave(self._filepath)
+    summary = LazyField[XRSaveSummary | None](None)
+
+    def __init__(
+        self,
+        filepath: Path,
+        stat: os.stat_result | None = None,
+        cache: SaveGameCache | None = None,
+    ):
+        super().__init__(filepath, stat)
+        self._stat = stat
+        self._cache = cache
+
+    def parse(self):
+        if self._cache is None:
+            fields = read_save_summary(self._filepath)
+        else:
+            fields = self._cache.get(self._filepath, read_save_summary, self._stat)
+        if fields is not None:
+            self.summary = XRSaveSummary.from_values(fields)
 
     def getName(self) -> str:
-        xr_save = self.xr_save
-        player = xr_save.player
-        if player:
-            name = player.character_name_str
-            time = xr_save.time_fmt
-            return f"{name}, {xr_save.save_fmt} [{time}]"
-        return ""
+        summary = self.summary
+        if summary is None:
+            return super().getName()
+        return f"{summary.name}, {summary.save} [{summary.time}]"
 
     def allFiles(self) -> list[str]:
         filepath = str(self._filepath)
@@ -192,17 +220,16 @@ class StalkerAnomalySaveGameInfoWidget(mobase.ISaveGameInfoWidget):
         self.resize(240, 32)
         if not isinstance(save, StalkerAnomalySaveGame):
             return
-        xr_save = save.xr_save
-        player = xr_save.player
-        if player:
-            self._labelSave.setText(f"Save: {xr_save.save_fmt}")
-            self._labelName.setText(f"Name: {player.character_name_str}")
-            self._labelFaction.setText(f"Faction: {xr_save.getFaction()}")
-            self._labelHealth.setText(f"Health: {player.health:.2f}%")
-            self._labelMoney.setText(f"Money: {player.money} RU")
-            self._labelRank.setText(f"Rank: {xr_save.getRank()} ({player.rank})")
+        summary = save.summary
+        if summary is not None:
+            self._labelSave.setText(f"Save: {summary.save}")
+            self._labelName.setText(f"Name: {summary.name}")
+            self._labelFaction.setText(f"Faction: {summary.faction}")
+            self._labelHealth.setText(f"Health: {summary.health:.2f}%")
+            self._labelMoney.setText(f"Money: {summary.money} RU")
+            self._labelRank.setText(f"Rank: {summary.rank_name} ({summary.rank})")
             self._labelRep.setText(
-                f"Reputation: {xr_save.getReputation()} ({player.reputation})"
+                f"Reputation: {summary.reputation_name} ({summary.reputation})"
             )
 
 
@@ -230,6 +257,7 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
     )
 
     GameSaveExtension = "scop"
+    GameSavesMaxDepth = 0
     GameSavesDirectory = "%GAME_DOCUMENTS%/savedgames"
 
     def __init__(self):
@@ -276,11 +304,13 @@ class StalkerAnomalyGame(BasicGame, mobase.IPluginFileMapper):
         ]
 
     def listSaves(self, folder: QDir) -> list[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            StalkerAnomalySaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        cache = self.save_cache()
+        saves = self.find_saves(folder)
+        cache.prune(path for path, _ in saves)
+        # Saves are LZO-compressed and named from their content:
+        return load_saves(
+            [StalkerAnomalySaveGame(path, stat, cache) for path, stat in saves]
+        )
 
     def mappings(self) -> list[mobase.Mapping]:
         appdata = self.gameDirectory().filePath("appdata")
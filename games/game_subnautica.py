@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import fnmatch
-import os
 from collections.abc import Iterable
 from enum import Enum
 from pathlib import Path
@@ -172,7 +171,7 @@ class SubnauticaGame(BasicGame, mobase.IPluginFileMapper):
             BasicGameSaveGame(folder)
             for save_path in (
                 folder.absolutePath(),
-                *(os.path.expandvars(p) for p in self._game_extra_save_paths),
+                *(self.variables.expand(p) for p in self._game_extra_save_paths),
             )
             for folder in Path(save_path).glob("slot*")
         ]
@@ -66,6 +66,7 @@ class VampireTheMasqueradeBloodlinesGame(BasicGame):
     GameDocumentsDirectory = "%GAME_PATH%/vampire/cfg"
     GameSavesDirectory = "%GAME_PATH%/vampire/SAVE"
     GameSaveExtension = "sav"
+    GameSavesMaxDepth = 0
     GameSupportURL = (
         r"https://github.com/ModOrganizer2/modorganizer-basic_games/wiki/"
         "Game:-Vampire:-The-Masquerade-%E2%80%90-Bloodlines"
@@ -97,8 +98,4 @@ class VampireTheMasqueradeBloodlinesGame(BasicGame):
         return ["autoexec.cfg", "user.cfg"]
 
     def listSaves(self, folder: QDir) -> List[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            VampireSaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        return [VampireSaveGame(path) for path, _ in self.find_saves(folder)]
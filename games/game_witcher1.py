@@ -1,59 +1,57 @@
 from pathlib import Path
-from typing import BinaryIO, List
+from typing import List, NamedTuple
 
 import mobase
 from PyQt6.QtCore import QDir, QFileInfo
 
-from ..basic_game import BasicGame, BasicGameSaveGame
+from ..basic_features.basic_save_game_info import LazyBasicGameSaveGame, LazyField
+from ..basic_features.binary_layout import BinaryLayout, LayoutField, fixed_string
+from ..basic_game import BasicGame
 
 
-class Witcher1SaveGame(BasicGameSaveGame):
-    def __init__(self, filepath: Path):
-        super().__init__(filepath)
-        self.areaName: str = ""
-        self.parseSaveFile(filepath)
+class TheWitcherSaveHeader(NamedTuple):
+    magic: bytes
+    version: int
+    lightningStorm: str
+    areaName1: str
+    areaName2: str
 
-    @staticmethod
-    def readInt(fp: BinaryIO, length: int = 4) -> int:
-        return int.from_bytes(fp.read(length), "little")
 
-    @staticmethod
-    def readFixedString(fp: BinaryIO, length: int) -> str:
-        b: bytes = fp.read(length)
-        res = b.decode("utf-16")
-        return res.rstrip("\0")
+class Witcher1SaveGame(LazyBasicGameSaveGame):
+    areaName = LazyField("")
 
-    def parseSaveFile(self, filepath: Path):
-        # https://github.com/xoreos/xoreos/blob/82bd991052732ab1f8f75f512b3dfabfcc92ae8f/src/aurora/thewitchersavefile.cpp#L60
-        with filepath.open(mode="rb") as fp:
-            magic = fp.read(4)
-            if magic != b"RGMH":
-                raise ValueError("Invalid TheWitcherSave file!")
+    # https://github.com/xoreos/xoreos/blob/82bd991052732ab1f8f75f512b3dfabfcc92ae8f/src/aurora/thewitchersavefile.cpp#L60
+    _headerLayout = BinaryLayout(
+        TheWitcherSaveHeader,
+        LayoutField("magic", 0, "4s"),
+        LayoutField("version", 4, "I"),
+        # TODO: get the preview image (data offset, 8 bytes at 8)
+        LayoutField("lightningStorm", 40, "2048s", fixed_string("utf-16")),
+        LayoutField("areaName1", 2088, "2048s", fixed_string("utf-16")),
+        LayoutField("areaName2", 4136, "2048s", fixed_string("utf-16")),
+    )
 
-            version = self.readInt(fp)
-            if version != 1:
-                raise ValueError("Invalid TheWitcherSave file!")
+    def parse(self):
+        self.parseSaveFile(self._filepath)
 
-            # TODO: get the preview image
-            # dataOffset = self.readInt(fp, 8)
-            fp.seek(8, 1)
-            fp.seek(8, 1)
-            fp.seek(4 * 4, 1)
+    def parseSaveFile(self, filepath: Path):
+        header = self._headerLayout.read_file(filepath)
+        if header.magic != b"RGMH":
+            raise ValueError("Invalid TheWitcherSave file!")
 
-            lightningStorm = self.readFixedString(fp, 2048)
-            if lightningStorm != "Lightning Storm":
-                raise ValueError('Missing "Lightning Storm"')
+        if header.version != 1:
+            raise ValueError("Invalid TheWitcherSave file!")
 
-            areaName1 = self.readFixedString(fp, 2048)
-            areaName2 = self.readFixedString(fp, 2048)
+        if header.lightningStorm != "Lightning Storm":
+            raise ValueError('Missing "Lightning Storm"')
 
-            if areaName1 != areaName2:
-                raise ValueError("Invalid Area Name!")
+        if header.areaName1 != header.areaName2:
+            raise ValueError("Invalid Area Name!")
 
-            self.areaName = areaName1
+        self.areaName = header.areaName1
 
     def getName(self) -> str:
-        return self.areaName
+        return self.areaName or super().getName()
 
 
 class Witcher1Game(BasicGame):
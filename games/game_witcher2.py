@@ -33,6 +33,7 @@ class Witcher2Game(BasicGame):
     GameBinary = "bin/witcher2.exe"
     GameDataPath = "CookedPC"
     GameSaveExtension = "sav"
+    GameSavesMaxDepth = 0
     GameDocumentsDirectory = "%DOCUMENTS%/witcher 2/Config"
     GameSavesDirectory = "%GAME_DOCUMENTS%/../gamesaves"
 
@@ -58,8 +59,4 @@ class Witcher2Game(BasicGame):
         ]
 
     def listSaves(self, folder: QDir) -> List[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            Witcher2SaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        return [Witcher2SaveGame(path, stat) for path, stat in self.find_saves(folder)]
@@ -1,4 +1,3 @@
-from pathlib import Path
 from typing import List
 
 import mobase
@@ -28,6 +27,7 @@ class Witcher3Game(BasicGame):
     GameBinary = "bin/x64/witcher3.exe"
     GameDataPath = "Mods"
     GameSaveExtension = "sav"
+    GameSavesMaxDepth = 0
     GameDocumentsDirectory = "%DOCUMENTS%/The Witcher 3"
     GameSavesDirectory = "%GAME_DOCUMENTS%/gamesaves"
     GameSupportURL = (
@@ -46,8 +46,4 @@ class Witcher3Game(BasicGame):
         return ["user.settings", "input.settings"]
 
     def listSaves(self, folder: QDir) -> List[mobase.ISaveGame]:
-        ext = self._mappings.savegameExtension.get()
-        return [
-            Witcher3SaveGame(path)
-            for path in Path(folder.absolutePath()).glob(f"*.{ext}")
-        ]
+        return [Witcher3SaveGame(path, stat) for path, stat in self.find_saves(folder)]
@@ -2,41 +2,108 @@
 from __future__ import annotations
 
 import io
+import mmap
 import struct
-from typing import Optional, Tuple
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
 
 from .XRMath import IVec3
 
+# Buffers the readers can work on without copying:
+XRBuffer = Union[bytes, bytearray, mmap.mmap]
+
+_U8 = struct.Struct("<B")
+_S8 = struct.Struct("<b")
+_U16 = struct.Struct("<H")
+_S16 = struct.Struct("<h")
+_U32 = struct.Struct("<I")
+_S32 = struct.Struct("<i")
+_U64 = struct.Struct("<Q")
+_S64 = struct.Struct("<q")
+_BOOL = struct.Struct("<?")
+_FLOAT = struct.Struct("<f")
+_FVEC3 = struct.Struct("<fff")
+_CHUNK_HEADER = struct.Struct("<II")
+
 
 class XRReader:
-    def __init__(self, buffer: bytes):
-        self._buffer = buffer
+    """
+    Little-endian reader over a window of a buffer.
+
+    Primitives are unpacked in place and sub-readers (see `sub_reader`) share the
+    buffer of their parent, so reading does not copy the buffer, except for `read`
+    and `peek` which return bytes.
+    """
+
+    def __init__(
+        self, buffer: XRBuffer | memoryview, start: int = 0, end: int | None = None
+    ):
+        """
+        Args:
+            buffer: The buffer to read. A memoryview is copied, other buffers
+                (including a read-only mmap of an uncompressed file) are not.
+            start (optional): Start of the window to read in the buffer.
+            end (optional): End of the window, defaults to the end of the buffer.
+        """
+        if isinstance(buffer, memoryview):
+            buffer = buffer.tobytes()
+        self._data = buffer
+        self._view = memoryview(buffer)
+        self._start = start
+        self._end = len(buffer) if end is None else end
         self._pos = 0
 
     def __len__(self) -> int:
-        return len(self._buffer)
+        return self._end - self._start
 
-    def _read(self, size: int) -> Tuple[bytes, int]:
-        pos = min(len(self._buffer), self._pos + size)
-        buffer = self._buffer[self._pos : pos]
-        return (buffer, pos)
+    def _take(self, size: int) -> int:
+        # Advance by size bytes, returning the previous absolute position:
+        offset = self._start + self._pos
+        self._pos += size
+        return offset
 
-    def read(self, size: int = -1) -> bytes:
+    def _window(self, size: int) -> Tuple[int, int]:
+        begin = self._start + min(self._pos, len(self))
         if size < 0:
-            size = len(self._buffer)
-        if len(self._buffer) <= self._pos:
-            return b""
-        (buffer, pos) = self._read(size)
-        self._pos = pos
-        return buffer
+            return (begin, self._end)
+        return (begin, min(self._end, begin + size))
+
+    def read(self, size: int = -1) -> bytes:
+        (begin, end) = self._window(size)
+        self._pos = max(self._pos, end - self._start)
+        return bytes(self._view[begin:end])
 
     def peek(self, size: int = -1) -> bytes:
-        if size < 0:
-            size = len(self._buffer)
-        if len(self._buffer) <= self._pos:
-            return b""
-        (buffer, _pos) = self._read(size)
-        return buffer
+        (begin, end) = self._window(size)
+        return bytes(self._view[begin:end])
+
+    def view(self, size: int = -1) -> memoryview:
+        """
+        Read the given number of bytes without copying them.
+
+        Args:
+            size (optional): Number of bytes to read, defaults to the rest of the
+                window.
+
+        Returns:
+            A view of the bytes, shorter than size at the end of the window.
+        """
+        (begin, end) = self._window(size)
+        self._pos = max(self._pos, end - self._start)
+        return self._view[begin:end]
+
+    def sub_reader(self, size: int) -> XRReader:
+        """
+        Read the given number of bytes as a new reader sharing the same buffer.
+
+        Args:
+            size: Number of bytes of the new reader.
+
+        Returns:
+            The new reader, shorter than size at the end of the window.
+        """
+        (begin, end) = self._window(size)
+        self._pos = max(self._pos, end - self._start)
+        return XRReader(self._data, begin, end)
 
     def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
         if whence == 0:
@@ -46,103 +113,132 @@ class XRReader:
         elif whence == 1:
             self._pos = max(0, self._pos + pos)
         elif whence == 2:
-            self._pos = max(0, len(self._buffer) + pos)
+            self._pos = max(0, len(self) + pos)
         else:
             raise ValueError("unsupported whence value")
         return self._pos
 
     def elapsed(self) -> int:
-        return len(self._buffer) - self._pos
+        return len(self) - self._pos
 
     def eof(self) -> bool:
         return self.elapsed() <= 0
 
+    def unpack(self, unpacker: struct.Struct) -> Tuple[Any, ...]:
+        """
+        Read the values of a struct, e.g. several consecutive fields at once.
+
+        Args:
+            unpacker: The struct to read.
+
+        Returns:
+            The unpacked values.
+        """
+        if self.elapsed() < unpacker.size:
+            raise struct.error(f"unpack requires a buffer of {unpacker.size} bytes")
+        return unpacker.unpack_from(self._view, self._take(unpacker.size))
+
     def u8(self) -> int:
-        return int(struct.unpack("<B", self.read(1))[0])
+        value: int = self.unpack(_U8)[0]
+        return value
 
     def s8(self) -> int:
-        return int(struct.unpack("<b", self.read(1))[0])
+        value: int = self.unpack(_S8)[0]
+        return value
 
     def u16(self) -> int:
-        return int(struct.unpack("<H", self.read(2))[0])
+        value: int = self.unpack(_U16)[0]
+        return value
 
     def s16(self) -> int:
-        return int(struct.unpack("<h", self.read(2))[0])
+        value: int = self.unpack(_S16)[0]
+        return value
 
     def u32(self) -> int:
-        return int(struct.unpack("<I", self.read(4))[0])
+        value: int = self.unpack(_U32)[0]
+        return value
 
     def s32(self) -> int:
-        return int(struct.unpack("<i", self.read(4))[0])
+        value: int = self.unpack(_S32)[0]
+        return value
 
     def u64(self) -> int:
-        return int(struct.unpack("<Q", self.read(8))[0])
+        value: int = self.unpack(_U64)[0]
+        return value
 
     def s64(self) -> int:
-        return int(struct.unpack("<q", self.read(8))[0])
+        value: int = self.unpack(_S64)[0]
+        return value
 
     def bool(self) -> bool:
-        return bool(struct.unpack("<?", self.read(1))[0])
+        value: bool = self.unpack(_BOOL)[0]
+        return value
 
     def float(self) -> float:
-        return float(struct.unpack("<f", self.read(4))[0])
+        value: float = self.unpack(_FLOAT)[0]
+        return value
 
     def str(self) -> str:
-        chars = bytearray()
-        while not self.eof():
-            c = self.read(1)
-            if c == b"\x00":
-                return str(chars, "utf-8")
-            else:
-                chars += c
-        return ""
+        (begin, end) = self._window(-1)
+        null = self._data.find(b"\x00", begin, end)
+        if null < 0:
+            self._pos = len(self)
+            return ""
+        self._pos = null + 1 - self._start
+        return str(self._view[begin:null], "utf-8")
 
     def fvec3(self) -> IVec3:
-        (f1, f2, f3) = struct.unpack("<fff", self.read(12))
+        (f1, f2, f3) = self.unpack(_FVEC3)
         return IVec3(f1, f2, f3)
 
 
 class XRStream(XRReader):
-    def __init__(self, buffer: bytes):
-        super().__init__(buffer)
-        self.last_pos: int = 0
+    """
+    Reader over a sequence of chunks, each made of a u32 ID (the highest bit
+    flagging compressed chunks), a u32 size and the chunk data.
+    """
+
+    def __init__(
+        self, buffer: XRBuffer | memoryview, start: int = 0, end: int | None = None
+    ):
+        super().__init__(buffer, start, end)
+        self._chunks: Optional[Dict[int, Tuple[int, int]]] = None
+
+    def chunks(self) -> Mapping[int, Tuple[int, int]]:
+        """
+        Retrieve the chunk directory of the stream, built in a single pass over the
+        chunk headers on first use.
+
+        Returns:
+            A mapping from chunk ID (without the compression flag) to the offset of
+            the chunk data in the stream and the chunk size, in stream order. Only
+            the first chunk is listed for duplicated IDs.
+        """
+        if self._chunks is None:
+            chunks: Dict[int, Tuple[int, int]] = {}
+            pos = 0
+            while pos + _CHUNK_HEADER.size <= len(self):
+                (dw_type, dw_size) = _CHUNK_HEADER.unpack_from(
+                    self._view, self._start + pos
+                )
+                pos += _CHUNK_HEADER.size
+                chunks.setdefault(dw_type & ~(1 << 31), (pos, dw_size))
+                pos += dw_size
+            self._chunks = chunks
+        return self._chunks
 
     def find_chunk(self, id: int) -> Optional[int]:
-        dw_type = 0
-        dw_size = 0
-        success = False
-        if self.last_pos != 0:
-            self.seek(self.last_pos)
-            dw_type = self.u32()
-            dw_size = self.u32()
-            if (dw_type & (~(1 << 31))) == id:
-                success = True
-
-        if not success:
-            self.seek(0)
-            while not self.eof():
-                dw_type = self.u32()
-                dw_size = self.u32()
-                if (dw_type & (~(1 << 31))) == id:
-                    success = True
-                    break
-                else:
-                    self.seek(dw_size, io.SEEK_CUR)
-
-            if not success:
-                self.last_pos = 0
-                return None
-
-        if (self._pos + dw_size) < len(self._buffer):
-            self.last_pos = self._pos + dw_size
-        else:
-            self.last_pos = 0
-
-        return dw_size
+        chunk = self.chunks().get(id)
+        if chunk is None:
+            return None
+        (offset, size) = chunk
+        self.seek(offset)
+        return size
 
     def open_chunk(self, id: int) -> Optional[XRStream]:
         size = self.find_chunk(id)
         if size and size != 0:
-            data = self.read(size)
-            return XRStream(data)
+            (begin, end) = self._window(size)
+            self._pos = end - self._start
+            return XRStream(self._data, begin, end)
         return None
@@ -0,0 +1,161 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+import mmap
+from typing import Union
+
+# Inputs the decoder can read, e.g. a read-only mmap of a save so that only the
+# decompressed part of the file is actually read:
+LZOInput = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class LZO1XDecoder:
+    """
+    Incremental LZO1X decompressor.
+
+    The input is only decompressed as far as requested (see `decompress`), so the
+    start of a large stream can be read without decompressing (or reading) the
+    rest of it.
+
+    See the lzokay (https://github.com/jackoalan/lzokay) decompressor for the
+    description of the instructions.
+    """
+
+    def __init__(self, data: LZOInput, max_output: int, offset: int = 0):
+        """
+        Args:
+            data: The compressed data.
+            max_output: Maximum size of the decompressed data, e.g. the size
+                declared in the save header. Exceeding it is an error.
+            offset (optional): Start of the compressed stream in data.
+        """
+        self.output = bytearray()
+        self.max_output = max_output
+        self.finished = False
+
+        self._data = data
+        self._pos = offset
+        self._state = 0
+        self._started = False
+
+    def decompress(self, size: int) -> int:
+        """
+        Decompress the stream until the output holds at least the given number of
+        bytes, or the stream is finished.
+
+        Args:
+            size: Minimum size of the output.
+
+        Returns:
+            The size of the output, lower than size if the stream is finished.
+
+        Raises:
+            ValueError: If the stream is corrupted or the output exceeds the maximum
+                size.
+        """
+        try:
+            if not self._started:
+                self._started = True
+                self._first()
+            while len(self.output) < size and not self.finished:
+                self._step()
+        except IndexError:
+            raise ValueError("truncated LZO stream") from None
+        return len(self.output)
+
+    def _literals(self, length: int):
+        self._copy_check(length)
+        pos = self._pos
+        if pos + length > len(self._data):
+            raise IndexError
+        self.output += self._data[pos : pos + length]
+        self._pos = pos + length
+
+    def _copy_check(self, length: int):
+        if len(self.output) + length > self.max_output:
+            raise ValueError(f"LZO output exceeds {self.max_output} bytes")
+
+    def _long_length(self, base: int) -> int:
+        # Length continued over zero bytes (255 each) and a final non-zero byte:
+        data = self._data
+        pos = self._pos
+        zeros = 0
+        while data[pos] == 0:
+            zeros += 1
+            pos += 1
+        self._pos = pos + 1
+        return zeros * 255 + base + data[pos]
+
+    def _first(self):
+        # 17..21: copy 0..3 literals (as state), 22..255: copy 4..238 literals,
+        # 0..16: regular instruction:
+        first = self._data[self._pos]
+        if first >= 17:
+            self._pos += 1
+            self._literals(first - 17)
+            self._state = 4 if first >= 22 else first - 17
+
+    def _step(self):
+        data = self._data
+        output = self.output
+        inst = data[self._pos]
+        self._pos += 1
+
+        if inst >= 0x40:
+            # M2: copy 3..8 bytes within 2kB:
+            distance = (data[self._pos] << 3) + ((inst >> 2) & 0x7) + 1
+            self._pos += 1
+            length = (inst >> 5) + 1
+            state = inst & 0x3
+        elif inst >= 0x20:
+            # M3: copy within 16kB:
+            length = (inst & 0x1F) + 2
+            if length == 2:
+                length += self._long_length(31)
+            value = data[self._pos] | (data[self._pos + 1] << 8)
+            self._pos += 2
+            distance = (value >> 2) + 1
+            state = value & 0x3
+        elif inst >= 0x10:
+            # M4: copy within 16..48kB, or end of stream:
+            length = (inst & 0x7) + 2
+            if length == 2:
+                length += self._long_length(7)
+            value = data[self._pos] | (data[self._pos + 1] << 8)
+            self._pos += 2
+            distance = ((inst & 0x8) << 11) + (value >> 2)
+            state = value & 0x3
+            if distance == 0:
+                self.finished = True
+                return
+            distance += 16384
+        elif self._state == 0:
+            # M1 after a match without literals: copy 4 or more literals:
+            length = inst + 3
+            if length == 3:
+                length += self._long_length(15)
+            self._literals(length)
+            self._state = 4
+            return
+        else:
+            # M1 after literals: copy 2 bytes within 1kB (after 1..3 literals) or
+            # 3 bytes within 2..3kB (after 4 or more literals):
+            far = self._state == 4
+            distance = (inst >> 2) + (data[self._pos] << 2) + (2049 if far else 1)
+            self._pos += 1
+            length = 3 if far else 2
+            state = inst & 0x3
+
+        start = len(output) - distance
+        if start < 0:
+            raise ValueError("LZO match before the start of the output")
+        self._copy_check(length)
+        if distance >= length:
+            output += output[start : start + length]
+        else:
+            # Overlapping copy, repeating the last distance bytes:
+            pattern = output[start:]
+            output += (pattern * (length // distance + 1))[:length]
+
+        self._literals(state)
+        self._state = state
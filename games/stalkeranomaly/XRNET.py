@@ -1,6 +1,19 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from typing import List, Tuple
+
 from .XRIO import XRReader
 from .XRMath import IVec3, IVec4
 
+# Size of the quantised state of a bone: position (3 x u8), rotation (4 x u8) and
+# enabled (u8):
+STATE_SIZE = 8
+
+_STATE = struct.Struct("<8B")
+_PACKED_STATE = struct.Struct("<7Bx")
+
 
 class XRNETState:
     def __init__(self):
@@ -8,38 +21,72 @@ class XRNETState:
         self.quaternion = IVec4(0.0, 0.0, 0.0, 0.0)
         self.enabled = False
 
+    @staticmethod
+    def unpack(states: bytes, index: int, fmin: IVec3, fmax: IVec3) -> XRNETState:
+        """
+        Decode a state from packed quantised states (see `XRBoneData.states`).
+
+        Args:
+            states: The packed states.
+            index: Index of the state to decode.
+            fmin: Minimum of the positions.
+            fmax: Maximum of the positions.
+
+        Returns:
+            The decoded state.
+        """
+        (x, y, z, qx, qy, qz, qw, enabled) = _STATE.unpack_from(
+            states, index * STATE_SIZE
+        )
+        state = XRNETState()
+        state.position = IVec3(
+            _q8(x, fmin.x, fmax.x), _q8(y, fmin.y, fmax.y), _q8(z, fmin.z, fmax.z)
+        )
+        state.quaternion = IVec4(
+            _q8(qx, -1.0, 1.0),
+            _q8(qy, -1.0, 1.0),
+            _q8(qz, -1.0, 1.0),
+            _q8(qw, -1.0, 1.0),
+        )
+        state.enabled = bool(enabled)
+        return state
+
     def read(self, reader: XRReader, fmin: IVec3, fmax: IVec3):
-        self.position = self.fvec_q8(reader, fmin, fmax)
-        self.quaternion = self.fqt_q8(reader)
-        self.enabled = bool(reader.u8())
-
-    def clamp(self, val: float, low: float, high: float) -> float:
-        if val < low:
-            return low
-        elif val > high:
-            return high
-        else:
-            return val
-
-    def fvec_q8(self, reader: XRReader, fmin: IVec3, fmax: IVec3):
-        vec = IVec3(0.0, 0.0, 0.0)
-        vec.x = self.f_q8(reader, fmin.x, fmax.x)
-        vec.y = self.f_q8(reader, fmin.y, fmax.y)
-        vec.z = self.f_q8(reader, fmin.z, fmax.z)
-        vec.x = self.clamp(vec.x, fmin.x, fmax.x)
-        vec.y = self.clamp(vec.x, fmin.y, fmax.y)
-        vec.z = self.clamp(vec.z, fmin.z, fmax.z)
-
-    def fqt_q8(self, reader: XRReader):
-        vec = IVec4(0.0, 0.0, 0.0, 0.0)
-        vec.x = self.f_q8(reader, -1.0, 1.0)
-        vec.y = self.f_q8(reader, -1.0, 1.0)
-        vec.z = self.f_q8(reader, -1.0, 1.0)
-        vec.w = self.f_q8(reader, -1.0, 1.0)
-        vec.x = self.clamp(vec.x, -1.0, 1.0)
-        vec.y = self.clamp(vec.y, -1.0, 1.0)
-        vec.z = self.clamp(vec.z, -1.0, 1.0)
-        vec.w = self.clamp(vec.w, -1.0, 1.0)
-
-    def f_q8(self, reader: XRReader, fmin: float, fmax: float):
-        return (float(reader.u8()) / 255.0) * (fmax - fmin) + fmin
+        decoded = XRNETState.unpack(reader.read(STATE_SIZE), 0, fmin, fmax)
+        self.position = decoded.position
+        self.quaternion = decoded.quaternion
+        self.enabled = decoded.enabled
+
+
+def _q8(value: int, fmin: float, fmax: float) -> float:
+    # Dequantise a u8, the result is always within [fmin, fmax]:
+    return (float(value) / 255.0) * (fmax - fmin) + fmin
+
+
+def dequantize_states(
+    states: bytes, fmin: IVec3, fmax: IVec3
+) -> Tuple[array[float], array[float], List[bool]]:
+    """
+    Decode packed quantised states in bulk.
+
+    Args:
+        states: The packed states (see `XRBoneData.states`).
+        fmin: Minimum of the positions.
+        fmax: Maximum of the positions.
+
+    Returns:
+        The positions (x, y, z), quaternions (x, y, z, w) and enabled flags of the
+        states, as flat float arrays (3 and 4 values per state) and a list of
+        bools.
+    """
+    positions = array("f")
+    quaternions = array("f")
+    sx = (fmax.x - fmin.x) / 255.0
+    sy = (fmax.y - fmin.y) / 255.0
+    sz = (fmax.z - fmin.z) / 255.0
+    for x, y, z, qx, qy, qz, qw in _PACKED_STATE.iter_unpack(states):
+        positions.extend((x * sx + fmin.x, y * sy + fmin.y, z * sz + fmin.z))
+        quaternions.extend(
+            (qx / 127.5 - 1.0, qy / 127.5 - 1.0, qz / 127.5 - 1.0, qw / 127.5 - 1.0)
+        )
+    return (positions, quaternions, [bool(v) for v in states[7::STATE_SIZE]])
@@ -1,12 +1,14 @@
 # -*- encoding: utf-8 -*-
 
-import io
+import struct
+from array import array
 from enum import IntFlag
-from typing import List
+from typing import List, Optional, Tuple
 
 from .XRIO import XRReader
 from .XRMath import IFlag, IVec3
-from .XRNET import XRNETState
+from .XRNET import STATE_SIZE, XRNETState, dequantize_states
+from .XRSchema import XRCounted, XRSchema, XRWhen
 
 
 class XRFlag(IntFlag):
@@ -24,6 +26,15 @@ class XRFlag(IntFlag):
     TRADER_INFINITE_AMMO = 0x1
 
 
+# Converters of the schema fields:
+def _percent(value: float) -> float:
+    return value * 100
+
+
+def _is_one(value: int) -> bool:
+    return value == 1
+
+
 class XRAbstract:
     def __init__(self, name: str = ""):
         self._valid = False
@@ -44,43 +55,46 @@ class XRAbstract:
         self.spawn_id = 0
         self.ini_str = ""
 
+    SPAWN_SCHEMA = XRSchema(
+        ("name", "z"),
+        ("name2", "z"),
+        (None, "x"),  # temp_gt
+        ("rp", "B"),
+        ("position", "3f", IVec3),
+        ("angle", "3f", IVec3),
+        ("respawn_time", "H"),
+        ("id", "H"),
+        ("id_parent", "H"),
+        ("id_phantom", "H"),
+        ("flags", "H", IFlag),
+        XRWhen(lambda o: o.flags.has(XRFlag.SPAWN_VERSION), ("version", "H")),
+    )
+
+    # Fields depending on the spawn version:
+    SPAWN_VERSION_SCHEMA = XRSchema(
+        XRWhen(lambda o: o.version > 120, (lambda o, v: o.game_type.set(v), "H")),
+        XRWhen(lambda o: o.version > 69, ("script_version", "H")),
+        XRWhen(
+            lambda o: o.version > 93,
+            XRCounted(lambda o, v: o.client_data.extend(v), "H", "B"),
+        ),
+        XRWhen(
+            lambda o: 70 < o.version <= 93,
+            XRCounted(lambda o, v: o.client_data.extend(v), "B", "B"),
+        ),
+        XRWhen(lambda o: o.version > 79, ("spawn_id", "H")),
+    )
+
     def read_spawn(self, reader: XRReader):
         spawn = reader.u16()
         if spawn != XRFlag.MSG_SPAWN:
             self._valid = False
             return
-        self.name = reader.str()
-        self.name2 = reader.str()
-        reader.seek(1, io.SEEK_CUR)  # temp_gt
-        self.rp = reader.u8()
-        self.position = reader.fvec3()
-        self.angle = reader.fvec3()
-        self.respawn_time = reader.u16()
-        self.id = reader.u16()
-        self.id_parent = reader.u16()
-        self.id_phantom = reader.u16()
-        self.flags = IFlag(reader.u16())
-        if self.flags.has(XRFlag.SPAWN_VERSION):
-            self.version = reader.u16()
+        XRAbstract.SPAWN_SCHEMA.read(reader, self)
         if self.version == 0:
             reader._pos -= 2  # pyright: ignore[reportPrivateUsage]
             return
-        if self.version > 120:
-            self.game_type.set(reader.u16())
-        if self.version > 69:
-            self.script_version = reader.u16()
-        if self.version > 70:
-            cl_size = 0
-            if self.version > 93:
-                cl_size = reader.u16()
-            else:
-                cl_size = reader.u8()
-            if cl_size > 0:
-                for _ in range(cl_size):
-                    data = reader.u8()
-                    self.client_data.append(data)
-        if self.version > 79:
-            self.spawn_id = reader.u16()
+        XRAbstract.SPAWN_VERSION_SCHEMA.read(reader, self)
         self._valid = True
 
     def __bool__(self):
@@ -93,9 +107,10 @@ class XRVisual:
         self.startup_animation = ""
         self.flags = IFlag(0)
 
+    VISUAL_SCHEMA = XRSchema(("visual_name", "z"), ("flags", "B", IFlag))
+
     def read_visual(self, reader: XRReader, version: int):
-        self.visual_name = reader.str()
-        self.flags = IFlag(reader.u8())
+        XRVisual.VISUAL_SCHEMA.read(reader, self)
 
 
 class XRBoneData:
@@ -104,30 +119,59 @@ class XRBoneData:
         self.root_bone = 0
         self.min = IVec3(0.0, 0.0, 0.0)
         self.max = IVec3(0.0, 0.0, 0.0)
-        self.bones: list[XRNETState] = []
+        self.bones_count = 0
+        # Quantised states of the bones, packed (see XRNET.STATE_SIZE):
+        self.states = b""
+        self._bones: Optional[List[XRNETState]] = None
+
+    HEADER_SCHEMA = XRSchema(
+        ("bones_mask", "Q"),
+        ("root_bone", "H"),
+        ("min", "3f", IVec3),
+        ("max", "3f", IVec3),
+        ("bones_count", "H"),
+    )
 
     def load(self, reader: XRReader):
-        self.bones_mask = reader.u64()
-        self.root_bone = reader.u16()
-        self.min = reader.fvec3()
-        self.max = reader.fvec3()
-        bones_count = reader.u16()
-        for _ in range(bones_count):
-            bone = XRNETState()
-            bone.read(reader, self.min, self.max)
-            self.bones.append(bone)
+        XRBoneData.HEADER_SCHEMA.read(reader, self)
+        # The states are only decoded on demand (see `bones` and `dequantize`):
+        size = self.bones_count * STATE_SIZE
+        self.states = reader.read(size)
+        if len(self.states) != size:
+            raise struct.error(f"unpack requires a buffer of {size} bytes")
+        self._bones = None
+
+    @property
+    def bones(self) -> List[XRNETState]:
+        if self._bones is None:
+            self._bones = [
+                XRNETState.unpack(self.states, i, self.min, self.max)
+                for i in range(self.bones_count)
+            ]
+        return self._bones
+
+    def dequantize(self) -> Tuple["array[float]", "array[float]", List[bool]]:
+        """
+        Decode the states of all the bones at once, see `XRNET.dequantize_states`.
+        """
+        return dequantize_states(self.states, self.min, self.max)
 
 
 class XRSkeleton:
     def __init__(self):
         self.source_id = -1
+        self.skeleton_flags = IFlag(0)
         self.saved_bones = XRBoneData()
 
+    STATE_SCHEMA = XRSchema(
+        ("visual_animation", "z"),
+        ("skeleton_flags", "B", IFlag),
+        ("source_id", "H"),
+    )
+
     def read_state(self, reader: XRReader):
-        self.visual_animation = reader.str()
-        flags = IFlag(reader.u8())
-        self.source_id = reader.u16()
-        if flags.has(4):
+        XRSkeleton.STATE_SCHEMA.read(reader, self)
+        if self.skeleton_flags.has(4):
             self.saved_bones.load(reader)
 
 
@@ -149,15 +193,19 @@ class XRObject(XRAbstract):
             return
         self.read_state(reader)
 
+    STATE_SCHEMA = XRSchema(
+        ("graph_id", "H"),
+        ("distance", "f"),
+        ("direct_control", "I", bool),
+        ("node_id", "I"),
+        (lambda o, v: o.flags.set(v), "I"),
+        ("ini_str", "z"),
+        ("story_id", "I"),
+        ("spawn_story_id", "I"),
+    )
+
     def read_state(self, reader: XRReader):
-        self.graph_id = reader.u16()
-        self.distance = reader.float()
-        self.direct_control = bool(reader.u32())
-        self.node_id = reader.u32()
-        self.flags.set(reader.u32())
-        self.ini_str = reader.str()
-        self.story_id = reader.u32()
-        self.spawn_story_id = reader.u32()
+        XRObject.STATE_SCHEMA.read(reader, self)
 
     def read_update(self, reader: XRReader):
         update = reader.u16()
@@ -192,23 +240,20 @@ class XRCreatureAbstract(XRDynamicObjectVisual):
         self.killer_id = -1
         self.death_time = 0
 
+    STATE_SCHEMA = XRSchema(
+        ("team", "B"),
+        ("squad", "B"),
+        ("group", "B"),
+        ("health", "f", _percent),
+        XRCounted(lambda o, v: o.dynamic_out.extend(v), "I", "H"),
+        XRCounted(lambda o, v: o.dynamic_in.extend(v), "I", "H"),
+        ("killer_id", "H"),
+        ("death_time", "Q"),
+    )
+
     def read_state(self, reader: XRReader):
         super().read_state(reader)
-        self.team = reader.u8()
-        self.squad = reader.u8()
-        self.group = reader.u8()
-        self.health = reader.float() * 100
-
-        for _ in range(reader.u32()):
-            _id = reader.u16()
-            self.dynamic_out.append(_id)
-
-        for _ in range(reader.u32()):
-            _id = reader.u16()
-            self.dynamic_in.append(_id)
-
-        self.killer_id = reader.u16()
-        self.death_time = reader.u64()
+        XRCreatureAbstract.STATE_SCHEMA.read(reader, self)
 
 
 class XRTraderAbstract:
@@ -227,17 +272,21 @@ class XRTraderAbstract:
         self.trader_flags = IFlag(0)
         self.trader_flags.remove(XRFlag.TRADER_INFINITE_AMMO)
 
+    STATE_SCHEMA = XRSchema(
+        ("money", "I"),
+        ("specific_character", "z"),
+        (lambda o, v: o.trader_flags.assign(v), "I"),
+        ("character_profile", "z"),
+        ("community_index", "i"),
+        ("rank", "i"),
+        ("reputation", "i"),
+        ("character_name_str", "z"),
+        ("dead_body_can_take", "B", _is_one),
+        ("dead_body_closed", "B", _is_one),
+    )
+
     def read_state(self, reader: XRReader):
-        self.money = reader.u32()
-        self.specific_character = reader.str()
-        self.trader_flags.assign(reader.u32())
-        self.character_profile = reader.str()
-        self.community_index = reader.s32()
-        self.rank = reader.s32()
-        self.reputation = reader.s32()
-        self.character_name_str = reader.str()
-        self.dead_body_can_take = reader.u8() == 1
-        self.dead_body_closed = reader.u8() == 1
+        XRTraderAbstract.STATE_SCHEMA.read(reader, self)
 
 
 class XRCreatureActor(XRCreatureAbstract, XRTraderAbstract, XRSkeleton):
@@ -262,16 +311,16 @@ class XRCreatureActor(XRCreatureAbstract, XRTraderAbstract, XRSkeleton):
         XRSkeleton.read_state(self, reader)
         self.holder_id = reader.u16()
 
+    UPDATE_SCHEMA = XRSchema(
+        ("state", "H"),
+        (None, "6x"),  # acceleration (r_sdir: u16 + float)
+        (None, "6x"),  # velocity (r_sdir: u16 + float)
+        ("radiation", "f"),
+        ("weapon", "B"),
+        ("num_items", "H"),
+    )
+
     def read_update(self, reader: XRReader):
         XRCreatureAbstract.read_update(self, reader)
         # XRTraderAbstract.read_update(self, reader)  # Future?
-        self.state = reader.u16()
-        # acceleration (r_sdir)
-        reader.seek(2, io.SEEK_CUR)  # u16
-        reader.seek(4, io.SEEK_CUR)  # float
-        # velocity (r_sdir)
-        reader.seek(2, io.SEEK_CUR)  # u16
-        reader.seek(4, io.SEEK_CUR)  # float
-        self.radiation = reader.float()
-        self.weapon = reader.u8()
-        self.num_items = reader.u16()
+        XRCreatureActor.UPDATE_SCHEMA.read(reader, self)
@@ -1,18 +1,63 @@
 import io
+import mmap
 import struct
 from datetime import datetime
 from pathlib import Path
-from typing import BinaryIO, Optional, cast
+from typing import BinaryIO, NamedTuple, Optional, Sequence, get_type_hints
 
-import lzokay  # pyright: ignore[reportMissingTypeStubs]
-
-from .XRIO import XRReader, XRStream
+from .XRIO import XRStream
+from .XRLZO import LZO1XDecoder
 from .XRObject import XRCreatureActor, XRFlag
 
+_CHUNK_HEADER = struct.Struct("<II")
+_PACKET_SIZE = struct.Struct("<H")
+
+
+class XRSaveSummary(NamedTuple):
+    """The fields of a save shown by MO2, without the parsed objects."""
+
+    save: str
+    time: str
+    name: str
+    faction: str
+    health: float
+    money: int
+    rank: int
+    rank_name: str
+    reputation: int
+    reputation_name: str
+
+    @classmethod
+    def from_values(cls, values: Sequence[object]) -> "XRSaveSummary":
+        """
+        Build a summary from the values of its fields, e.g. read from a cache.
+
+        Args:
+            values: The values, in the order of the fields.
+
+        Returns:
+            The summary.
+
+        Raises:
+            ValueError: If the values do not match the fields.
+        """
+        if len(values) != len(cls._fields):
+            raise ValueError(f"expected {len(cls._fields)} values, got {len(values)}")
+        hints = get_type_hints(cls)
+        fields: list[object] = []
+        for name, value in zip(cls._fields, values):
+            kind = hints[name]
+            if kind is float and isinstance(value, int):
+                value = float(value)
+            if not isinstance(value, kind):
+                raise ValueError(f"invalid {name} {value!r}")
+            fields.append(value)
+        return cls._make(fields)
+
 
 class XRSave:
     filepath: Path
-    player: XRCreatureActor
+    player: Optional[XRCreatureActor]
 
     _factions = {
         0: "Loner",
@@ -72,8 +117,19 @@ class XRSave:
         "max": "Excellent",
     }
 
-    def __init__(self, filepath: Path):
+    # Default maximum size of the decompressed part of a save:
+    MAX_OUTPUT = 256 * 1024 * 1024
+
+    def __init__(self, filepath: Path, max_output: int = MAX_OUTPUT):
+        """
+        Args:
+            filepath: Path to the save.
+            max_output (optional): Maximum size of the decompressed part of the
+                save. Larger saves are treated as corrupted.
+        """
         self.filepath = filepath
+        self.max_output = max_output
+        self.player = None
         self.fetchInfo()
         with open(filepath, "rb") as file:
             stream = self.readFile(file)
@@ -106,34 +162,95 @@ class XRSave:
 
         (start, version, source) = struct.unpack("@iii", file.read(12))
         if (start == -1) and (version >= 6):
-            file.seek(12)
-            data = file.read(size - 12)
-            return XRStream(
-                cast(
-                    bytes,
-                    lzokay.decompress(  # pyright: ignore[reportUnknownMemberType]
-                        data, source
-                    ),
-                )
-            )
+            # Only the pages of the file holding the decompressed part are read:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                decoder = LZO1XDecoder(data, min(source, self.max_output), 12)
+                return XRStream(self.decompressObject(decoder))
 
         return None
 
+    @staticmethod
+    def decompressObject(decoder: LZO1XDecoder) -> bytearray:
+        """
+        Decompress the save until the actor record of the object chunk, the first
+        record of the chunk.
+
+        Args:
+            decoder: Decoder of the save payload.
+
+        Returns:
+            The decompressed part of the save, ending with the actor record unless
+            the save is truncated.
+        """
+        pos = 0
+        while decoder.decompress(pos + _CHUNK_HEADER.size) >= pos + _CHUNK_HEADER.size:
+            (dw_type, dw_size) = _CHUNK_HEADER.unpack_from(decoder.output, pos)
+            pos += _CHUNK_HEADER.size
+            if (dw_type & ~(1 << 31)) != XRFlag.CHUNK_OBJECT:
+                pos += dw_size
+                continue
+
+            # Object count, followed by the sizes and content of the spawn and
+            # update packets of the actor:
+            end = pos + 4
+            for _ in range(2):
+                if decoder.decompress(end + 2) < end + 2:
+                    break
+                end += 2 + _PACKET_SIZE.unpack_from(decoder.output, end)[0]
+            decoder.decompress(end)
+            break
+
+        return decoder.output
+
     def readObject(self, stream: XRStream):
         chunk = stream.open_chunk(XRFlag.CHUNK_OBJECT)
         if chunk:
             chunk.seek(4, io.SEEK_CUR)  # obj_count
             count_spawn = chunk.u16()
-            spawn = XRReader(chunk.read(count_spawn))
+            spawn = chunk.sub_reader(count_spawn)
             actor = XRCreatureActor()
             actor.read_spawn(spawn)
             count_update = chunk.u16()
-            update = XRReader(chunk.read(count_update))
+            update = chunk.sub_reader(count_update)
             actor.read_update(update)
             if actor:
                 self.player = actor
         return None
 
+    def summary(self) -> Optional[XRSaveSummary]:
+        """
+        Returns:
+            The summary of the save, or None if the save has no player.
+        """
+        player = self.player
+        if not player:
+            return None
+        return XRSaveSummary(
+            save=self.save_fmt,
+            time=self.time_fmt,
+            name=player.character_name_str,
+            faction=self.getFaction(),
+            health=player.health,
+            money=player.money,
+            rank=player.rank,
+            rank_name=self.getRank(),
+            reputation=player.reputation,
+            reputation_name=self.getReputation(),
+        )
+
+    @staticmethod
+    def read_summary(filepath: Path) -> Optional[XRSaveSummary]:
+        """
+        Read the summary of a save, dropping the parsed objects right away.
+
+        Args:
+            filepath: Path to the save.
+
+        Returns:
+            The summary of the save, or None if the save has no player.
+        """
+        return XRSave(filepath).summary()
+
     def getFaction(self) -> str:
         player = self.player
         if player:
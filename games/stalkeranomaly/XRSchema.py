@@ -0,0 +1,176 @@
+# -*- encoding: utf-8 -*-
+from __future__ import annotations
+
+import re
+import struct
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from .XRIO import XRReader
+
+# Target of a field: the name of the attribute to set, a function setting the value
+# on the object, or None to only read (or skip) the field:
+XRTarget = Union[str, Callable[[Any, Any], None], None]
+
+# A field: (target, code) or (target, code, convert), where code is a struct code
+# with an optional repeat count (e.g. "H", "3f" or "12x"), or "z" for a
+# null-terminated string, and convert builds the value from the unpacked values:
+XRField = Union[
+    Tuple[XRTarget, str],
+    Tuple[XRTarget, str, Callable[..., Any]],
+    "XRCounted",
+    "XRWhen",
+]
+
+_CODE_PATTERN = re.compile(r"(\d*)([xcbB?hHiIlLqQfds])")
+
+_Operation = Callable[[XRReader, Any], None]
+
+
+class XRCounted:
+    """Array of fixed-width items, preceded by the number of items."""
+
+    def __init__(
+        self,
+        target: XRTarget,
+        count_code: str,
+        item_code: str,
+        convert: Optional[Callable[[List[Any]], Any]] = None,
+    ):
+        """
+        Args:
+            target: Target of the array.
+            count_code: Struct code of the number of items, e.g. "I".
+            item_code: Struct code of an item, e.g. "H".
+            convert (optional): Function building the value from the list of items.
+        """
+        self.target = target
+        self.count = struct.Struct(f"<{count_code}")
+        self.item_code = item_code
+        self.convert = convert
+
+
+class XRWhen:
+    """Fields only present when a condition holds, e.g. for some versions."""
+
+    def __init__(self, condition: Callable[[Any], bool], *fields: XRField):
+        """
+        Args:
+            condition: Function checking the object read so far.
+            fields: The conditional fields.
+        """
+        self.condition = condition
+        self.schema = XRSchema(*fields)
+
+
+def _setter(target: XRTarget) -> Callable[[Any, Any], None]:
+    if target is None:
+        return lambda obj, value: None
+    if isinstance(target, str):
+        name = target
+        return lambda obj, value: setattr(obj, name, value)
+    return target
+
+
+class XRSchema:
+    """
+    Declarative layout of a binary record.
+
+    Consecutive fixed-width fields are compiled into a single struct unpack, the
+    other fields (strings, arrays and conditional fields) are read individually.
+    """
+
+    def __init__(self, *fields: XRField):
+        """
+        Args:
+            fields: The fields of the record, in order.
+        """
+        self._operations: List[_Operation] = []
+        fixed: List[Tuple[XRTarget, str, Optional[Callable[..., Any]]]] = []
+        for field in fields:
+            if isinstance(field, tuple) and field[1] != "z":
+                convert = field[2] if len(field) > 2 else None
+                fixed.append((field[0], field[1], convert))
+                continue
+            if fixed:
+                self._operations.append(self._compile_fixed(fixed))
+                fixed = []
+            if isinstance(field, XRCounted):
+                self._operations.append(self._compile_counted(field))
+            elif isinstance(field, XRWhen):
+                self._operations.append(self._compile_when(field))
+            else:
+                self._operations.append(self._compile_string(field))
+        if fixed:
+            self._operations.append(self._compile_fixed(fixed))
+
+    @staticmethod
+    def _compile_fixed(
+        fields: Sequence[Tuple[XRTarget, str, Optional[Callable[..., Any]]]],
+    ) -> _Operation:
+        # Each field gets a slice of the values of the combined unpack:
+        fmt = "<"
+        index = 0
+        slices: List[Tuple[Callable[[Any, Any], None], int, int, Any]] = []
+        for target, code, convert in fields:
+            fmt += code
+            count = 0
+            for repeat, char in _CODE_PATTERN.findall(code):
+                if char != "x":
+                    count += 1 if char == "s" else int(repeat or 1)
+            if count:
+                slices.append((_setter(target), index, count, convert))
+            index += count
+        unpacker = struct.Struct(fmt)
+
+        def read(reader: XRReader, obj: Any):
+            values = reader.unpack(unpacker)
+            for setter, start, count, convert in slices:
+                if convert is not None:
+                    setter(obj, convert(*values[start : start + count]))
+                elif count == 1:
+                    setter(obj, values[start])
+                else:
+                    setter(obj, values[start : start + count])
+
+        return read
+
+    @staticmethod
+    def _compile_string(field: Any) -> _Operation:
+        setter = _setter(field[0])
+        convert = field[2] if len(field) > 2 else None
+
+        def read(reader: XRReader, obj: Any):
+            value = reader.str()
+            setter(obj, value if convert is None else convert(value))
+
+        return read
+
+    @staticmethod
+    def _compile_counted(field: XRCounted) -> _Operation:
+        setter = _setter(field.target)
+
+        def read(reader: XRReader, obj: Any):
+            (count,) = reader.unpack(field.count)
+            items = list(reader.unpack(struct.Struct(f"<{count}{field.item_code}")))
+            setter(obj, items if field.convert is None else field.convert(items))
+
+        return read
+
+    @staticmethod
+    def _compile_when(field: XRWhen) -> _Operation:
+        def read(reader: XRReader, obj: Any):
+            if field.condition(obj):
+                field.schema.read(reader, obj)
+
+        return read
+
+    def read(self, reader: XRReader, obj: Any) -> None:
+        """
+        Read the record, setting the fields on the given object.
+
+        Args:
+            reader: The reader, positioned at the start of the record.
+            obj: The object to set the fields on.
+        """
+        for operation in self._operations:
+            operation(reader, obj)
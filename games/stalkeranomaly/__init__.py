@@ -1,4 +1,5 @@
 from .XRIO import XRReader, XRStream
+from .XRLZO import LZO1XDecoder
 from .XRMath import IFlag, IVec3, IVec4
 from .XRNET import XRNETState
 from .XRObject import (
@@ -14,14 +15,17 @@ from .XRObject import (
     XRTraderAbstract,
     XRVisual,
 )
-from .XRSave import XRSave
+from .XRSave import XRSave, XRSaveSummary
+from .XRSchema import XRCounted, XRSchema, XRWhen
 
 __all__ = [
     "IFlag",
     "IVec3",
     "IVec4",
+    "LZO1XDecoder",
     "XRAbstract",
     "XRBoneData",
+    "XRCounted",
     "XRCreatureAbstract",
     "XRCreatureActor",
     "XRDynamicObject",
@@ -31,8 +35,11 @@ __all__ = [
     "XRObject",
     "XRReader",
     "XRSave",
+    "XRSaveSummary",
+    "XRSchema",
     "XRSkeleton",
     "XRStream",
     "XRTraderAbstract",
     "XRVisual",
+    "XRWhen",
 ]
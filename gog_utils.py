@@ -1,11 +1,27 @@
 # Code adapted from EzioTheDeadPoet / erri120:
 #     https://github.com/ModOrganizer2/modorganizer-basic_games/pull/5
 
+from __future__ import annotations
+
 import winreg
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discovery_utils import ManifestCache
+
+
+def find_games(cache: ManifestCache | None = None) -> dict[str, Path]:
+    """
+    Find the list of GOG games installed.
 
+    Args:
+        cache: Cache for the manifest files, unused since GOG games are read from
+            the registry.
 
-def find_games() -> dict[str, Path]:
+    Returns:
+        A mapping from GOG game IDs to install locations.
+    """
     # List the game IDs from the registry:
     game_ids: list[str] = []
     try:
@@ -2,15 +2,21 @@
 
 # Heavily influenced by https://github.com/erri120/GameFinder
 
-import os
+from __future__ import annotations
+
 import threading
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from urllib import parse
 
 import psutil
 
+from .variables_utils import expand_environment
+
+if TYPE_CHECKING:
+    from .discovery_utils import ManifestCache
+
 
 class OriginWatcher:
     """
@@ -62,38 +68,60 @@ class OriginWatcher:
             time.sleep(1)
 
 
-def find_games() -> Dict[str, Path]:
+def parse_manifest(manifest: Path) -> List[List[str]]:
+    """
+    Read an Origin manifest (.mfst) file.
+
+    Returns:
+        A list of (manifest ID, install location) found in the manifest.
+    """
+    # Read the file and look for &id= and &dipinstallpath=
+    with open(manifest, "r") as f:
+        manifest_query = f.read()
+    url = parse.urlparse(manifest_query)
+    query = parse.parse_qs(url.query)
+    if "id" not in query:
+        # If id is not present, we have no clue what to do.
+        return []
+    if "dipinstallpath" not in query:
+        # We could query the Origin server for the install location but... no?
+        return []
+
+    return [[id_, path_] for id_ in query["id"] for path_ in query["dipinstallpath"]]
+
+
+def find_games(cache: ManifestCache | None = None) -> Dict[str, Path]:
     """
     Find the list of Origin games installed.
 
+    Args:
+        cache: Cache for the manifest files.
+
     Returns:
         A mapping from Origin manifest IDs to install locations for available
         Origin games.
     """
     games: Dict[str, Path] = {}
 
-    program_data_path = os.path.expandvars("%PROGRAMDATA%")
+    program_data_path = expand_environment("%PROGRAMDATA%")
     local_content_path = Path(program_data_path).joinpath("Origin", "LocalContent")
-    for manifest in local_content_path.glob("**/*.mfst"):
+    if cache is None:
+        manifests = list(local_content_path.glob("**/*.mfst"))
+    else:
+        manifests = cache.glob(local_content_path, "*.mfst", recursive=True)
+
+    for manifest in manifests:
         # Skip any manifest file with '@steam'
         if "@steam" in manifest.name.lower():
             continue
 
-        # Read the file and look for &id= and &dipinstallpath=
-        with open(manifest, "r") as f:
-            manifest_query = f.read()
-        url = parse.urlparse(manifest_query)
-        query = parse.parse_qs(url.query)
-        if "id" not in query:
-            # If id is not present, we have no clue what to do.
-            continue
-        if "dipinstallpath" not in query:
-            # We could query the Origin server for the install location but... no?
-            continue
+        if cache is None:
+            entries = parse_manifest(manifest)
+        else:
+            entries = cache.parse(manifest, parse_manifest)
 
-        for id_ in query["id"]:
-            for path_ in query["dipinstallpath"]:
-                games[id_] = Path(path_)
+        for id_, path_ in entries:
+            games[id_] = Path(path_)
 
     return games
 
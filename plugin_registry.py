@@ -0,0 +1,399 @@
+# -*- encoding: utf-8 -*-
+
+# Static registry of the python game plugins, used to create lightweight proxies
+# instead of importing every game module at startup. The registry is generated from
+# the game modules without importing them (so neither mobase nor PyQt6 is needed):
+#
+#   python plugin_registry.py
+#
+# and checked (e.g. before a release) with `python plugin_registry.py --check`.
+#
+# A module is only listed if all its game plugins can be proxied (see
+# `_class_entry`), and the registry stores a hash of each listed module, so a
+# modified module is simply imported until the registry is generated again.
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, cast
+
+# Name of the generated registry module, in the games folder:
+REGISTRY_MODULE = "_registry"
+
+# Attributes read by BasicGameMappings, the only ones stored in the registry:
+MAPPING_ATTRIBUTES = {
+    "Name",
+    "Author",
+    "Version",
+    "Description",
+    "GameName",
+    "GameShortName",
+    "GameNexusName",
+    "GameValidShortNames",
+    "GameNexusId",
+    "GameBinary",
+    "GameLauncher",
+    "GameDataPath",
+    "GameDocumentsDirectory",
+    "GameIniFiles",
+    "GameSavesDirectory",
+    "GameSaveExtension",
+    "GameSaveExtensions",
+    "GameSavesMaxDepth",
+    "GameSavesPruneDirectories",
+    "GameSteamId",
+    "GameGogId",
+    "GameOriginManifestIds",
+    "GameOriginWatcherExecutables",
+    "GameEpicId",
+    "GameEaDesktopId",
+    "GameSupportURL",
+}
+
+# Methods of IPlugin / IPluginGame (and the file mapper) that MO2 may call:
+INTERFACE_METHODS = {
+    "author",
+    "description",
+    "enabledByDefault",
+    "init",
+    "localizedName",
+    "master",
+    "name",
+    "requirements",
+    "settings",
+    "version",
+    "CCPlugins",
+    "DLCPlugins",
+    "binaryName",
+    "dataDirectory",
+    "detectGame",
+    "documentsDirectory",
+    "eaDesktopContentId",
+    "epicAPPId",
+    "executableForcedLoads",
+    "executables",
+    "gameDirectory",
+    "gameIcon",
+    "gameName",
+    "gameNexusName",
+    "gameShortName",
+    "gameVariants",
+    "gameVersion",
+    "getLauncherName",
+    "getModMappings",
+    "getSupportURL",
+    "gogAPPId",
+    "iniFiles",
+    "initializeProfile",
+    "isActive",
+    "isInstalled",
+    "listSaves",
+    "loadOrderMechanism",
+    "looksValid",
+    "lootGameName",
+    "mappings",
+    "nexusGameID",
+    "nexusModOrganizerID",
+    "primaryPlugins",
+    "primarySources",
+    "savegameExtension",
+    "savesDirectory",
+    "secondaryDataDirectories",
+    "setGamePath",
+    "setGameVariant",
+    "sortMechanism",
+    "steamAPPId",
+    "validShortNames",
+    "_featureList",
+}
+
+# Methods only used for the managed game, that the proxies forward to the actual
+# plugin (importing it on first use). A plugin overriding any other interface
+# method cannot be proxied:
+FORWARDED_METHODS = {
+    "dataDirectory",
+    "documentsDirectory",
+    "executableForcedLoads",
+    "executables",
+    "gameVersion",
+    "iniFiles",
+    "initializeProfile",
+    "listSaves",
+    "savesDirectory",
+    "setGameVariant",
+    "_featureList",
+}
+
+
+def module_hash(path: Path) -> str:
+    """
+    Compute the hash of a game module, ignoring line endings.
+
+    Args:
+        path: Path to the module.
+
+    Returns:
+        The hexadecimal SHA-1 of the module content.
+    """
+    return hashlib.sha1(path.read_bytes().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def _class_entry(
+    node: ast.ClassDef, proxiable: dict[str, dict[str, Any]]
+) -> dict[str, Any] | None:
+    """
+    Extract the registry attributes of a game plugin class.
+
+    Args:
+        node: The class definition.
+        proxiable: Attributes of the classes previously found in the same module
+            that can be proxied, by class name.
+
+    Returns:
+        The attributes of the class (including inherited ones), or None if the
+        class cannot be proxied.
+    """
+    if node.keywords or node.decorator_list:
+        return None
+
+    attributes: dict[str, Any] = {}
+    for base in reversed(node.bases):
+        if isinstance(base, ast.Name) and base.id == "BasicGame":
+            continue
+        if isinstance(base, ast.Name) and base.id in proxiable:
+            attributes.update(proxiable[base.id])
+            continue
+        return None
+
+    for statement in node.body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if statement.name == "__init__" or (
+                statement.name in INTERFACE_METHODS
+                and statement.name not in FORWARDED_METHODS
+                and statement.name != "init"
+            ):
+                return None
+        elif isinstance(statement, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                statement.targets
+                if isinstance(statement, ast.Assign)
+                else [statement.target]
+            )
+            names = [t.id for t in targets if isinstance(t, ast.Name)]
+            if not MAPPING_ATTRIBUTES.intersection(names):
+                continue
+            if statement.value is None or len(names) != len(targets):
+                return None
+            try:
+                value = ast.literal_eval(statement.value)
+            except ValueError:
+                return None
+            for name in names:
+                attributes[name] = value
+
+    return attributes
+
+
+def module_entry(path: Path) -> dict[str, Any] | None:
+    """
+    Build the registry entry for a game module.
+
+    Args:
+        path: Path to the game module.
+
+    Returns:
+        The registry entry, or None if the module does not contain any game plugin
+        or contains a game plugin that cannot be proxied.
+    """
+    tree = ast.parse(path.read_bytes(), str(path))
+
+    # All the classes deriving from BasicGame are game plugins:
+    game_classes: set[str] = {"BasicGame"}
+    proxiable: dict[str, dict[str, Any]] = {}
+    plugins: list[dict[str, Any]] = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = [ast.unparse(base) for base in node.bases]
+        if not game_classes.intersection(bases):
+            continue
+        game_classes.add(node.name)
+
+        attributes = _class_entry(node, proxiable)
+        if attributes is None:
+            return None
+        proxiable[node.name] = attributes
+        plugins.append({"class": node.name, "attributes": attributes})
+
+    if not plugins:
+        return None
+
+    return {"hash": module_hash(path), "plugins": plugins}
+
+
+def build_registry(games_path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Build the registry for the game modules in the given folder.
+
+    Args:
+        games_path: The folder containing the game modules.
+
+    Returns:
+        A mapping from module name to registry entry.
+    """
+    registry: dict[str, dict[str, Any]] = {}
+    for path in sorted(games_path.glob("*.py")):
+        if path.name.startswith("_"):
+            continue
+        try:
+            entry = module_entry(path)
+        except SyntaxError as e:
+            print(f"Failed to parse {path.name}: {e}", file=sys.stderr)
+            continue
+        if entry is not None:
+            registry[path.stem] = entry
+    return registry
+
+
+def _format(value: Any, indent: int = 0) -> str:
+    # Format a literal the same way black would (one item per line):
+    prefix = " " * (indent + 4)
+    if isinstance(value, dict) and value:
+        lines = [
+            f"{prefix}{_format(k)}: {_format(v, indent + 4)},\n"
+            for k, v in cast(dict[str, Any], value).items()
+        ]
+        return "{\n" + "".join(lines) + " " * indent + "}"
+    if isinstance(value, list) and value:
+        lines = [f"{prefix}{_format(v, indent + 4)},\n" for v in cast(list[Any], value)]
+        return "[\n" + "".join(lines) + " " * indent + "]"
+    if isinstance(value, str):
+        return '"' + repr(value)[1:-1].replace('"', '\\"') + '"'
+    return repr(cast(object, value))
+
+
+def write_registry(games_path: Path) -> dict[str, dict[str, Any]]:
+    """
+    Generate the registry module for the game modules in the given folder.
+
+    Args:
+        games_path: The folder containing the game modules.
+
+    Returns:
+        The registry that was written.
+    """
+    registry = build_registry(games_path)
+    games_path.joinpath(f"{REGISTRY_MODULE}.py").write_text(
+        "# This file is generated by plugin_registry.py, do not edit it manually.\n"
+        "\n"
+        "from typing import Any\n"
+        "\n"
+        f"REGISTRY: dict[str, dict[str, Any]] = {_format(registry)}\n",
+        encoding="utf-8",
+    )
+    return registry
+
+
+def load_registry(package: str) -> dict[str, dict[str, Any]]:
+    """
+    Load the generated registry.
+
+    Args:
+        package: The package containing the games folder.
+
+    Returns:
+        A mapping from module name to registry entry, empty if the registry is
+        missing or invalid.
+    """
+    try:
+        module = importlib.import_module(f".games.{REGISTRY_MODULE}", package)
+        registry: dict[str, dict[str, Any]] = module.REGISTRY
+        return registry
+    except Exception as e:
+        print(f"Failed to load the game plugin registry: {e}", file=sys.stderr)
+        return {}
+
+
+def registry_entry(
+    registry: dict[str, dict[str, Any]], path: Path
+) -> dict[str, Any] | None:
+    """
+    Retrieve the registry entry for a game module, if the module did not change
+    since the registry was generated. A warning is printed for a module that
+    changed, as the registry should be generated again.
+
+    Args:
+        registry: The registry.
+        path: Path to the game module.
+
+    Returns:
+        The registry entry, or None if the module is not in the registry or is out
+        of date.
+    """
+    entry = registry.get(path.stem)
+    if entry is None:
+        return None
+    if entry["hash"] != module_hash(path):
+        print(
+            f"Game module {path.name} changed since the plugin registry was"
+            " generated, importing it (run plugin_registry.py to update the"
+            " registry).",
+            file=sys.stderr,
+        )
+        return None
+    return entry
+
+
+def stale_modules(games_path: Path) -> list[str]:
+    """
+    Compare the registry module in the given folder with the game modules.
+
+    Args:
+        games_path: The folder containing the game modules and the registry.
+
+    Returns:
+        The names of the modules whose registry entry is missing, out of date or
+        should not exist, empty if the registry is up to date.
+    """
+    tree = ast.parse(games_path.joinpath(f"{REGISTRY_MODULE}.py").read_bytes())
+    current: dict[str, dict[str, Any]] = {}
+    for node in tree.body:
+        if (
+            isinstance(node, ast.AnnAssign)
+            and isinstance(node.target, ast.Name)
+            and node.target.id == "REGISTRY"
+            and node.value is not None
+        ):
+            current = ast.literal_eval(node.value)
+
+    expected = build_registry(games_path)
+    return sorted(
+        name
+        for name in current.keys() | expected.keys()
+        if current.get(name) != expected.get(name)
+    )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--check"]:
+        stale = stale_modules(Path(__file__).parent.joinpath("games"))
+        if stale:
+            print(
+                "The plugin registry is out of date for {}, run plugin_registry.py"
+                " to update it.".format(", ".join(stale)),
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        sys.exit(0)
+
+    registry = write_registry(Path(__file__).parent.joinpath("games"))
+    for name, entry in registry.items():
+        print(
+            "Registered {}: {}.".format(
+                name, ", ".join(plugin["class"] for plugin in entry["plugins"])
+            )
+        )
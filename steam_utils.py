@@ -1,12 +1,17 @@
 # Code greatly inspired by https://github.com/LostDragonist/steam-library-setup-tool
 
+from __future__ import annotations
+
 import sys
 import winreg
 from pathlib import Path
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, TypedDict, cast
 
 import vdf  # pyright: ignore[reportMissingTypeStubs]
 
+if TYPE_CHECKING:
+    from .discovery_utils import ManifestCache
+
 
 class SteamGame:
     def __init__(self, appid: str, installdir: str):
@@ -38,40 +43,74 @@ class _LibraryFolders(TypedDict, total=False):
     LibraryFolders: dict[str, str]
 
 
+def parse_app_manifest(filepath: Path) -> list[str] | None:
+    """
+    Read an application manifest (appmanifest_*.acf) from a library folder.
+
+    Args:
+        filepath: Path to the manifest.
+
+    Returns:
+        The application ID and installation folder, or None if the manifest is
+        invalid.
+
+    Raises:
+        OSError: If the manifest cannot be read, e.g. while Steam rewrites it (so
+            the failure is not cached).
+    """
+    try:
+        with open(filepath, "r", encoding="utf-8") as fp:
+            info = cast(
+                _AppManifest,
+                vdf.load(fp),  # pyright: ignore[reportUnknownMemberType]
+            )
+            app_state = info["AppState"]
+    except KeyError:
+        print(
+            f'Unable to read application state from "{filepath}"',
+            file=sys.stderr,
+        )
+        return None
+    except OSError:
+        raise
+    except Exception as e:
+        print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
+        return None
+
+    try:
+        return [app_state["appid"], app_state["installdir"]]
+    except KeyError:
+        print(
+            f"Unable to read application ID or installation folder "
+            f'from "{filepath}"',
+            file=sys.stderr,
+        )
+        return None
+
+
 class LibraryFolder:
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, cache: ManifestCache | None = None):
         self.path = path
 
         self.games: list[SteamGame] = []
-        for filepath in path.joinpath("steamapps").glob("appmanifest_*.acf"):
-            try:
-                with open(filepath, "r", encoding="utf-8") as fp:
-                    info = cast(
-                        _AppManifest,
-                        vdf.load(fp),  # pyright: ignore[reportUnknownMemberType]
-                    )
-                    app_state = info["AppState"]
-            except KeyError:
-                print(
-                    f'Unable to read application state from "{filepath}"',
-                    file=sys.stderr,
-                )
-                continue
-            except Exception as e:
-                print(f'Unable to parse file "{filepath}": {e}', file=sys.stderr)
-                continue
 
+        steamapps_path = path.joinpath("steamapps")
+        if cache is None:
+            manifests = list(steamapps_path.glob("appmanifest_*.acf"))
+        else:
+            manifests = cache.glob(steamapps_path, "appmanifest_*.acf")
+
+        for filepath in manifests:
             try:
-                app_id = app_state["appid"]
-                install_dir = app_state["installdir"]
-                self.games.append(SteamGame(app_id, install_dir))
-            except KeyError:
-                print(
-                    f"Unable to read application ID or installation folder "
-                    f'from "{filepath}"',
-                    file=sys.stderr,
-                )
+                if cache is None:
+                    app = parse_app_manifest(filepath)
+                else:
+                    app = cache.parse(filepath, parse_app_manifest)
+            except OSError as e:
+                print(f'Unable to read file "{filepath}": {e}', file=sys.stderr)
                 continue
+            if app:
+                self.games.append(SteamGame(*app))
 
     def __repr__(self):
         return str(self)
@@ -80,16 +119,16 @@ class LibraryFolder:
         return "LibraryFolder at {}: {}".format(self.path, self.games)
 
 
-def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
+def parse_library_paths(library_vdf_path: Path) -> list[str]:
     """
-    Read library folders from the main library file.
+    Read the paths of the library folders from the main library file.
 
     Args:
         library_vdf_path: The main library file (from the Steam installation
             folder).
 
     Returns:
-        A list of LibraryFolder, for each library found.
+        The path of each library found.
     """
 
     with open(library_vdf_path, "r", encoding="utf-8") as f:
@@ -111,7 +150,7 @@ def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
     else:
         raise ValueError(f'Unknown file format from "{library_vdf_path}"')
 
-    library_folders: list[LibraryFolder] = []
+    paths: list[str] = []
 
     for key, value in info_folders.items():
         # only keys that are integer values contains library folder
@@ -121,12 +160,37 @@ def parse_library_info(library_vdf_path: Path) -> list[LibraryFolder]:
             continue
 
         if isinstance(value, str):
-            path = value
+            paths.append(value)
         else:
-            path = value["path"]
+            paths.append(value["path"])
+
+    return paths
 
+
+def parse_library_info(
+    library_vdf_path: Path, cache: ManifestCache | None = None
+) -> list[LibraryFolder]:
+    """
+    Read library folders from the main library file.
+
+    Args:
+        library_vdf_path: The main library file (from the Steam installation
+            folder).
+        cache: Cache for the library file and the application manifests.
+
+    Returns:
+        A list of LibraryFolder, for each library found.
+    """
+    if cache is None:
+        paths = parse_library_paths(library_vdf_path)
+    else:
+        paths = cache.parse(library_vdf_path, parse_library_paths)
+
+    library_folders: list[LibraryFolder] = []
+
+    for path in paths:
         try:
-            library_folders.append(LibraryFolder(Path(path)))
+            library_folders.append(LibraryFolder(Path(path), cache))
         except Exception as e:
             print(
                 'Failed to read steam library from "{}", {}'.format(path, repr(e)),
@@ -151,10 +215,13 @@ def find_steam_path() -> Path | None:
         return None
 
 
-def find_games() -> dict[str, Path]:
+def find_games(cache: ManifestCache | None = None) -> dict[str, Path]:
     """
     Find the list of Steam games installed.
 
+    Args:
+        cache: Cache for the library file and the application manifests.
+
     Returns:
         A mapping from Steam game ID to install locations for available
         Steam games.
@@ -166,8 +233,8 @@ def find_games() -> dict[str, Path]:
     library_vdf_path = steam_path.joinpath("steamapps", "libraryfolders.vdf")
 
     try:
-        library_folders = parse_library_info(library_vdf_path)
-        library_folders.append(LibraryFolder(steam_path))
+        library_folders = parse_library_info(library_vdf_path, cache)
+        library_folders.append(LibraryFolder(steam_path, cache))
     except FileNotFoundError:
         return {}
 
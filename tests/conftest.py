@@ -0,0 +1,23 @@
+# -*- encoding: utf-8 -*-
+
+import sys
+import types
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+
+def _register_package(name: str, path: Path):
+    module = types.ModuleType(name)
+    module.__path__ = [str(path)]
+    sys.modules.setdefault(name, module)
+
+
+# The tests import the modules that do not need MO2 the same way the type checkers
+# see them, from the root of the repository (e.g. basic_features.json_stream). The
+# plugin package and its basic_features sub-package import mobase in their __init__,
+# so they are registered without running it (the plugin package under the name of
+# its folder, as imported by pytest when collecting the root folder):
+sys.path.insert(0, str(ROOT))
+_register_package(ROOT.name, ROOT)
+_register_package("basic_features", ROOT.joinpath("basic_features"))
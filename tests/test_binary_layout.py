@@ -0,0 +1,92 @@
+# -*- encoding: utf-8 -*-
+
+import io
+import struct
+from pathlib import Path
+from typing import NamedTuple
+
+import pytest
+
+from basic_features.binary_layout import BinaryLayout, LayoutField, fixed_string
+
+
+class Header(NamedTuple):
+    name: str
+    version: int
+    position: tuple[float, float, float]
+    magic: bytes
+
+
+LAYOUT = BinaryLayout(
+    Header,
+    # Fields in any order, with gaps:
+    LayoutField("version", 4, "I"),
+    LayoutField("magic", 0, "4s"),
+    LayoutField("name", 16, "20s", fixed_string("utf-16")),
+    LayoutField("position", 40, "3f"),
+)
+
+DATA = (
+    b"HEAD"
+    + struct.pack("<I", 7)
+    + bytes(8)
+    + "Hero".encode("utf-16-le").ljust(20, b"\0")
+    + bytes(4)
+    + struct.pack("<3f", 1.0, 2.5, -4.0)
+)
+
+
+def test_unpack():
+    assert LAYOUT.size == 52
+    header = LAYOUT.unpack(DATA)
+    assert isinstance(header, Header)
+    assert header == Header("Hero", 7, (1.0, 2.5, -4.0), b"HEAD")
+    assert LAYOUT.unpack(b"xyz" + DATA, offset=3) == header
+
+
+def test_read(tmp_path: Path):
+    path = tmp_path.joinpath("save")
+    path.write_bytes(DATA + b"trailing data")
+    assert LAYOUT.read_file(path).name == "Hero"
+
+    file = io.BytesIO(b"xyz" + DATA + b"rest")
+    file.seek(3)
+    assert LAYOUT.read(file).version == 7
+    assert file.read() == b"rest"
+
+
+def test_short_reads():
+    # Unbuffered files can return less data than requested:
+    class File(io.BytesIO):
+        def read(self, size: int | None = -1) -> bytes:
+            return super().read(min(5, -1 if size is None else size))
+
+    assert LAYOUT.read(File(DATA)).position == (1.0, 2.5, -4.0)
+
+
+def test_truncated():
+    with pytest.raises(ValueError, match="Header needs 52 bytes, got 51"):
+        LAYOUT.unpack(DATA[:-1])
+    with pytest.raises(ValueError, match="got 0"):
+        LAYOUT.read(io.BytesIO(b""))
+    with pytest.raises(ValueError, match="got 0"):
+        LAYOUT.unpack(DATA, offset=100)
+
+
+def test_invalid_layouts():
+    class Record(NamedTuple):
+        a: int
+        b: int
+
+    with pytest.raises(ValueError, match="overlaps"):
+        BinaryLayout(Record, LayoutField("a", 0, "I"), LayoutField("b", 2, "H"))
+    with pytest.raises(ValueError, match="do not match"):
+        BinaryLayout(Record, LayoutField("a", 0, "I"), LayoutField("c", 4, "I"))
+    with pytest.raises(ValueError, match="do not match"):
+        BinaryLayout(Record, LayoutField("a", 0, "I"))
+
+
+def test_fixed_string():
+    assert fixed_string("utf-8")(b"abc\0def\0\0") == "abc"
+    assert fixed_string("utf-8")(b"full") == "full"
+    assert fixed_string("utf-16")("Name".encode("utf-16-le") + bytes(6)) == "Name"
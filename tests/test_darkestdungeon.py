@@ -0,0 +1,159 @@
+# -*- encoding: utf-8 -*-
+
+import io
+import struct
+from typing import Union
+
+import pytest
+
+from games.darkestdungeon import DarkestDungeonBinarySave
+
+# (name, value) of a field, None for objects (whose fields follow them):
+Field = tuple[str, Union[None, bool, int, float, str]]
+
+
+def field_hash(name: str) -> int:
+    value = 0
+    for char in name:
+        value = (value * 53 + ord(char)) & 0xFFFFFFFF
+    return value
+
+
+def build_save(fields: list[Field], padding: int = 0) -> bytes:
+    """
+    Build a binary save, following the layout read by the DarkestDungeonSaveEditor:
+    a 64-byte header, the Meta1 blocks (one per object), the Meta2 entries (one
+    per field) and the data, where each field is its null-terminated name followed
+    by its value, 4-byte values being aligned in the data.
+    """
+    data = bytearray()
+    meta2 = bytearray()
+    objects = 0
+    for name, value in fields:
+        offset = len(data)
+        encoded = name.encode("utf-8") + b"\0"
+        data += encoded
+        if isinstance(value, bool):
+            data += bytes([value])
+        elif isinstance(value, (int, float, str)):
+            data += bytes((4 - len(data) % 4) % 4)
+            if isinstance(value, int):
+                data += struct.pack("<i", value)
+            elif isinstance(value, float):
+                data += struct.pack("<f", value)
+            else:
+                string = value.encode("utf-8") + b"\0"
+                data += struct.pack("<i", len(string)) + string
+        info = len(encoded) << 2 | (value is None)
+        objects += value is None
+        meta2 += struct.pack("<III", field_hash(name), offset, info)
+
+    meta1 = bytes(16 * objects)
+    meta1_offset = 64
+    meta2_offset = meta1_offset + len(meta1)
+    data_offset = meta2_offset + len(meta2)
+    header = struct.pack(
+        "<4sII4xIII16xII4xII",
+        DarkestDungeonBinarySave.MAGIC,
+        0x5F,
+        64,
+        len(meta1),
+        objects,
+        meta1_offset,
+        len(fields),
+        meta2_offset,
+        len(data) + padding,
+        data_offset,
+    )
+    return header + meta1 + meta2 + data + bytes(padding)
+
+
+FIELDS: list[Field] = [
+    ("base_root", None),
+    ("version", 1655),
+    ("estatename", "Hamlet of Doom"),
+    ("in_raid", True),
+    ("gold", 12500),
+    ("light", 0.75),
+    ("roster", None),
+    # Same name in a nested object, and names with the same hash ("Aa", "B,"):
+    ("version", 3),
+    ("Aa", 1),
+    ("B,", 2),
+    ("empty", ""),
+]
+
+
+def read(content: bytes) -> DarkestDungeonBinarySave:
+    return DarkestDungeonBinarySave(io.BytesIO(content))
+
+
+def test_field_hash():
+    assert field_hash("Aa") == field_hash("B,")
+
+
+def test_fields():
+    save = read(build_save(FIELDS))
+    assert save.field("estatename", str) == "Hamlet of Doom"
+    assert save.field("version", int) == 1655
+    assert save.field("in_raid", bool) is True
+    assert save.field("gold", int) == 12500
+    assert save.field("light", float) == 0.75
+    assert save.field("Aa", int) == 1
+    assert save.field("B,", int) == 2
+    assert save.field("empty", str) == ""
+    assert save.field("estatename", bytes) == b"\0\x0f\0\0\0Hamlet of Doom\0"
+
+
+def test_missing_fields():
+    save = read(build_save(FIELDS))
+    assert save.field("missing", int) is None
+    # Objects do not have a value:
+    assert save.field("roster", bytes) is None
+
+
+@pytest.mark.parametrize("prefix", ["", "a", "ab", "abc"])
+def test_alignment(prefix: str):
+    # The names before a field shift its value, which is aligned in the data:
+    fields: list[Field] = [("root", None), (prefix, True), ("estatename", "Aligned")]
+    save = read(build_save(fields))
+    assert save.field("estatename", str) == "Aligned"
+
+
+def test_index_read_once():
+    # Fields are read after the index, one read each:
+    content = build_save(FIELDS, padding=100000)
+    reads: list[int] = []
+
+    class File(io.BytesIO):
+        def read(self, size: int | None = -1) -> bytes:
+            reads.append(-1 if size is None else size)
+            return super().read(size)
+
+    save = DarkestDungeonBinarySave(File(content))
+    assert len(reads) == 1
+    assert save.field("gold", int) == 12500
+    assert len(reads) == 2 and reads[1] < 100
+
+
+def test_large_index():
+    # The index does not fit in the first read:
+    fields: list[Field] = [("root", None)]
+    fields += [(f"field_{index}", index) for index in range(2000)]
+    save = read(build_save(fields))
+    assert save.field("field_1999", int) == 1999
+
+
+def test_invalid_saves():
+    with pytest.raises(ValueError, match="Not a binary save"):
+        read(b'{"data": {"estatename": "Json"}}')
+
+    content = build_save(FIELDS)
+    with pytest.raises(ValueError, match="Header Length"):
+        read(content[:8] + struct.pack("<I", 60) + content[12:])
+    with pytest.raises(ValueError, match="Truncated save"):
+        read(content[:100])
+
+    save = read(content[:-8])
+    with pytest.raises(ValueError, match="Truncated"):
+        save.field("empty", str)
@@ -0,0 +1,108 @@
+# -*- encoding: utf-8 -*-
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from basic_features.json_stream import read_json_keys
+
+DOCUMENT: dict[str, Any] = {
+    "Data": {
+        "metadata": {"name": 'Name with "quotes", [brackets] and {braces}'},
+        "skipped": [{"a": "]}", "b": [1, 2, {"c": "\\"}]}, 'tail \\"]'],
+    },
+    "array": [1, "two", None, True, 3.5e3],
+    "level": 12,
+    "gold": -3.25,
+    "name": "Ünïcödé ☃",
+    "last": {"nested": {"value": None}},
+}
+
+KEYS = [
+    ("Data", "metadata", "name"),
+    ("array",),
+    ("level",),
+    ("gold",),
+    ("name",),
+    ("last", "nested"),
+]
+
+
+def write(tmp_path: Path, text: str, encoding: str = "utf-8") -> Path:
+    path = tmp_path.joinpath("document.json")
+    path.write_text(text, encoding=encoding)
+    return path
+
+
+def expected(
+    document: dict[str, Any], keys: list[tuple[str, ...]]
+) -> dict[tuple[str, ...], Any]:
+    values: dict[tuple[str, ...], Any] = {}
+    for key in keys:
+        value: Any = document
+        for name in key:
+            value = value[name]
+        values[key] = value
+    return values
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 64, 65536])
+def test_chunk_sizes(tmp_path: Path, chunk_size: int):
+    for indent in (None, 2):
+        path = write(tmp_path, json.dumps(DOCUMENT, indent=indent))
+        values = read_json_keys(path, KEYS, chunk_size=chunk_size)
+        assert values == expected(DOCUMENT, KEYS)
+
+
+def test_missing_keys(tmp_path: Path):
+    path = write(tmp_path, json.dumps(DOCUMENT))
+    keys = [("missing",), ("gold", "sub"), ("Data", "missing"), ("level",)]
+    assert read_json_keys(path, keys) == {("level",): 12}
+    assert read_json_keys(path, []) == {}
+    assert read_json_keys(write(tmp_path, "{}"), [("level",)]) == {}
+
+
+def test_duplicate_keys(tmp_path: Path):
+    path = write(tmp_path, '{"a": 1, "b": {"c": 2}, "a": 3, "b": {"c": 4}, "d": 5}')
+    values = read_json_keys(path, [("a",), ("b", "c"), ("d",)], chunk_size=3)
+    assert values == {("a",): 1, ("b", "c"): 2, ("d",): 5}
+
+
+def test_stops_early(tmp_path: Path):
+    # The rest of the document is neither read nor validated:
+    path = write(tmp_path, '{"a": 1, "b": [' + "not json" * 1000)
+    assert read_json_keys(path, [("a",)], chunk_size=16) == {("a",): 1}
+
+
+def test_byte_order_mark(tmp_path: Path):
+    path = write(tmp_path, '{"a": "b"}', encoding="utf-8-sig")
+    assert read_json_keys(path, [("a",)]) == {("a",): "b"}
+
+
+def test_overlapping_keys(tmp_path: Path):
+    path = write(tmp_path, "{}")
+    with pytest.raises(ValueError):
+        read_json_keys(path, [("a",), ("a", "b")])
+    with pytest.raises(ValueError):
+        read_json_keys(path, [("a", "b"), ("a",)])
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "[]",
+        '{"a" 1}',
+        '{"a": 1 "b": 2}',
+        '{a: 1, "b": 2}',
+        '{"a": [1, 2',
+        '{"a": "unterminated',
+        '{"b": tru}',
+    ],
+)
+def test_invalid_documents(tmp_path: Path, text: str):
+    path = write(tmp_path, text)
+    with pytest.raises(json.JSONDecodeError):
+        read_json_keys(path, [("b",)], chunk_size=4)
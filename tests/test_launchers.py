@@ -0,0 +1,48 @@
+# -*- encoding: utf-8 -*-
+
+import ast
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).parent.parent
+
+# Launchers with a backend module, kept in sync with discovery_utils.LAUNCHERS (the
+# modules are parsed rather than imported, as they need winreg):
+LAUNCHERS = ("steam", "gog", "origin", "epic", "eadesktop")
+
+
+def test_launchers_are_in_sync():
+    tree = ast.parse(ROOT.joinpath("discovery_utils.py").read_text(encoding="utf-8"))
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "LAUNCHERS"
+            for target in node.targets
+        ):
+            assert ast.literal_eval(node.value) == LAUNCHERS
+            return
+    pytest.fail("LAUNCHERS not found in discovery_utils.py")
+
+
+@pytest.mark.parametrize("store", LAUNCHERS)
+def test_find_games_accepts_a_cache(store: str):
+    path = ROOT.joinpath(f"{store}_utils.py")
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    functions = [
+        node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef) and node.name == "find_games"
+    ]
+    assert len(functions) == 1, f"{path.name} must define find_games()"
+
+    # find_games(cache: ManifestCache | None = None), called with the cache as
+    # only positional argument by discovery_utils.launcher_finder():
+    arguments = functions[0].args
+    assert [argument.arg for argument in arguments.args] == ["cache"]
+    assert not arguments.posonlyargs and not arguments.kwonlyargs
+    assert arguments.vararg is None and arguments.kwarg is None
+    assert len(arguments.defaults) == 1
+    assert ast.literal_eval(arguments.defaults[0]) is None
+    annotation = arguments.args[0].annotation
+    assert annotation is not None
+    assert ast.unparse(annotation) == "ManifestCache | None"
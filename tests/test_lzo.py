@@ -0,0 +1,125 @@
+# -*- encoding: utf-8 -*-
+
+import hashlib
+from pathlib import Path
+
+import pytest
+
+from games.stalkeranomaly.XRLZO import LZO1XDecoder
+
+# The fixtures were compressed with lzokay 1.1.5 (lzokay.compress), from the data
+# built below:
+DATA = Path(__file__).parent.joinpath("data")
+
+
+def random_bytes(size: int, seed: int) -> bytes:
+    data = bytearray()
+    for _ in range(size):
+        seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+        data.append(seed >> 16 & 0xFF)
+    return bytes(data)
+
+
+def random_words(size: int, seed: int) -> bytes:
+    words = [
+        b"stalker",
+        b"zone",
+        b"anomaly",
+        b"artefact",
+        b"bandit",
+        b"duty",
+        b"freedom",
+        b"monolith",
+        b"\x00\x01\x02",
+        b"pripyat",
+    ]
+    data = bytearray()
+    while len(data) < size:
+        seed = (seed * 1103515245 + 12345) & 0x7FFFFFFF
+        data += words[(seed >> 16) % len(words)] + b" "
+    return bytes(data[:size])
+
+
+def mixed_data() -> bytes:
+    # Literals, short and long matches, runs, and matches more than 16kB away:
+    block = random_bytes(20000, 7)
+    return (
+        random_words(5000, 3)
+        + bytes(1000)
+        + block
+        + random_words(300, 5)
+        + block
+        + b"x" * 600
+        + random_bytes(40, 9)
+    )
+
+
+FIXTURES = {
+    "literals": (random_bytes(300, 1), "06d1e9d130f6703ff9c3827322dc70780abae46f"),
+    "text": (random_words(50000, 11), "0ce39a5040e5466e6ef00ae984ec64cb9891d339"),
+    "mixed": (mixed_data(), "aa8a6b6ab954d69babbf5937c3d1c293d2704cc7"),
+}
+
+
+def decompress(data: bytes, max_output: int, offset: int = 0) -> bytes:
+    decoder = LZO1XDecoder(data, max_output, offset)
+    decoder.decompress(max_output + 1)
+    assert decoder.finished
+    return bytes(decoder.output)
+
+
+def test_empty():
+    assert decompress(bytes.fromhex("11110000"), 0) == b""
+
+
+def test_short():
+    data = bytes.fromhex("1768656c6c6f202f1400110000")
+    assert decompress(data, 23) == b"hello hello hello hello"
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_fixture(name: str):
+    plain, sha1 = FIXTURES[name]
+    assert hashlib.sha1(plain).hexdigest() == sha1
+    data = DATA.joinpath(f"{name}.lzo").read_bytes()
+    assert decompress(data, len(plain)) == plain
+
+
+@pytest.mark.parametrize("name", FIXTURES)
+def test_incremental(name: str):
+    plain, _ = FIXTURES[name]
+    data = DATA.joinpath(f"{name}.lzo").read_bytes()
+    decoder = LZO1XDecoder(data, len(plain))
+    for size in (1, 100, len(plain) // 2):
+        assert decoder.decompress(size) >= size
+        assert not decoder.finished
+        assert decoder.output == plain[: len(decoder.output)]
+    assert decoder.decompress(len(plain) + 1) == len(plain)
+    assert decoder.finished
+    assert decoder.output == plain
+
+
+def test_offset():
+    plain, _ = FIXTURES["text"]
+    data = b"header" + DATA.joinpath("text.lzo").read_bytes()
+    assert decompress(data, len(plain), offset=6) == plain
+
+
+def test_max_output():
+    plain, _ = FIXTURES["text"]
+    data = DATA.joinpath("text.lzo").read_bytes()
+    with pytest.raises(ValueError, match="exceeds"):
+        decompress(data, len(plain) - 1)
+
+
+def test_truncated():
+    plain, _ = FIXTURES["mixed"]
+    data = DATA.joinpath("mixed.lzo").read_bytes()
+    with pytest.raises(ValueError, match="truncated"):
+        decompress(data[: len(data) // 2], len(plain))
+
+
+def test_match_before_start():
+    # A literal, then a 3-byte match 129 bytes back:
+    with pytest.raises(ValueError, match="before the start"):
+        decompress(bytes.fromhex("12414010110000"), 16)
@@ -0,0 +1,75 @@
+# -*- encoding: utf-8 -*-
+
+import os
+from pathlib import Path
+
+import pytest
+
+from discovery_utils import ManifestCache
+
+# Files parsed by the parsers below:
+calls: list[Path] = []
+
+
+def parse_content(path: Path) -> str:
+    calls.append(path)
+    return path.read_text()
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def manifest(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("manifests", "game.acf")
+    path.parent.mkdir()
+    path.write_text("first")
+    return path
+
+
+def test_parse_once(manifest: Path, tmp_path: Path):
+    path = tmp_path.joinpath("cache.json")
+    cache = ManifestCache(path)
+    assert cache.parse(manifest, parse_content) == "first"
+    assert cache.parse(manifest, parse_content) == "first"
+    cache.save()
+
+    # Entries are persisted until the file changes:
+    cache = ManifestCache(path)
+    cache.load()
+    assert cache.parse(manifest, parse_content) == "first"
+    assert calls == [manifest]
+
+    manifest.write_text("second")
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.parse(manifest, parse_content) == "second"
+    assert calls == [manifest, manifest]
+
+
+def test_read_errors_are_not_cached(manifest: Path, tmp_path: Path):
+    def parser(path: Path) -> str:
+        calls.append(path)
+        if len(calls) == 1:
+            raise PermissionError(f"{path.name} is locked")
+        return path.read_text()
+
+    cache = ManifestCache(tmp_path.joinpath("cache.json"))
+    with pytest.raises(PermissionError):
+        cache.parse(manifest, parser)
+    assert cache.parse(manifest, parser) == "first"
+    assert cache.parse(manifest, parser) == "first"
+    assert calls == [manifest, manifest]
+
+
+def test_glob(manifest: Path, tmp_path: Path):
+    manifest.with_name("other.acf").write_text("")
+    manifest.with_name("other.txt").write_text("")
+    cache = ManifestCache(tmp_path.joinpath("cache.json"))
+    assert sorted(path.name for path in cache.glob(manifest.parent, "*.acf")) == [
+        "game.acf",
+        "other.acf",
+    ]
+    assert cache.glob(tmp_path.joinpath("missing"), "*.acf") == []
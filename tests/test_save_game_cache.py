@@ -0,0 +1,170 @@
+# -*- encoding: utf-8 -*-
+
+import os
+from pathlib import Path
+
+import pytest
+
+from basic_features.basic_save_game_cache import SaveGameCache
+
+# Files parsed by the parsers below:
+calls: list[Path] = []
+
+
+def parse_content(path: Path) -> dict[str, str]:
+    calls.append(path)
+    return {"content": path.read_text()}
+
+
+def parse_name(path: Path) -> dict[str, str]:
+    calls.append(path)
+    return {"name": path.name}
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+
+
+@pytest.fixture
+def save(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("saves", "quick.sav")
+    path.parent.mkdir()
+    path.write_text("first")
+    return path
+
+
+@pytest.fixture
+def database(tmp_path: Path) -> Path:
+    return tmp_path.joinpath("cache", "saves.sqlite")
+
+
+def test_parse_once(save: Path, database: Path):
+    cache = SaveGameCache(database, "game")
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert calls == [save]
+
+    # Entries are persisted:
+    assert SaveGameCache(database, "game").get(save, parse_content) == {
+        "content": "first"
+    }
+    assert calls == [save]
+
+
+def test_parse_modified_file(save: Path, database: Path):
+    cache = SaveGameCache(database, "game")
+    cache.get(save, parse_content)
+
+    save.write_text("second")
+    stat = save.stat()
+    os.utime(save, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(save, parse_content) == {"content": "second"}
+    assert calls == [save, save]
+
+
+def test_stat_is_part_of_the_key(save: Path, database: Path):
+    cache = SaveGameCache(database, "game")
+    cache.get(save, parse_content)
+
+    # A stat given by the caller is used as is, e.g. from a directory listing:
+    stat = save.stat()
+    os.utime(save, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert cache.get(save, parse_content, stat) == {"content": "first"}
+    assert len(calls) == 1
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert len(calls) == 2
+
+
+def test_failures_are_cached(save: Path, database: Path):
+    def parser(path: Path) -> dict[str, str]:
+        calls.append(path)
+        raise ValueError(f"invalid save {path.name}")
+
+    cache = SaveGameCache(database, "game")
+    assert cache.get(save, parser) is None
+    assert cache.get(save, parser) is None
+    assert calls == [save]
+
+
+@pytest.mark.parametrize("error", [OSError, PermissionError, RuntimeError])
+def test_transient_failures_are_not_cached(
+    save: Path, database: Path, error: type[Exception]
+):
+    def parser(path: Path) -> dict[str, str]:
+        calls.append(path)
+        if len(calls) == 1:
+            raise error(f"cannot read {path.name}")
+        return {"content": path.read_text()}
+
+    cache = SaveGameCache(database, "game")
+    assert cache.get(save, parser) is None
+    assert cache.get(save, parser) == {"content": "first"}
+    assert cache.get(save, parser) == {"content": "first"}
+    assert calls == [save, save]
+
+
+def test_missing_file(tmp_path: Path, database: Path):
+    cache = SaveGameCache(database, "game")
+    assert cache.get(tmp_path.joinpath("missing.sav"), parse_content) is None
+    assert calls == []
+
+
+def test_values_go_through_json(save: Path, database: Path):
+    def parser(path: Path) -> tuple[str, int]:
+        return (path.name, 3)
+
+    cache = SaveGameCache(database, "game")
+    assert cache.get(save, parser) == ("quick.sav", 3)
+
+    # Tuples are read back from the database as lists:
+    assert SaveGameCache(database, "game").get(save, parser) == ["quick.sav", 3]
+
+
+def test_keys(save: Path, database: Path):
+    cache = SaveGameCache(database, "game")
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert cache.get(save, parse_name) == {"name": "quick.sav"}
+    assert SaveGameCache(database, "other").get(save, parse_content) is not None
+
+    # Entries are per namespace and parser:
+    assert calls == [save, save, save]
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert cache.get(save, parse_name) == {"name": "quick.sav"}
+    assert len(calls) == 3
+
+
+def test_prune(save: Path, database: Path):
+    other = save.with_name("other.sav")
+    other.write_text("other")
+
+    cache = SaveGameCache(database, "game")
+    cache.get(save, parse_content)
+    cache.get(other, parse_content)
+    SaveGameCache(database, "another").get(other, parse_content)
+
+    cache.prune([save])
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert len(calls) == 3
+    assert cache.get(other, parse_content) == {"content": "other"}
+    assert len(calls) == 4
+
+    # Entries of other namespaces are kept:
+    SaveGameCache(database, "another").get(other, parse_content)
+    assert len(calls) == 4
+
+
+def test_unusable_database(save: Path, tmp_path: Path):
+    cache = SaveGameCache(tmp_path, "game")
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert calls == [save, save]
+
+
+def test_uncreatable_folder(save: Path, tmp_path: Path):
+    folder = tmp_path.joinpath("file")
+    folder.write_text("")
+    cache = SaveGameCache(folder.joinpath("cache", "saves.sqlite"), "game")
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert cache.get(save, parse_content) == {"content": "first"}
+    assert calls == [save, save]
@@ -0,0 +1,68 @@
+# -*- encoding: utf-8 -*-
+
+import os
+from pathlib import Path
+
+from PyQt6.QtGui import QColor, QImage
+
+from basic_features.basic_thumbnail_cache import ThumbnailCache
+
+
+def make_image(path: Path, width: int = 400) -> Path:
+    image = QImage(width, width // 2, QImage.Format.Format_RGB32)
+    image.fill(QColor(200, 100, 0))
+    assert image.save(str(path), "PNG")
+    return path
+
+
+def thumbnails(directory: Path) -> list[str]:
+    return sorted(path.suffix for path in directory.iterdir())
+
+
+def test_disk_cache(tmp_path: Path):
+    source = make_image(tmp_path.joinpath("save.png"))
+    directory = tmp_path.joinpath("thumbnails")
+
+    thumbnail = ThumbnailCache(directory).get(source, 100)
+    assert thumbnail is not None and thumbnail.width() == 100
+    assert thumbnails(directory) == [".png"]
+
+    # Another cache (e.g. after a restart) reads the thumbnail from the disk, the
+    # source itself being unreadable now (but with the same modification time):
+    mtime = source.stat().st_mtime_ns
+    source.write_bytes(b"")
+    os.utime(source, ns=(mtime, mtime))
+    thumbnail = ThumbnailCache(directory).get(source, 100)
+    assert thumbnail is not None and thumbnail.width() == 100
+
+
+def test_disk_budget(tmp_path: Path):
+    directory = tmp_path.joinpath("thumbnails")
+    directory.mkdir()
+    sources = [make_image(tmp_path.joinpath(f"save{i}.png")) for i in range(4)]
+
+    # A temporary file left by a crash, older than the thumbnails:
+    directory.joinpath("left.1234.tmp").write_bytes(bytes(100))
+    os.utime(directory.joinpath("left.1234.tmp"), ns=(0, 0))
+
+    ThumbnailCache(tmp_path.joinpath("sizes")).get(sources[0], 100)
+    size = next(tmp_path.joinpath("sizes").glob("*.png")).stat().st_size
+
+    # Only the most recently used thumbnails fit:
+    cache = ThumbnailCache(directory, disk_budget=2 * size + size // 2)
+    for source in sources:
+        cache.get(source, 100)
+    assert thumbnails(directory) == [".png", ".png"]
+    cache = ThumbnailCache(directory)
+    assert cache.get(sources[3], 100) is not None
+    assert thumbnails(directory) == [".png", ".png"]
+
+
+def test_failed_store(tmp_path: Path):
+    source = make_image(tmp_path.joinpath("save.png"))
+    # The thumbnail folder cannot be created, so the thumbnail is only in memory:
+    directory = tmp_path.joinpath("file")
+    directory.write_bytes(b"")
+    cache = ThumbnailCache(directory.joinpath("thumbnails"))
+    assert cache.get(source, 100) is not None
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["file", "save.png"]
@@ -0,0 +1,38 @@
+# -*- encoding: utf-8 -*-
+
+from variables_utils import VariableExpander
+
+
+def test_cached_variables():
+    calls: list[str] = []
+
+    def resolve(value: str) -> str:
+        calls.append(value)
+        return value
+
+    parent = VariableExpander(fallback=lambda name: f"<{name}>")
+    parent.register("ROOT", lambda: resolve("C:/root"))
+    variables = VariableExpander(parent=parent)
+    variables.register("GAME", lambda: resolve("%ROOT%/game"))
+
+    assert variables.expand("%game%/%Root%/%OTHER%") == "%ROOT%/game/C:/root/<OTHER>"
+    assert variables.expand("%GAME% %ROOT%") == "%ROOT%/game C:/root"
+    assert calls == ["%ROOT%/game", "C:/root"]
+
+    variables.invalidate("game")
+    assert variables.resolve("GAME") == "%ROOT%/game"
+    assert len(calls) == 3
+
+
+def test_uncached_variables():
+    values = iter(["", "C:/documents"])
+    variables = VariableExpander()
+    variables.register("DOCUMENTS", lambda: next(values), cache=False)
+    assert variables.expand("%DOCUMENTS%/saves") == "/saves"
+    assert variables.expand("%DOCUMENTS%/saves") == "C:/documents/saves"
+
+    # Registering the variable again makes it cached:
+    values = iter(["D:/documents", "E:/documents"])
+    variables.register("DOCUMENTS", lambda: next(values))
+    assert variables.resolve("DOCUMENTS") == "D:/documents"
+    assert variables.resolve("DOCUMENTS") == "D:/documents"
@@ -0,0 +1,148 @@
+# -*- encoding: utf-8 -*-
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Callable
+
+# A variable reference, e.g. %LOCALAPPDATA% or %ProgramFiles(x86)%:
+_VARIABLE_PATTERN = re.compile(r"%([\w()-]+)%")
+
+
+class VariableExpander:
+    """
+    Expand %VARIABLE% references in a single pass.
+
+    Variables are resolved on first use and the resolved values are kept until
+    invalidated. Variable names are case-insensitive. Unknown variables are left
+    untouched, like os.path.expandvars does. Expanders can be chained: a variable
+    that is not registered is looked up in the parent expander, and then through the
+    fallback function.
+    """
+
+    def __init__(
+        self,
+        parent: VariableExpander | None = None,
+        fallback: Callable[[str], str | None] | None = None,
+    ):
+        """
+        Args:
+            parent: Expander used for the variables that are not registered.
+            fallback: Function resolving the variables not found in the expander or
+                its parent, e.g. from the environment.
+        """
+        self._parent = parent
+        self._fallback = fallback
+        self._resolvers: dict[str, Callable[[], str | None]] = {}
+        self._values: dict[str, str | None] = {}
+        self._uncached: set[str] = set()
+
+    def register(
+        self, name: str, resolver: Callable[[], str | None], cache: bool = True
+    ):
+        """
+        Register a variable, replacing any existing variable with the same name.
+
+        Args:
+            name: Name of the variable, without the surrounding %.
+            resolver: Function resolving the value of the variable, or returning None
+                if the variable cannot be resolved.
+            cache (optional): If False, the variable is resolved on each use, e.g.
+                when the resolver has its own cache.
+        """
+        key = name.upper()
+        self._resolvers[key] = resolver
+        self._values.pop(key, None)
+        if cache:
+            self._uncached.discard(key)
+        else:
+            self._uncached.add(key)
+
+    def invalidate(self, *names: str):
+        """
+        Drop the resolved values of the given variables, or of all the variables
+        if no name is given. Values resolved by the parent are not affected.
+
+        Args:
+            names: Names of the variables to invalidate.
+        """
+        if names:
+            for name in names:
+                self._values.pop(name.upper(), None)
+        else:
+            self._values.clear()
+
+    def resolve(self, name: str) -> str | None:
+        """
+        Resolve a variable.
+
+        Args:
+            name: Name of the variable, without the surrounding %.
+
+        Returns:
+            The value of the variable, or None if the variable is unknown.
+        """
+        key = name.upper()
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        if key not in self._resolvers and self._parent is not None:
+            value = self._parent.resolve(name)
+            if value is not None:
+                return value
+
+        if key in self._resolvers:
+            value = self._resolvers[key]()
+        elif self._fallback is not None:
+            value = self._fallback(name)
+        else:
+            return None
+
+        if key not in self._uncached:
+            self._values[key] = value
+        return value
+
+    def expand(self, value: str) -> str:
+        """
+        Replace the variable references in the given value.
+
+        Args:
+            value: The value to expand.
+
+        Returns:
+            The expanded value.
+        """
+        if "%" not in value:
+            return value
+        return _VARIABLE_PATTERN.sub(self._substitute, value)
+
+    def _substitute(self, match: re.Match[str]) -> str:
+        value = self.resolve(match.group(1))
+        return match.group(0) if value is None else value
+
+
+def _environment_variable(name: str) -> str | None:
+    # Environment variables are case-insensitive on Windows only:
+    return os.environ.get(name, os.environ.get(name.upper()))
+
+
+# Expander for the environment variables (%APPDATA%, %LOCALAPPDATA%, %PROGRAMDATA%,
+# ...), each variable being read once:
+ENVIRONMENT = VariableExpander(fallback=_environment_variable)
+
+
+def expand_environment(value: str) -> str:
+    """
+    Replace the environment variable references in the given value, replacement
+    for os.path.expandvars using the cached variables of ENVIRONMENT.
+
+    Args:
+        value: The value to expand.
+
+    Returns:
+        The expanded value.
+    """
+    return ENVIRONMENT.expand(value)